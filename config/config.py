@@ -20,6 +20,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 DATA_DIR = BASE_DIR / "data"
 STUDENTS_DB = DATA_DIR / "students.xlsx"
 TUTORS_DB = DATA_DIR / "tutors.xlsx"
+SQLITE_DB = DATA_DIR / "vocabolarium.db"
 
 # Assets paths
 ASSETS_DIR = BASE_DIR / "assets"
@@ -298,6 +299,55 @@ GOOGLE_MEET_CODE_LENGTH = 10
 
 # ==================== DATABASE CONFIGURATION ====================
 
+# Storage backend used by DatabaseManager: "sqlite" (default) or "excel"
+# With SQLite the Excel workbooks are only used for import/export
+DATABASE_BACKEND = os.getenv("DATABASE_BACKEND", "sqlite")
+
+# Excel backend write journal: row writes are appended to a journal and folded
+# into the workbook once it grows past this size or its oldest entry gets this old
+JOURNAL_COMPACT_BYTES = 256 * 1024
+JOURNAL_COMPACT_SECONDS = 300
+
+# Columnar (Parquet) snapshots used as the fast-load path, requires pyarrow
+SNAPSHOTS_ENABLED = os.getenv("SNAPSHOTS_ENABLED", "1") == "1"
+
+# Rows read per chunk by the streaming bulk import of student registrations
+BULK_IMPORT_CHUNK_SIZE = 1000
+
+# Rows per page of paginated student listings
+PAGE_SIZE = 25
+
+# Change log of every write, used for point-in-time ("as of") reads: a full
+# checkpoint of a table is taken whenever its log grows by this many bytes
+CHANGELOG_CHECKPOINT_BYTES = 512 * 1024
+
+# Soft deletes: deleted rows are kept as tombstones (hidden from every read,
+# restorable) for this long before compaction/vacuum removes them from storage
+TOMBSTONE_RETENTION_SECONDS = 7 * 24 * 3600
+
+# Expired tombstones are vacuumed when a DatabaseManager is created at most
+# once per this interval (the Excel backend also drops them when compacting)
+VACUUM_INTERVAL_SECONDS = 24 * 3600
+
+# Change events of committed writes are always published in-process; with this
+# on they are also appended to a durable tail file (events.jsonl) other processes can follow
+EVENT_TAIL_ENABLED = os.getenv("EVENT_TAIL_ENABLED", "0") == "1"
+
+# Incremental backups: stored files are split into chunks of this size, and
+# each distinct chunk is kept once, compressed. Backups older than the newest
+# are kept while they are the latest of one of the last N hours/days/weeks
+BACKUP_CHUNK_SIZE = 64 * 1024
+BACKUP_RETENTION: Dict[str, int] = {
+    "hourly": 24,
+    "daily": 7,
+    "weekly": 4,
+}
+
+# Advisory file locks held by writers: give up after the timeout and log
+# a warning when a writer waits longer than the warning threshold
+LOCK_TIMEOUT_SECONDS = 30
+LOCK_WARN_SECONDS = 0.5
+
 # Database column definitions for reference
 STUDENTS_COLUMNS: List[str] = [
     "Registration_ID",
@@ -315,7 +365,9 @@ STUDENTS_COLUMNS: List[str] = [
     "Google_Meet_Link",
     "Payment_Status",
     "Payment_Date",
-    "Notes"
+    "Notes",
+    "Row_Version",
+    "Deleted_At"
 ]
 
 TUTORS_COLUMNS: List[str] = [
@@ -329,7 +381,9 @@ TUTORS_COLUMNS: List[str] = [
     "Status",
     "Specialization",
     "Experience_Years",
-    "Rating"
+    "Rating",
+    "Row_Version",
+    "Deleted_At"
 ]
 
 
@@ -364,6 +418,8 @@ __all__ = [
     'DATA_DIR',
     'STUDENTS_DB',
     'TUTORS_DB',
+    'SQLITE_DB',
+    'DATABASE_BACKEND',
     'MODULE_PDF',
     'EMAIL_CONFIG',
     'ADMIN_USERNAME',
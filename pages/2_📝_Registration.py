@@ -6,8 +6,7 @@ import re
 # Add parent directory to path
 sys.path.append(str(Path(__file__).resolve().parent.parent))
 from config.config import LANGUAGES, SESSION_INTERVALS, PAYMENT_OPTIONS
-from utils.database import DatabaseManager
-from utils.email_service import EmailService
+from utils.resources import get_database, get_email_service
 
 # Page configuration
 st.set_page_config(
@@ -16,9 +15,9 @@ st.set_page_config(
     layout="centered"
 )
 
-# Initialize services
-db = DatabaseManager()
-email_service = EmailService()
+# Shared services (built once per server process)
+db = get_database()
+email_service = get_email_service()
 
 # Custom CSS
 st.markdown("""
@@ -6,7 +6,7 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.append(str(Path(__file__).resolve().parent.parent))
 from config.config import ADMIN_USERNAME, ADMIN_PASSWORD, DEFAULT_TUTOR_PASSWORD
-from utils.database import DatabaseManager
+from utils.resources import get_database
 
 # Page configuration
 st.set_page_config(
@@ -15,8 +15,8 @@ st.set_page_config(
     layout="centered"
 )
 
-# Initialize database
-db = DatabaseManager()
+# Shared database (built once per server process)
+db = get_database()
 
 # Custom CSS
 st.markdown("""
@@ -2,11 +2,13 @@ import streamlit as st
 import sys
 from pathlib import Path
 import pandas as pd
+from datetime import datetime, timedelta
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).resolve().parent.parent))
-from utils.database import DatabaseManager
-from utils.email_service import EmailService
+from utils.resources import get_database, get_email_service, reset_resources
+from utils.schema import format_bytes
+from config.config import PAGE_SIZE, TOMBSTONE_RETENTION_SECONDS
 
 # Page configuration
 st.set_page_config(
@@ -15,9 +17,9 @@ st.set_page_config(
     layout="wide"
 )
 
-# Initialize services
-db = DatabaseManager()
-email_service = EmailService()
+# Shared services (built once per server process)
+db = get_database()
+email_service = get_email_service()
 
 # Check authentication
 if 'authenticated' not in st.session_state or not st.session_state.authenticated:
@@ -87,8 +89,8 @@ with col3:
         st.session_state.user_name = None
         st.switch_page("pages/1_🏠_Home.py")
 
-# Statistics Dashboard
-students_df = db.get_all_students()
+# Statistics Dashboard (maintained counts, no row data needed)
+stats = db.get_statistics()
 tutors_df = db.get_all_tutors()
 
 st.subheader("📊 Overview Statistics")
@@ -98,25 +100,23 @@ stat_cols = st.columns(4)
 with stat_cols[0]:
     st.markdown(f"""
     <div class="stats-card">
-        <div class="stats-number">{len(students_df)}</div>
+        <div class="stats-number">{stats.get('total_students', 0)}</div>
         <div class="stats-label">Total Students</div>
     </div>
     """, unsafe_allow_html=True)
 
 with stat_cols[1]:
-    pending = len(students_df[students_df['Status'] == 'Pending']) if len(students_df) > 0 else 0
     st.markdown(f"""
     <div class="stats-card" style="border-left-color: #ffc107;">
-        <div class="stats-number" style="color: #ffc107;">{pending}</div>
+        <div class="stats-number" style="color: #ffc107;">{stats.get('pending_students', 0)}</div>
         <div class="stats-label">Pending Approvals</div>
     </div>
     """, unsafe_allow_html=True)
 
 with stat_cols[2]:
-    approved = len(students_df[students_df['Status'] == 'Approved']) if len(students_df) > 0 else 0
     st.markdown(f"""
     <div class="stats-card" style="border-left-color: #28a745;">
-        <div class="stats-number" style="color: #28a745;">{approved}</div>
+        <div class="stats-number" style="color: #28a745;">{stats.get('approved_students', 0)}</div>
         <div class="stats-label">Approved Students</div>
     </div>
     """, unsafe_allow_html=True)
@@ -124,11 +124,34 @@ with stat_cols[2]:
 with stat_cols[3]:
     st.markdown(f"""
     <div class="stats-card" style="border-left-color: #17a2b8;">
-        <div class="stats-number" style="color: #17a2b8;">{len(tutors_df)}</div>
+        <div class="stats-number" style="color: #17a2b8;">{stats.get('active_tutors', 0)}</div>
         <div class="stats-label">Active Tutors</div>
     </div>
     """, unsafe_allow_html=True)
 
+# Registration trends (served from the maintained rollups)
+with st.expander("📈 Registration Trends"):
+    trend_cols = st.columns(2)
+    with trend_cols[0]:
+        trend_period = st.selectbox("Per", options=["day", "week", "month"], key="trend_period")
+    with trend_cols[1]:
+        trend_by = st.selectbox("Break down by", options=["Total", "Language", "Payment_Option", "Status"],
+                                key="trend_by")
+    
+    # Last 30 days, 12 weeks or 12 months
+    trend_span = {"day": timedelta(days=29), "week": timedelta(weeks=11), "month": timedelta(days=335)}
+    trend_df = db.get_registration_counts(
+        datetime.now() - trend_span[trend_period],
+        datetime.now(),
+        period=trend_period,
+        by=None if trend_by == "Total" else trend_by
+    )
+    
+    if len(trend_df.columns) > 0 and trend_df.values.sum() > 0:
+        st.bar_chart(trend_df)
+    else:
+        st.info("No registrations in this period")
+
 st.markdown("<br><br>", unsafe_allow_html=True)
 
 # Tabs for different sections
@@ -138,7 +161,7 @@ tab1, tab2, tab3 = st.tabs(["👨‍🎓 Student Management", "👨‍🏫 Tutor
 with tab1:
     st.subheader("👨‍🎓 Student Database")
     
-    if len(students_df) > 0:
+    if stats.get('total_students', 0) > 0:
         # Filter options
         col1, col2, col3 = st.columns(3)
         
@@ -152,18 +175,27 @@ with tab1:
         with col2:
             language_filter = st.selectbox(
                 "Filter by Language",
-                options=["All"] + list(students_df['Language'].unique()),
+                options=["All"] + list(stats.get('languages_distribution', {})),
                 key="language_filter"
             )
         
         # Apply filters
-        filtered_df = students_df.copy()
+        status_value = None if status_filter == "All" else status_filter
+        language_value = None if language_filter == "All" else language_filter
+        total_filtered = db.count_students(status=status_value, language=language_value)
+        total_pages = max(1, -(-total_filtered // PAGE_SIZE))
         
-        if status_filter != "All":
-            filtered_df = filtered_df[filtered_df['Status'] == status_filter]
+        with col3:
+            page = st.number_input("Page", min_value=1, max_value=total_pages, value=1,
+                                   key=f"student_page_{status_filter}_{language_filter}")
         
-        if language_filter != "All":
-            filtered_df = filtered_df[filtered_df['Language'] == language_filter]
+        # Only the current page is loaded and sent to the browser
+        filtered_df = db.query_students(
+            status=status_value,
+            language=language_value,
+            limit=PAGE_SIZE,
+            offset=(page - 1) * PAGE_SIZE
+        )
         
         # Display filtered data
         st.dataframe(
@@ -171,6 +203,48 @@ with tab1:
             use_container_width=True,
             hide_index=True
         )
+        first_row = (page - 1) * PAGE_SIZE + 1 if total_filtered else 0
+        st.caption(f"Showing {first_row}-{(page - 1) * PAGE_SIZE + len(filtered_df)} of {total_filtered} "
+                   f"students (page {page} of {total_pages})")
+        
+        # Bulk status update of students on this page, or of all filtered students
+        # (their IDs are only read when the update is applied)
+        with st.expander("🔁 Bulk Status Update"):
+            bulk_all = st.checkbox(f"All {total_filtered} filtered students", key="bulk_all")
+            bulk_ids = st.multiselect(
+                "Students on this page",
+                options=filtered_df['Registration_ID'].tolist(),
+                disabled=bulk_all,
+                key=f"bulk_students_{status_filter}_{language_filter}_{page}"
+            )
+            bulk_cols = st.columns([2, 1])
+            with bulk_cols[0]:
+                bulk_status = st.selectbox(
+                    "New Status",
+                    options=["Pending", "Approved", "Rejected"],
+                    key="bulk_status"
+                )
+            with bulk_cols[1]:
+                st.markdown("<br>", unsafe_allow_html=True)
+                apply_bulk = st.button("Apply", use_container_width=True, key="bulk_apply")
+            
+            if apply_bulk and bulk_all:
+                bulk_ids = db.query_students(
+                    status=status_value,
+                    language=language_value,
+                    columns=['Registration_ID']
+                )['Registration_ID'].tolist()
+            
+            if apply_bulk and bulk_ids:
+                results = db.update_students_bulk({reg_id: {"Status": bulk_status} for reg_id in bulk_ids})
+                failed = {reg_id: msg for reg_id, (success, msg) in results.items() if not success}
+                
+                if failed:
+                    st.error(f"❌ {len(failed)} of {len(results)} updates failed: " +
+                             ", ".join(f"{reg_id} ({msg})" for reg_id, msg in failed.items()))
+                else:
+                    st.success(f"✅ {len(results)} students set to {bulk_status}")
+                    st.rerun()
         
         st.markdown("<br>", unsafe_allow_html=True)
         
@@ -180,10 +254,12 @@ with tab1:
         action_cols = st.columns([2, 2, 1])
         
         with action_cols[0]:
+            # Picked from the page shown above (use the filters and pages to find others)
+            student_names = dict(zip(filtered_df['Registration_ID'], filtered_df['Name']))
             selected_student = st.selectbox(
-                "Select Student",
-                options=students_df['Registration_ID'].tolist(),
-                format_func=lambda x: f"{x} - {students_df[students_df['Registration_ID']==x]['Name'].values[0]}"
+                "Select Student (current page)",
+                options=list(student_names),
+                format_func=lambda x: f"{x} - {student_names[x]}"
             )
         
         with action_cols[1]:
@@ -195,8 +271,27 @@ with tab1:
         with action_cols[2]:
             execute_action = st.button("Execute", use_container_width=True, type="primary")
         
+        # The executed action stays open across reruns: submitting one of its
+        # forms reruns the page with the Execute button no longer pressed
         if execute_action and selected_student:
-            student_data = students_df[students_df['Registration_ID'] == selected_student].iloc[0]
+            st.session_state.admin_action = (selected_student, action)
+            st.session_state.pop("admin_shown_version", None)
+        
+        open_action = st.session_state.get("admin_action")
+        if open_action and open_action[0] != selected_student:
+            st.session_state.pop("admin_action", None)
+            open_action = None
+        
+        student_data = db.get_student_by_id(open_action[0]) if open_action else None
+        
+        if student_data is not None:
+            selected_student, action = open_action
+            
+            # Save against the version shown when the form was rendered (kept from
+            # the previous run, as in the Tutor Dashboard), so a change made by
+            # someone else meanwhile is reported as a conflict, not overwritten
+            shown_version = st.session_state.get("admin_shown_version", student_data.get('Row_Version'))
+            st.session_state.admin_shown_version = student_data.get('Row_Version')
             
             if action == "View Details":
                 st.markdown("### 📋 Student Details")
@@ -249,7 +344,8 @@ with tab1:
                                 "Google_Meet_Link": google_meet_link
                             }
                             
-                            success, msg = db.update_student(selected_student, update_data)
+                            success, msg = db.update_student(selected_student, update_data,
+                                                             expected_version=shown_version)
                             
                             if success:
                                 # Send approval email
@@ -259,6 +355,7 @@ with tab1:
                                     google_meet_link
                                 )
                                 
+                                st.session_state.pop("admin_action", None)
                                 if email_success:
                                     st.success("✅ Student approved and email sent successfully!")
                                     st.balloons()
@@ -288,11 +385,13 @@ with tab1:
                     
                     if reject_button:
                         update_data = {"Status": "Rejected"}
-                        success, msg = db.update_student(selected_student, update_data)
+                        success, msg = db.update_student(selected_student, update_data,
+                                                         expected_version=shown_version)
                         
                         if success:
                             # Send rejection email
                             email_service.send_rejection_email(student_data, rejection_reason)
+                            st.session_state.pop("admin_action", None)
                             st.success("✅ Student registration rejected!")
                             st.rerun()
                         else:
@@ -327,9 +426,11 @@ with tab1:
                             "Status": new_status
                         }
                         
-                        success, msg = db.update_student(selected_student, update_data)
+                        success, msg = db.update_student(selected_student, update_data,
+                                                         expected_version=shown_version)
                         
                         if success:
+                            st.session_state.pop("admin_action", None)
                             st.success("✅ Student information updated successfully!")
                             st.rerun()
                         else:
@@ -337,7 +438,8 @@ with tab1:
             
             elif action == "Delete":
                 st.markdown("### 🗑️ Delete Student Record")
-                st.warning("⚠️ This action cannot be undone!")
+                st.warning("⚠️ The record can be restored from Settings > Recently Deleted "
+                           f"for {TOMBSTONE_RETENTION_SECONDS // 86400} days, then it is removed for good!")
                 
                 confirm_delete = st.checkbox("I confirm I want to delete this student record")
                 
@@ -346,6 +448,7 @@ with tab1:
                         success, msg = db.delete_student(selected_student)
                         
                         if success:
+                            st.session_state.pop("admin_action", None)
                             st.success("✅ Student record deleted successfully!")
                             st.rerun()
                         else:
@@ -426,8 +529,8 @@ with tab3:
     
     with export_cols[0]:
         if st.button("📊 Export Students Data", use_container_width=True):
-            if len(students_df) > 0:
-                csv = students_df.to_csv(index=False)
+            if stats.get('total_students', 0) > 0:
+                csv = db.export_csv("students")
                 st.download_button(
                     label="⬇️ Download Students CSV",
                     data=csv,
@@ -440,7 +543,7 @@ with tab3:
     with export_cols[1]:
         if st.button("📊 Export Tutors Data", use_container_width=True):
             if len(tutors_df) > 0:
-                csv = tutors_df.to_csv(index=False)
+                csv = db.export_csv("tutors")
                 st.download_button(
                     label="⬇️ Download Tutors CSV",
                     data=csv,
@@ -473,17 +576,172 @@ with tab3:
     
     st.markdown("<br>", unsafe_allow_html=True)
     
+    # Recently deleted
+    st.markdown("### 🗑️ Recently Deleted")
+    st.caption(f"Deleted records can be restored for {TOMBSTONE_RETENTION_SECONDS // 86400} days "
+               "before they are removed for good.")
+    
+    deleted_table = st.selectbox("Table", options=["students", "tutors"], key="deleted_table")
+    deleted_df = db.get_deleted(deleted_table)
+    
+    if len(deleted_df) > 0:
+        st.dataframe(deleted_df, use_container_width=True, hide_index=True)
+        
+        key_column = "Registration_ID" if deleted_table == "students" else "Tutor_ID"
+        restore_cols = st.columns([3, 1])
+        
+        with restore_cols[0]:
+            restore_id = st.selectbox("Record to restore", options=deleted_df[key_column].tolist(), key="restore_id")
+        
+        with restore_cols[1]:
+            st.markdown("<br>", unsafe_allow_html=True)
+            if st.button("♻️ Restore", use_container_width=True):
+                restore = db.undelete_student if deleted_table == "students" else db.undelete_tutor
+                success, msg = restore(restore_id)
+                if success:
+                    st.success(f"✅ {msg}")
+                    st.rerun()
+                else:
+                    st.error(f"❌ {msg}")
+    else:
+        st.info("📭 No deleted records.")
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # As-of view
+    st.markdown("### 🕰️ History (As-Of View)")
+    st.caption("Read-only view of a table as it was at a past moment, rebuilt from the change log.")
+    
+    history_cols = st.columns(3)
+    
+    with history_cols[0]:
+        history_table = st.selectbox("Table", options=["students", "tutors"], key="history_table")
+    
+    history_start = db.get_history_start(history_table)
+    
+    with history_cols[1]:
+        history_date = st.date_input(
+            "Date",
+            value=datetime.now().date(),
+            min_value=history_start.date() if history_start else None,
+            max_value=datetime.now().date(),
+            key="history_date"
+        )
+    
+    with history_cols[2]:
+        history_time = st.time_input("Time", value=datetime.now().time().replace(second=0, microsecond=0),
+                                     key="history_time")
+    
+    if st.button("🕰️ Show As Of", use_container_width=True):
+        moment = datetime.combine(history_date, history_time)
+        if history_start is None or moment < history_start:
+            st.warning(f"No history before {history_start:%Y-%m-%d %H:%M:%S}" if history_start else "No history yet")
+        else:
+            history_df = db.get_table_as_of(history_table, moment)
+            st.caption(f"{len(history_df)} {history_table} as of {moment:%Y-%m-%d %H:%M}")
+            st.dataframe(history_df, use_container_width=True, hide_index=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # Backups
+    st.markdown("### 💾 Backups")
+    
+    backup_cols = st.columns(2)
+    
+    with backup_cols[0]:
+        if st.button("💾 Create Backup", use_container_width=True):
+            with st.spinner("Creating backup..."):
+                success, msg = db.backup_database()
+            if success:
+                st.success(f"✅ {msg}")
+            else:
+                st.error(f"❌ {msg}")
+    
+    with backup_cols[1]:
+        if st.button("🔍 Verify Backups", use_container_width=True):
+            with st.spinner("Verifying backups..."):
+                results = db.verify_backups()
+            damaged = {backup_id: problems for backup_id, problems in results.items() if problems}
+            if not results:
+                st.info("No backups yet")
+            elif damaged:
+                st.error(f"❌ {len(damaged)} of {len(results)} backups are damaged")
+                for backup_id, problems in damaged.items():
+                    st.write(f"**{backup_id}:** {'; '.join(problems)}")
+            else:
+                st.success(f"✅ All {len(results)} backups verified")
+    
+    backups = db.list_backups()
+    if backups:
+        st.dataframe(
+            pd.DataFrame([
+                {
+                    "Backup": manifest["id"],
+                    "Created": manifest["created_at"].replace("T", " "),
+                    "Files": len(manifest["files"]),
+                    "Size (bytes)": sum(entry["size"] for entry in manifest["files"].values()),
+                    "Written (bytes)": manifest["new_bytes"],
+                }
+                for manifest in backups
+            ]),
+            use_container_width=True,
+            hide_index=True
+        )
+        st.caption("Restore from the command line: python utils/backup.py restore <Backup>")
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    # Reset shared services
+    st.markdown("### 🔄 Reset Services")
+    st.caption("Rebuild the shared database and email services and reload all tables, "
+               "e.g. after replacing data files or changing the configuration.")
+    
+    if st.button("🔄 Reset Services"):
+        reset_resources()
+        st.rerun()
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
     # System Information
     st.markdown("### ℹ️ System Information")
     
     info_cols = st.columns(2)
     
     with info_cols[0]:
+        cache_stats = db.get_cache_stats()
         st.info(f"""
         **Database Status:** ✅ Connected  
-        **Students Database:** {len(students_df)} records  
-        **Tutors Database:** {len(tutors_df)} records
+        **Students Database:** {stats.get('total_students', 0)} records  
+        **Tutors Database:** {stats.get('total_tutors', 0)} records  
+        **Table Cache:** {cache_stats['hits']} hits / {cache_stats['misses']} misses ({cache_stats['hit_ratio']:.0%} hit ratio)
         """)
+        
+        lock_stats = db.get_lock_stats()
+        if lock_stats:
+            st.caption("Write lock contention (this server process)")
+            st.dataframe(
+                pd.DataFrame.from_dict(lock_stats, orient="index"),
+                use_container_width=True
+            )
+        
+        memory_stats = db.get_memory_stats()
+        if memory_stats:
+            st.caption("Cached table memory (as of each table's last load)")
+            st.dataframe(
+                pd.DataFrame([
+                    {
+                        "Table": table,
+                        "Rows": report["rows"],
+                        "Untyped": format_bytes(report["untyped_bytes"]),
+                        "Typed": format_bytes(report["typed_bytes"]),
+                        "Saved": format_bytes(report["saved_bytes"]) if report["saved_bytes"] >= 0
+                                 else f"-{format_bytes(-report['saved_bytes'])}",
+                    }
+                    for table, report in memory_stats.items()
+                ]),
+                use_container_width=True,
+                hide_index=True
+            )
     
     with info_cols[1]:
         st.info(f"""
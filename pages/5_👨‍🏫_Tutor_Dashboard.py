@@ -6,7 +6,8 @@ from datetime import datetime
 
 # Add parent directory to path
 sys.path.append(str(Path(__file__).resolve().parent.parent))
-from utils.database import DatabaseManager
+from utils.resources import get_database
+from config.config import PAGE_SIZE
 
 # Page configuration
 st.set_page_config(
@@ -15,8 +16,8 @@ st.set_page_config(
     layout="wide"
 )
 
-# Initialize database
-db = DatabaseManager()
+# Shared database (built once per server process)
+db = get_database()
 
 # Check authentication
 if 'authenticated' not in st.session_state or not st.session_state.authenticated:
@@ -107,8 +108,9 @@ with col3:
         st.session_state.user_name = None
         st.switch_page("pages/1_🏠_Home.py")
 
-# Get students assigned to this tutor
-my_students = db.get_students_by_tutor(tutor_name)
+# Count students assigned to this tutor (counted in storage, no rows loaded)
+total_students = db.count_students(tutor=tutor_name)
+active_students = db.count_students(tutor=tutor_name, status="Approved") if total_students > 0 else 0
 
 # Statistics Dashboard
 st.subheader("📊 My Statistics")
@@ -118,13 +120,12 @@ stat_cols = st.columns(4)
 with stat_cols[0]:
     st.markdown(f"""
     <div class="stats-card">
-        <div class="stats-number">{len(my_students)}</div>
+        <div class="stats-number">{total_students}</div>
         <div class="stats-label">Total Students</div>
     </div>
     """, unsafe_allow_html=True)
 
 with stat_cols[1]:
-    active_students = len(my_students[my_students['Status'] == 'Approved']) if len(my_students) > 0 else 0
     st.markdown(f"""
     <div class="stats-card" style="border-left-color: #28a745;">
         <div class="stats-number" style="color: #28a745;">{active_students}</div>
@@ -159,7 +160,7 @@ tab1, tab2, tab3 = st.tabs(["👥 My Students", "📅 Schedule Overview", "👤
 with tab1:
     st.subheader("👥 My Students")
     
-    if len(my_students) > 0:
+    if total_students > 0:
         # Filter by status
         status_filter = st.selectbox(
             "Filter by Status",
@@ -167,11 +168,21 @@ with tab1:
             key="student_status_filter"
         )
         
-        filtered_students = my_students.copy()
-        if status_filter != "All":
-            filtered_students = filtered_students[filtered_students['Status'] == status_filter]
+        status_value = None if status_filter == "All" else status_filter
         
-        st.markdown(f"**Showing {len(filtered_students)} student(s)**")
+        # Keyset paging: keep the cursor of every page shown so far
+        page_key = (tutor_name, status_filter)
+        if st.session_state.get("student_page_key") != page_key:
+            st.session_state.student_page_key = page_key
+            st.session_state.student_cursors = [None]
+        cursors = st.session_state.student_cursors
+        
+        filtered_students, next_cursor = db.get_students_after(
+            cursors[-1], PAGE_SIZE, tutor=tutor_name, status=status_value
+        )
+        total_filtered = db.count_students(tutor=tutor_name, status=status_value)
+        
+        st.markdown(f"**Showing {len(filtered_students)} of {total_filtered} student(s) (page {len(cursors)})**")
         
         # Display students as cards
         for idx, student in filtered_students.iterrows():
@@ -208,6 +219,12 @@ with tab1:
                 with st.expander(f"📝 Notes for {student['Name']}"):
                     current_notes = student.get('Notes', '')
                     
+                    # Save against the version shown on the previous run, so notes
+                    # edited from a stale copy don't overwrite newer changes
+                    version_key = f"notes_version_{student['Registration_ID']}"
+                    shown_version = st.session_state.get(version_key, student.get('Row_Version'))
+                    st.session_state[version_key] = student.get('Row_Version')
+                    
                     with st.form(f"notes_form_{student['Registration_ID']}"):
                         new_notes = st.text_area(
                             "Student Notes",
@@ -218,7 +235,8 @@ with tab1:
                         
                         if st.form_submit_button("💾 Save Notes"):
                             update_data = {"Notes": new_notes}
-                            success, msg = db.update_student(student['Registration_ID'], update_data)
+                            success, msg = db.update_student(student['Registration_ID'], update_data,
+                                                             expected_version=shown_version)
                             
                             if success:
                                 st.success("✅ Notes saved successfully!")
@@ -228,9 +246,21 @@ with tab1:
                 
                 st.markdown("<hr>", unsafe_allow_html=True)
         
+        # Page navigation
+        nav_cols = st.columns([1, 1, 3])
+        with nav_cols[0]:
+            if st.button("⬅️ Previous", use_container_width=True, disabled=len(cursors) == 1):
+                cursors.pop()
+                st.rerun()
+        with nav_cols[1]:
+            if st.button("Next ➡️", use_container_width=True, disabled=next_cursor is None):
+                cursors.append(next_cursor)
+                st.rerun()
+        
         # Summary table
         st.markdown("<br>", unsafe_allow_html=True)
         st.subheader("📊 Student Summary Table")
+        st.caption(f"Students on page {len(cursors)} ({total_filtered} in total)")
         
         summary_df = filtered_students[[
             'Registration_ID', 'Name', 'Email', 'Language', 
@@ -246,14 +276,16 @@ with tab1:
 with tab2:
     st.subheader("📅 My Class Schedule")
     
-    if len(my_students) > 0:
+    if total_students > 0:
         # Group by time slot
-        schedule_df = my_students[my_students['Status'].isin(['Approved', 'Active'])].copy()
+        schedule_df = db.query_students(
+            tutor=tutor_name,
+            status=['Approved', 'Active'],
+            columns=['Name', 'Email', 'Language', 'Scheduled_Time', 'Session_Interval', 'Google_Meet_Link'],
+            order_by='Scheduled_Time'
+        )
         
         if len(schedule_df) > 0:
-            # Sort by scheduled time
-            schedule_df = schedule_df.sort_values('Scheduled_Time')
-            
             # Display schedule by day
             st.markdown("### 🗓️ Weekly Schedule")
             
@@ -343,6 +375,10 @@ with tab3:
         # Update profile section
         st.markdown("### ✏️ Update Profile")
         
+        # Save against the version shown on the previous run (see the notes form)
+        shown_profile_version = st.session_state.get("profile_version", tutor_info.get('Row_Version'))
+        st.session_state.profile_version = tutor_info.get('Row_Version')
+        
         with st.form("update_profile_form"):
             update_cols = st.columns(2)
             
@@ -366,7 +402,8 @@ with tab3:
                     "Languages_Teaching": ", ".join(new_languages)
                 }
                 
-                success, msg = db.update_tutor(tutor_info['Tutor_ID'], update_data)
+                success, msg = db.update_tutor(tutor_info['Tutor_ID'], update_data,
+                                               expected_version=shown_profile_version)
                 
                 if success:
                     st.success("✅ Profile updated successfully!")
@@ -391,11 +428,10 @@ st.markdown("---")
 footer_cols = st.columns(4)
 
 with footer_cols[0]:
-    st.metric("Total Students", len(my_students))
+    st.metric("Total Students", total_students)
 
 with footer_cols[1]:
-    active = len(my_students[my_students['Status'] == 'Approved']) if len(my_students) > 0 else 0
-    st.metric("Active Classes", active)
+    st.metric("Active Classes", active_students)
 
 with footer_cols[2]:
     languages = len(tutor_info['Languages_Teaching'].split(", ")) if tutor_info is not None else 0
@@ -0,0 +1,299 @@
+"""
+Registration analytics for Vocabolarium
+Hourly and daily rollups of student registrations by language, payment option
+and status. Registration_Date is parsed once when the rollups are built from
+the table; after that they follow the change events of committed writes, are
+saved as JSON beside the tables and answer per hour/day/week/month range
+queries without grouping the raw rows.
+"""
+
+import copy
+import json
+import threading
+from datetime import date, datetime
+from pathlib import Path
+import sys
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from utils.events import Event, ADDED_EVENTS, DELETED_EVENTS, TABLE_REPLACED
+from utils.locking import atomic_write
+from utils.statistics import add_count
+
+
+# Rollups file kept beside the stored tables
+ANALYTICS_FILE = "analytics.json"
+
+# Student columns registrations are broken down by
+DIMENSIONS = ("Language", "Payment_Option", "Status")
+
+# Column holding the registration time, and its format
+DATE_COLUMN = "Registration_Date"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Bucket key format of each rollup
+ROLLUPS: Dict[str, str] = {
+    "hour": "%Y-%m-%d %H:00",
+    "day": "%Y-%m-%d",
+}
+
+# Period of each range query: rollup it is read from and pandas period frequency
+PERIODS: Dict[str, Tuple[str, str]] = {
+    "hour": ("hour", "h"),
+    "day": ("day", "D"),
+    "week": ("day", "W-SUN"),
+    "month": ("day", "M"),
+}
+
+
+def parse_date(value) -> Optional[datetime]:
+    """Parse a registration date (None if missing or malformed)"""
+    if isinstance(value, datetime):
+        return value
+    try:
+        return datetime.strptime(str(value), DATE_FORMAT)
+    except (TypeError, ValueError):
+        return None
+
+
+def range_end(end: Union[str, date, datetime]) -> pd.Timestamp:
+    """
+    Get the last moment counted by a range ending at `end`
+    A date without a time part ("YYYY-MM-DD" or a date) covers that whole day
+    """
+    timestamp = pd.Timestamp(end)
+    date_only = (isinstance(end, str) and len(end.strip()) <= len("YYYY-MM-DD")) or \
+        (isinstance(end, date) and not isinstance(end, datetime))
+    if date_only:
+        timestamp += pd.Timedelta(days=1) - pd.Timedelta(1, unit="ns")
+    return timestamp
+
+
+def build_rollups(df: pd.DataFrame) -> Dict[str, Dict]:
+    """
+    Aggregate registrations into hourly and daily buckets
+
+    Args:
+        df: Live student rows
+
+    Returns:
+        Rollup name -> bucket key -> {"total", column: {value: count}};
+        rows without a valid registration date are left out
+    """
+    dates = pd.to_datetime(df[DATE_COLUMN].astype(str), format=DATE_FORMAT, errors="coerce")
+    dated = df[dates.notna()]
+    dates = dates[dates.notna()]
+
+    rollups = {}
+    for rollup, key_format in ROLLUPS.items():
+        keys = dates.dt.strftime(key_format)
+        buckets = {key: {"total": int(count)} for key, count in keys.value_counts().items()}
+        for column in DIMENSIONS:
+            if column not in dated.columns:
+                continue
+            for (key, value), count in dated.groupby([keys, dated[column]], observed=True).size().items():
+                if count > 0:
+                    buckets[key].setdefault(column, {})[str(value)] = int(count)
+        rollups[rollup] = buckets
+    return rollups
+
+
+def query_rollups(rollups: Dict[str, Dict], start: Union[str, date, datetime], end: Union[str, date, datetime],
+                  period: str = "day", by: Optional[str] = None) -> pd.DataFrame:
+    """
+    Count registrations per period from rollups
+
+    Args:
+        rollups: Rollups made by build_rollups()
+        start: First moment counted (datetime, date or "YYYY-MM-DD[ HH:MM:SS]")
+        end: Last moment counted, inclusive at the rollup's granularity; a
+             date without a time counts that whole day (see range_end)
+        period: "hour", "day", "week" or "month"
+        by: Column to break counts down by (one of DIMENSIONS), or None for totals
+
+    Returns:
+        DataFrame indexed by the start of each period in the range (periods
+        without registrations included), with a Registrations column or one
+        column per value of `by`, most frequent first
+
+    Raises:
+        ValueError: If the period or column isn't supported
+    """
+    if period not in PERIODS:
+        raise ValueError(f"Unsupported period: {period}")
+    if by is not None and by not in DIMENSIONS:
+        raise ValueError(f"Unsupported breakdown: {by}")
+
+    rollup, freq = PERIODS[period]
+    start, end = pd.Timestamp(start), range_end(end)
+    first, last = start.strftime(ROLLUPS[rollup]), end.strftime(ROLLUPS[rollup])
+
+    rows = {
+        key: bucket.get(by, {}) if by is not None else {"Registrations": bucket["total"]}
+        for key, bucket in rollups[rollup].items() if first <= key <= last
+    }
+    frame = pd.DataFrame.from_dict(rows, orient="index").fillna(0)
+    if by is None and frame.empty:
+        frame = pd.DataFrame(columns=["Registrations"])
+    frame.index = pd.to_datetime(frame.index, format=ROLLUPS[rollup])
+
+    frame = frame.groupby(frame.index.to_period(freq).to_timestamp()).sum()
+    frame = frame.reindex(pd.period_range(start, end, freq=freq).to_timestamp(), fill_value=0)
+    frame = frame[frame.sum().sort_values(ascending=False, kind="stable").index]
+    return frame.astype(int)
+
+
+class RegistrationRollups:
+    """
+    Materialized registration rollups of the students table
+    Layout: {"signature", "hour": {...}, "day": {...}, "updated_at"}, see
+    build_rollups(). Like utils.statistics, the rollups are valid for the
+    storage signature they record and are rebuilt once when it doesn't match.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize rollups, reading the saved ones
+
+        Args:
+            path: JSON rollups file
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._state: Optional[Dict] = self._read()
+        self._dirty = False
+
+    def _read(self) -> Optional[Dict]:
+        """Read the saved rollups (None if missing or unreadable)"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def save(self) -> None:
+        """Write the rollups if they changed since the last save"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(self._state, ensure_ascii=False)
+            atomic_write(self.path, lambda tmp: tmp.write_text(data, encoding="utf-8"))
+            self._dirty = False
+
+    def get(self, signature: Tuple) -> Optional[Dict]:
+        """
+        Get the rollups if they match the stored students table
+
+        Args:
+            signature: Current storage signature of the table
+
+        Returns:
+            Copy of the rollups, or None if they must be rebuilt
+        """
+        with self._lock:
+            if self._state is None or self._state["signature"] != list(signature):
+                return None
+            return copy.deepcopy(self._state)
+
+    def rebuild(self, df: pd.DataFrame, signature: Tuple) -> Dict:
+        """
+        Rebuild the rollups from the live student rows
+
+        Args:
+            df: Live student rows
+            signature: Storage signature the rows were loaded at
+
+        Returns:
+            Copy of the new rollups
+        """
+        state = {"signature": list(signature), **build_rollups(df),
+                 "updated_at": datetime.now().strftime(DATE_FORMAT)}
+        with self._lock:
+            self._state = state
+            self._dirty = True
+            return copy.deepcopy(state)
+
+    def apply(self, events: List[Event], previous: Optional[Tuple], signature: Tuple,
+              registered: Callable[[str], Optional[str]]) -> None:
+        """
+        Update the rollups with the events of a committed write to the
+        students table, in O(1) per event
+        Rollups that can't be updated from an event (replaced table, unknown
+        previous values or registration date) or that weren't built at the
+        table as stored right before the write are dropped and rebuilt on the
+        next read
+
+        Args:
+            events: Change events of the write (events of other tables are ignored)
+            previous: Storage signature of the students table right before the write
+            signature: Storage signature of the students table after the write
+            registered: Gets the registration date of a row by key; only called
+                        for updates changing a rolled-up column
+        """
+        with self._lock:
+            written = any(event.table == "students" for event in events)
+            if written and self._state is not None and \
+                    (previous is None or self._state["signature"] != list(previous)):
+                self._state = None
+                self._dirty = True
+
+            for event in events:
+                if event.table != "students" or self._state is None:
+                    continue
+                if self._update(self._state, event, registered):
+                    self._state["signature"] = list(signature)
+                    self._state["updated_at"] = datetime.now().strftime(DATE_FORMAT)
+                else:
+                    self._state = None
+                self._dirty = True
+
+    @staticmethod
+    def _add(state: Dict, registered, values: Dict, delta: int,
+             columns: Iterable[str] = DIMENSIONS, total: bool = True) -> None:
+        """Add a row's values to (or remove them from) the buckets of its registration date"""
+        moment = parse_date(registered)
+        if moment is None:
+            return
+        for rollup, key_format in ROLLUPS.items():
+            buckets = state[rollup]
+            key = moment.strftime(key_format)
+            bucket = buckets.setdefault(key, {"total": 0})
+            if total:
+                bucket["total"] += delta
+            for column in columns:
+                add_count(bucket.setdefault(column, {}), values.get(column), delta)
+            if bucket["total"] <= 0:
+                del buckets[key]
+
+    @classmethod
+    def _update(cls, state: Dict, event: Event, registered: Callable[[str], Optional[str]]) -> bool:
+        """Apply an event to the rollups; False if it can't be applied"""
+        if event.type == TABLE_REPLACED:
+            return False
+
+        if event.type == ADDED_EVENTS["students"]:
+            cls._add(state, event.after.get(DATE_COLUMN), event.after, 1)
+            return True
+
+        if event.type == DELETED_EVENTS["students"]:
+            if event.before is None:
+                return False
+            cls._add(state, event.before.get(DATE_COLUMN), event.before, -1)
+            return True
+
+        after = event.after or {}
+        if DATE_COLUMN in after:
+            return False
+        changed = [column for column in DIMENSIONS if column in after]
+        if not changed:
+            return True
+        if event.before is None:
+            return False
+        moment = registered(event.key)
+        if moment is None:
+            return False
+        cls._add(state, moment, event.before, -1, changed, total=False)
+        cls._add(state, moment, after, 1, changed, total=False)
+        return True
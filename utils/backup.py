@@ -0,0 +1,363 @@
+"""
+Incremental backups for Vocabolarium
+Stored files are split into fixed-size chunks kept once each, compressed and
+named by their SHA-256, so a backup only writes the chunks that changed since
+earlier ones. A JSON manifest per backup lists the chunks of every file for
+restore and integrity checks; old backups are pruned hourly/daily/weekly.
+
+Usage:
+    python utils/backup.py create|list|prune
+    python utils/backup.py verify [BACKUP_ID]
+    python utils/backup.py restore BACKUP_ID
+"""
+
+import argparse
+import hashlib
+import json
+import zlib
+from datetime import datetime
+from pathlib import Path
+import sys
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import logging
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from config.config import BACKUP_DIR, BACKUP_CHUNK_SIZE, BACKUP_RETENTION
+from utils.locking import FileLock, atomic_write
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# zlib level used for chunks: fast, and table files compress well
+COMPRESSION_LEVEL = 6
+
+# Time bucket of each retention period, as a strftime format
+RETENTION_PERIODS: Dict[str, str] = {
+    "hourly": "%Y-%m-%d %H",
+    "daily": "%Y-%m-%d",
+    "weekly": "%G-W%V",
+}
+
+
+def select_retained(manifests: List[Dict], retention: Dict[str, int]) -> Set[str]:
+    """
+    Choose the backups kept by a retention policy
+    For each period the newest backup of each of the last N buckets that
+    have one is kept; the newest backup overall is always kept
+
+    Args:
+        manifests: Backup manifests (any order)
+        retention: Period name (see RETENTION_PERIODS) -> number of buckets to keep
+
+    Returns:
+        IDs of the backups to keep
+    """
+    ordered = sorted(manifests, key=lambda manifest: manifest["created_at"], reverse=True)
+    keep = {ordered[0]["id"]} if ordered else set()
+
+    for period, count in retention.items():
+        buckets = set()
+        for manifest in ordered:
+            bucket = datetime.fromisoformat(manifest["created_at"]).strftime(RETENTION_PERIODS[period])
+            if bucket in buckets:
+                continue
+            if len(buckets) >= count:
+                break
+            buckets.add(bucket)
+            keep.add(manifest["id"])
+
+    return keep
+
+
+class BackupStore:
+    """
+    Content-addressed backup repository
+    Layout: chunks/<2 hex>/<sha256> holds zlib-compressed chunks and
+    manifests/<id>.json describes each backup
+    """
+
+    def __init__(self, root: Path = BACKUP_DIR, chunk_size: int = BACKUP_CHUNK_SIZE):
+        """
+        Initialize backup store
+
+        Args:
+            root: Backup directory (created on first backup)
+            chunk_size: Bytes per chunk for new backups
+        """
+        self.root = Path(root)
+        self.chunk_size = chunk_size
+        self.chunks_dir = self.root / "chunks"
+        self.manifests_dir = self.root / "manifests"
+        self._lock = FileLock(self.root.parent / f"{self.root.name}.lock")
+
+    def _chunk_path(self, digest: str) -> Path:
+        """Get the file holding a chunk"""
+        return self.chunks_dir / digest[:2] / digest
+
+    def _manifest_path(self, backup_id: str) -> Path:
+        """Get the manifest file of a backup"""
+        return self.manifests_dir / f"{backup_id}.json"
+
+    def _read_chunk(self, digest: str) -> bytes:
+        """
+        Read and check a chunk
+
+        Raises:
+            ValueError: If the chunk is missing, unreadable or does not match its hash
+        """
+        try:
+            data = zlib.decompress(self._chunk_path(digest).read_bytes())
+        except FileNotFoundError:
+            raise ValueError(f"missing chunk {digest}")
+        except zlib.error:
+            raise ValueError(f"corrupt chunk {digest}")
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"chunk {digest} does not match its hash")
+        return data
+
+    def _store_file(self, path: Path, stats: Dict[str, int]) -> Dict:
+        """
+        Store the chunks of a file that aren't stored yet
+
+        Args:
+            path: File to store
+            stats: Counters updated in place (new_chunks, new_bytes, reused_chunks)
+
+        Returns:
+            Manifest entry of the file (size, sha256 and chunk list)
+        """
+        file_hash = hashlib.sha256()
+        chunks, size = [], 0
+
+        with open(path, "rb") as f:
+            while True:
+                data = f.read(self.chunk_size)
+                if not data:
+                    break
+                file_hash.update(data)
+                size += len(data)
+
+                digest = hashlib.sha256(data).hexdigest()
+                chunk_path = self._chunk_path(digest)
+                if chunk_path.exists():
+                    stats["reused_chunks"] += 1
+                else:
+                    compressed = zlib.compress(data, COMPRESSION_LEVEL)
+                    chunk_path.parent.mkdir(parents=True, exist_ok=True)
+                    atomic_write(chunk_path, lambda tmp: tmp.write_bytes(compressed))
+                    stats["new_chunks"] += 1
+                    stats["new_bytes"] += len(compressed)
+                chunks.append(digest)
+
+        return {"size": size, "sha256": file_hash.hexdigest(), "chunks": chunks}
+
+    def create(self, files: Iterable[Path]) -> Dict:
+        """
+        Back up files
+
+        Args:
+            files: Files to back up (stored under their names)
+
+        Returns:
+            Manifest of the new backup, with new_chunks, new_bytes and
+            reused_chunks counters
+        """
+        with self._lock:
+            self.manifests_dir.mkdir(parents=True, exist_ok=True)
+            created_at = datetime.now()
+            backup_id = created_at.strftime("%Y%m%d_%H%M%S")
+            suffix = 1
+            while self._manifest_path(backup_id).exists():
+                suffix += 1
+                backup_id = f"{created_at.strftime('%Y%m%d_%H%M%S')}_{suffix}"
+
+            stats = {"new_chunks": 0, "new_bytes": 0, "reused_chunks": 0}
+            manifest = {
+                "id": backup_id,
+                "created_at": created_at.isoformat(timespec="seconds"),
+                "chunk_size": self.chunk_size,
+                "files": {Path(path).name: self._store_file(Path(path), stats) for path in files},
+            }
+            manifest.update(stats)
+
+            atomic_write(self._manifest_path(backup_id),
+                         lambda path: path.write_text(json.dumps(manifest, indent=2), encoding="utf-8"))
+
+        logger.info(f"Backup {backup_id}: {stats['new_chunks']} new chunks ({stats['new_bytes']} bytes), "
+                    f"{stats['reused_chunks']} reused")
+        return manifest
+
+    def manifest(self, backup_id: str) -> Dict:
+        """
+        Read the manifest of a backup
+
+        Raises:
+            KeyError: If there is no such backup
+        """
+        try:
+            return json.loads(self._manifest_path(backup_id).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            raise KeyError(f"Backup {backup_id} not found")
+
+    def list(self) -> List[Dict]:
+        """
+        List the backups
+
+        Returns:
+            Manifests, newest first
+        """
+        if not self.manifests_dir.exists():
+            return []
+        manifests = [json.loads(path.read_text(encoding="utf-8")) for path in self.manifests_dir.glob("*.json")]
+        return sorted(manifests, key=lambda manifest: (manifest["created_at"], manifest["id"]), reverse=True)
+
+    def verify(self, backup_id: Optional[str] = None) -> Dict[str, List[str]]:
+        """
+        Check that backups can be restored: every chunk is present and matches
+        its hash, and every file adds up to its recorded size. Chunks shared by
+        several backups are read once.
+
+        Args:
+            backup_id: Backup to check (default: all backups)
+
+        Returns:
+            Backup ID -> problems found (empty lists for intact backups)
+        """
+        manifests = [self.manifest(backup_id)] if backup_id is not None else self.list()
+        chunks: Dict[str, Tuple[int, Optional[str]]] = {}
+        results = {}
+
+        for manifest in manifests:
+            problems = []
+            for name, entry in manifest["files"].items():
+                size = 0
+                for digest in entry["chunks"]:
+                    if digest not in chunks:
+                        try:
+                            chunks[digest] = (len(self._read_chunk(digest)), None)
+                        except ValueError as e:
+                            chunks[digest] = (0, str(e))
+                    chunk_size, error = chunks[digest]
+                    if error is not None:
+                        problems.append(f"{name}: {error}")
+                        break
+                    size += chunk_size
+                else:
+                    if size != entry["size"]:
+                        problems.append(f"{name}: size does not match the manifest")
+            results[manifest["id"]] = problems
+
+        return results
+
+    def restore(self, backup_id: str, directory: Path) -> List[Path]:
+        """
+        Rebuild the files of a backup
+
+        Args:
+            backup_id: Backup to restore
+            directory: Directory receiving the files
+
+        Returns:
+            Restored files
+
+        Raises:
+            KeyError: If there is no such backup
+            ValueError: If a chunk or file fails its integrity check
+        """
+        manifest = self.manifest(backup_id)
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        restored = []
+        for name, entry in manifest["files"].items():
+            target = directory / name
+            file_hash = hashlib.sha256()
+            with open(target, "wb") as f:
+                for digest in entry["chunks"]:
+                    data = self._read_chunk(digest)
+                    file_hash.update(data)
+                    f.write(data)
+            if file_hash.hexdigest() != entry["sha256"]:
+                raise ValueError(f"{name} does not match its recorded hash")
+            restored.append(target)
+
+        return restored
+
+    def prune(self, retention: Dict[str, int] = BACKUP_RETENTION) -> List[str]:
+        """
+        Delete backups outside the retention policy and the chunks no longer used
+
+        Args:
+            retention: Period -> number of buckets kept (see select_retained)
+
+        Returns:
+            IDs of the deleted backups
+        """
+        with self._lock:
+            manifests = self.list()
+            keep = select_retained(manifests, retention)
+            removed = [manifest["id"] for manifest in manifests if manifest["id"] not in keep]
+            for backup_id in removed:
+                self._manifest_path(backup_id).unlink(missing_ok=True)
+
+            if removed:
+                used = {
+                    digest
+                    for manifest in manifests if manifest["id"] in keep
+                    for entry in manifest["files"].values()
+                    for digest in entry["chunks"]
+                }
+                unused = 0
+                for chunk_path in self.chunks_dir.glob("*/*"):
+                    if chunk_path.name not in used:
+                        chunk_path.unlink(missing_ok=True)
+                        unused += 1
+                logger.info(f"Pruned {len(removed)} backups and {unused} unused chunks")
+
+        return removed
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Manage Vocabolarium backups")
+    parser.add_argument("command", choices=["create", "list", "verify", "restore", "prune"])
+    parser.add_argument("backup_id", nargs="?", help="Backup to verify or restore")
+    args = parser.parse_args(argv)
+
+    from utils.database import DatabaseManager
+
+    if args.command == "list":
+        for manifest in BackupStore().list():
+            size = sum(entry["size"] for entry in manifest["files"].values())
+            print(f"{manifest['id']}  {manifest['created_at']}  {len(manifest['files'])} files  {size} bytes")
+        return 0
+
+    if args.command == "verify":
+        results = BackupStore().verify(args.backup_id)
+        for backup_id, problems in results.items():
+            print(f"{'✅' if not problems else '❌'} {backup_id}")
+            for problem in problems:
+                print(f"   {problem}")
+        return 0 if not any(results.values()) else 1
+
+    if args.command == "prune":
+        removed = BackupStore().prune()
+        print(f"Removed {len(removed)} backups")
+        return 0
+
+    db = DatabaseManager()
+    if args.command == "create":
+        success, msg = db.backup_database()
+    else:
+        if not args.backup_id:
+            parser.error("restore needs a BACKUP_ID")
+        success, msg = db.restore_backup(args.backup_id)
+
+    print(f"{'✅' if success else '❌'} {msg}")
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,219 @@
+"""
+Bulk import for Vocabolarium
+Streams student registrations from CSV/XLSX files in chunks and validates
+them vectorized against VALIDATION_RULES before they are added in one write
+
+Usage:
+    python utils/bulk_import.py registrations.xlsx [--chunk-size N] [--report rejected.csv]
+"""
+
+import argparse
+import re
+from pathlib import Path
+import sys
+from typing import Dict, Iterator, Optional, Set, Tuple
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from config.config import VALIDATION_RULES, LANGUAGES, BULK_IMPORT_CHUNK_SIZE
+
+
+# Imported columns -> student_data key used by DatabaseManager.add_student
+IMPORT_FIELDS: Dict[str, str] = {
+    "Name": "name",
+    "Email": "email",
+    "Age": "age",
+    "Language": "language",
+    "Preferred_Tutor": "preferred_tutor",
+    "Scheduled_Time": "scheduled_time",
+    "Session_Interval": "session_interval",
+    "Payment_Option": "payment_option",
+}
+
+# Columns every input file must have
+REQUIRED_FIELDS = ["Name", "Email", "Age", "Language"]
+
+# Other header spellings accepted in input files (normalized, see _normalize_header)
+HEADER_ALIASES: Dict[str, str] = {
+    "full_name": "Name",
+    "email_address": "Email",
+    "preferred_language": "Language",
+    "tutor": "Preferred_Tutor",
+    "payment_method": "Payment_Option",
+}
+
+# Column of the rejected-rows report holding the reasons
+REASON_COLUMN = "Rejection_Reason"
+
+
+def _normalize_header(header: object) -> str:
+    """Normalize a header for matching (e.g. ' Full Name ' -> 'full_name')"""
+    return re.sub(r"[\s\-]+", "_", str(header).strip()).lower()
+
+
+def _rename_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Map input headers onto the imported column names, dropping unknown columns"""
+    known = {_normalize_header(field): field for field in IMPORT_FIELDS}
+    known.update(HEADER_ALIASES)
+
+    renames = {}
+    for header in df.columns:
+        field = known.get(_normalize_header(header))
+        if field is not None and field not in renames.values():
+            renames[header] = field
+    return df[list(renames)].rename(columns=renames)
+
+
+def read_chunks(path: Path, chunk_size: int = BULK_IMPORT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Read a CSV or XLSX file in chunks without loading it whole
+
+    Args:
+        path: Input file (.csv, .xlsx or .xlsm)
+        chunk_size: Rows per chunk
+
+    Yields:
+        DataFrames of raw cell values, indexed by source line number
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+
+    if suffix == ".csv":
+        reader = pd.read_csv(path, chunksize=chunk_size, dtype=str, keep_default_na=False)
+        for chunk in reader:
+            chunk.index = chunk.index + 2  # line 1 is the header
+            yield chunk
+
+    elif suffix in (".xlsx", ".xlsm"):
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(path, read_only=True, data_only=True)
+        try:
+            rows = workbook.active.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            header = ["" if cell is None else str(cell) for cell in header]
+            width = len(header)
+
+            batch, lines = [], []
+            for line, row in enumerate(rows, start=2):
+                if all(cell is None or str(cell).strip() == "" for cell in row):
+                    continue
+                batch.append(tuple(row[:width]) + (None,) * (width - len(row)))
+                lines.append(line)
+                if len(batch) >= chunk_size:
+                    yield pd.DataFrame(batch, columns=header, index=lines)
+                    batch, lines = [], []
+            if batch:
+                yield pd.DataFrame(batch, columns=header, index=lines)
+        finally:
+            workbook.close()
+
+    else:
+        raise ValueError(f"Unsupported file type: {path.suffix} (expected .csv or .xlsx)")
+
+
+def validate_students(chunk: pd.DataFrame, seen_emails: Set[str]) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Validate a chunk of student registrations
+
+    Every rule is checked on whole columns at once; a row is rejected if it
+    fails any of them. Emails repeated within the file are rejected after
+    their first occurrence.
+
+    Args:
+        chunk: Raw rows as returned by read_chunks
+        seen_emails: Emails of existing students and of rows accepted from
+                     earlier chunks, lowercase (updated in place)
+
+    Returns:
+        Tuple of (valid rows with cleaned values, rejected raw rows with a
+        Rejection_Reason column)
+
+    Raises:
+        ValueError: If a required column is missing
+    """
+    df = _rename_columns(chunk)
+    missing = [field for field in REQUIRED_FIELDS if field not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+    for field in IMPORT_FIELDS:
+        if field not in df.columns:
+            df[field] = ""
+        elif field != "Age":
+            df[field] = df[field].fillna("").astype(str).str.strip()
+    df["Email"] = df["Email"].str.lower()
+
+    ages = pd.to_numeric(df["Age"], errors="coerce")
+    name_length = df["Name"].str.len()
+
+    failures = pd.DataFrame({
+        f"name must be {VALIDATION_RULES['min_name_length']}-{VALIDATION_RULES['max_name_length']} characters":
+            (name_length < VALIDATION_RULES["min_name_length"]) | (name_length > VALIDATION_RULES["max_name_length"]),
+        "invalid email":
+            ~df["Email"].str.match(VALIDATION_RULES["email_pattern"]),
+        f"age must be a whole number from {VALIDATION_RULES['min_age']} to {VALIDATION_RULES['max_age']}":
+            ages.isna() | (ages % 1 != 0) | (ages < VALIDATION_RULES["min_age"]) | (ages > VALIDATION_RULES["max_age"]),
+        "unknown language":
+            ~df["Language"].isin(list(LANGUAGES)),
+        "duplicate email":
+            df["Email"].duplicated() | df["Email"].isin(seen_emails),
+    }, index=df.index)
+
+    rejected_mask = failures.any(axis=1)
+
+    rejected = chunk[rejected_mask].copy()
+    reasons = failures[rejected_mask].dot(failures.columns + "; ")
+    rejected[REASON_COLUMN] = reasons.str.rstrip("; ")
+
+    valid = df[~rejected_mask].copy()
+    valid["Age"] = ages[~rejected_mask].astype(int)
+    seen_emails.update(valid["Email"].tolist())
+
+    return valid, rejected
+
+
+def write_report(rejected: pd.DataFrame, path: Path) -> None:
+    """
+    Write the rejected-rows report as CSV
+
+    Args:
+        rejected: Rejected rows with their Rejection_Reason
+        path: Report file
+    """
+    report = rejected.rename_axis("Row").reset_index()
+    report.to_csv(path, index=False)
+
+
+def main(argv: Optional[list] = None) -> int:
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Bulk import student registrations into Vocabolarium")
+    parser.add_argument("source", type=Path, help="CSV or XLSX file with one registration per row")
+    parser.add_argument("--chunk-size", type=int, default=BULK_IMPORT_CHUNK_SIZE, help="Rows read per chunk")
+    parser.add_argument("--report", type=Path, default=None,
+                        help="Rejected-rows report (default: <source>_rejected.csv)")
+    args = parser.parse_args(argv)
+
+    from utils.database import DatabaseManager
+
+    db = DatabaseManager()
+    success, summary = db.import_students(args.source, chunk_size=args.chunk_size, report_path=args.report)
+
+    if not success:
+        print(f"❌ Import failed: {summary['error']}")
+        return 1
+
+    print(f"✅ Imported {summary['imported']} of {summary['total']} rows", end="")
+    if summary["imported"]:
+        print(f" ({summary['first_id']} - {summary['last_id']})", end="")
+    print()
+    if summary["rejected"]:
+        print(f"⚠️ Rejected {summary['rejected']} rows, see {summary['report']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+Table cache for Vocabolarium
+Keeps loaded student and tutor tables in memory for the whole server process
+and reloads them only when the underlying storage changes
+"""
+
+import threading
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+import pandas as pd
+
+
+class CacheEntry:
+    """
+    Cached table together with the storage signature it was loaded at
+    Also holds the indexes built on the table (and the threads building the
+    slow ones in the background); writers going through DatabaseManager
+    update frame, indexes and signature under the entry lock
+    """
+
+    __slots__ = ("frame", "signature", "indexes", "builders", "next_label", "lock")
+
+    def __init__(self, frame: pd.DataFrame, signature: Tuple):
+        self.frame = frame
+        self.signature = signature
+        self.indexes: Dict[str, object] = {}
+        self.builders: Dict[str, threading.Thread] = {}
+        self.next_label = int(frame.index.max()) + 1 if len(frame) else 0
+        self.lock = threading.RLock()
+
+
+class TableCache:
+    """
+    Thread-safe, process-wide cache of loaded tables
+    Entries are validated against the storage signature on every
+    read and counted as hits or misses
+    """
+
+    def __init__(self):
+        """Initialize an empty cache"""
+        self._entries: Dict[Hashable, CacheEntry] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable, signature: Tuple, loader: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """
+        Get a cached table, loading it if missing or stale
+
+        Args:
+            key: Cache key identifying the table
+            signature: Current storage signature of the table
+            loader: Function loading the table from storage
+
+        Returns:
+            Cached DataFrame (shared, must not be modified in place)
+        """
+        return self.get_entry(key, signature, loader).frame
+
+    def get_entry(self, key: Hashable, signature: Tuple, loader: Callable[[], pd.DataFrame]) -> CacheEntry:
+        """
+        Get a cache entry, loading the table if missing or stale
+
+        Args:
+            key: Cache key identifying the table
+            signature: Current storage signature of the table
+            loader: Function loading the table from storage
+
+        Returns:
+            CacheEntry holding the current table
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.signature == signature:
+                self.hits += 1
+                return entry
+
+            self.misses += 1
+            entry = CacheEntry(loader(), signature)
+            self._entries[key] = entry
+            return entry
+
+    def peek(self, key: Hashable) -> Optional[CacheEntry]:
+        """Get a cache entry without validating or counting it"""
+        with self._lock:
+            return self._entries.get(key)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """
+        Drop cached tables
+
+        Args:
+            key: Table to drop (default: all tables)
+        """
+        with self._lock:
+            if key is None:
+                self.invalidations += len(self._entries)
+                self._entries.clear()
+            elif self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def stats(self) -> Dict:
+        """
+        Get cache counters
+
+        Returns:
+            Dictionary with hits, misses, invalidations, hit ratio and cached tables
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+                "cached_tables": {
+                    str(key): len(entry.frame) for key, entry in self._entries.items()
+                },
+            }
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss counters"""
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.invalidations = 0
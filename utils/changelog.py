@@ -0,0 +1,186 @@
+"""
+Change log for Vocabolarium
+Every write made through DatabaseManager is appended to a per-table log in
+the write journal format, next to periodic full checkpoints of the table, so
+a table can be rebuilt as of any past moment by replaying the log from the
+nearest checkpoint before it
+"""
+
+import gzip
+import json
+from datetime import datetime
+from pathlib import Path
+import sys
+from typing import Dict, List, Optional, Union
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from config.config import CHANGELOG_CHECKPOINT_BYTES
+from utils.journal import WriteJournal, replay
+from utils.locking import FileLock, atomic_write
+
+
+# Directory holding the change logs and checkpoints, beside the stored tables
+CHANGELOG_DIR = "history"
+
+# Timestamp format of log entries and checkpoints
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def parse_timestamp(value: Union[str, datetime]) -> datetime:
+    """Parse a log timestamp (datetimes are returned unchanged)"""
+    if isinstance(value, datetime):
+        return value
+    return datetime.strptime(value, TIMESTAMP_FORMAT)
+
+
+class ChangeLog:
+    """
+    Per-table change logs with checkpoints
+    Layout: <table>.changes.jsonl holds the log, <table>_<time>.json.gz the
+    checkpoints and checkpoints.json where each checkpoint starts in the log
+    """
+
+    def __init__(self, directory: Path, checkpoint_bytes: int = CHANGELOG_CHECKPOINT_BYTES):
+        """
+        Initialize change log
+
+        Args:
+            directory: History directory (created on first use)
+            checkpoint_bytes: Log growth after which a new checkpoint is due
+        """
+        self.directory = Path(directory)
+        self.checkpoint_bytes = checkpoint_bytes
+        self._journals: Dict[str, WriteJournal] = {}
+        self._index_path = self.directory / "checkpoints.json"
+        self._lock = FileLock(self.directory.parent / f"{self.directory.name}.lock")
+
+    def _journal(self, table: str) -> WriteJournal:
+        """Get the log of a table"""
+        journal = self._journals.get(table)
+        if journal is None:
+            journal = self._journals[table] = WriteJournal(self.directory / f"{table}.changes.jsonl")
+        return journal
+
+    def _read_index(self) -> List[Dict]:
+        """Read the checkpoint list"""
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+
+    def checkpoints(self, table: str) -> List[Dict]:
+        """
+        List the checkpoints of a table
+
+        Returns:
+            Checkpoints as {"table", "ts", "offset", "file"}, oldest first
+        """
+        return [checkpoint for checkpoint in self._read_index() if checkpoint["table"] == table]
+
+    def record(self, table: str, entries: List[Dict]) -> None:
+        """
+        Append changes to a table's log
+        Must be called while holding the table's write lock, after the write
+
+        Args:
+            table: Table name
+            entries: Changes in the write journal format
+                     ({"op", "key", "row" | "changes"})
+        """
+        if entries:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._journal(table).append(entries)
+
+    def checkpoint_due(self, table: str) -> bool:
+        """Check whether a table has no checkpoint or its log grew enough since the last one"""
+        checkpoints = self.checkpoints(table)
+        if not checkpoints:
+            return True
+        return self._journal(table).size() - checkpoints[-1]["offset"] >= self.checkpoint_bytes
+
+    def checkpoint(self, table: str, df: pd.DataFrame) -> Dict:
+        """
+        Save the full content of a table as of now
+        Must be called while holding the table's write lock, so the content
+        matches the log up to its current end
+
+        Args:
+            table: Table name
+            df: Current table content
+
+        Returns:
+            The new checkpoint
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        now = datetime.now()
+        path = self.directory / f"{table}_{now.strftime('%Y%m%d_%H%M%S_%f')}.json.gz"
+
+        records = df.astype(object).where(df.notna(), None).to_dict("records")
+        data = json.dumps({"columns": list(df.columns), "rows": records}, ensure_ascii=False, default=str)
+        atomic_write(path, lambda tmp: tmp.write_bytes(gzip.compress(data.encode("utf-8"))))
+
+        checkpoint = {
+            "table": table,
+            "ts": now.strftime(TIMESTAMP_FORMAT),
+            "offset": self._journal(table).size(),
+            "file": path.name,
+        }
+        with self._lock:
+            index = self._read_index()
+            index.append(checkpoint)
+            atomic_write(self._index_path,
+                         lambda tmp: tmp.write_text(json.dumps(index, indent=2), encoding="utf-8"))
+        return checkpoint
+
+    def _load_checkpoint(self, checkpoint: Dict) -> pd.DataFrame:
+        """Read the table content saved by a checkpoint"""
+        data = json.loads(gzip.decompress((self.directory / checkpoint["file"]).read_bytes()).decode("utf-8"))
+        return pd.DataFrame(data["rows"], columns=data["columns"])
+
+    def earliest(self, table: str) -> Optional[datetime]:
+        """Get the earliest moment a table can be rebuilt at (its first checkpoint)"""
+        checkpoints = self.checkpoints(table)
+        return parse_timestamp(checkpoints[0]["ts"]) if checkpoints else None
+
+    def as_of(self, table: str, timestamp: Union[str, datetime], key_column: str) -> pd.DataFrame:
+        """
+        Rebuild a table as it was at a moment
+        Starts from the last checkpoint taken at or before the moment and
+        replays the logged changes made up to it
+
+        Args:
+            table: Table name
+            timestamp: Moment to rebuild (datetime or "YYYY-MM-DD HH:MM:SS")
+            key_column: Primary key of the table
+
+        Returns:
+            Table content at that moment
+
+        Raises:
+            ValueError: If the moment is before the table's history starts
+        """
+        moment = parse_timestamp(timestamp)
+        earlier = [
+            checkpoint for checkpoint in self.checkpoints(table)
+            if parse_timestamp(checkpoint["ts"]) <= moment
+        ]
+        if not earlier:
+            earliest = self.earliest(table)
+            raise ValueError(
+                f"No history of {table} before {earliest.strftime(TIMESTAMP_FORMAT)}"
+                if earliest else f"No history of {table} yet"
+            )
+
+        checkpoint = earlier[-1]
+        entries, _ = self._journal(table).read(checkpoint["offset"])
+
+        applied = []
+        for entry in entries:
+            if parse_timestamp(entry["ts"]) > moment:
+                break
+            applied.append(entry)
+
+        return replay(self._load_checkpoint(checkpoint), applied, key_column)
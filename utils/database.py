@@ -1,96 +1,185 @@
 """
 Database Manager for Vocabolarium
-Handles all database operations for students and tutors using Excel files
+Handles all database operations for students and tutors on top of a
+pluggable storage backend (SQLite by default, Excel workbooks for import/export)
 Provides CRUD operations with error handling and data validation
 """
 
 import pandas as pd
 import os
-from datetime import datetime
+import json
+import shutil
+import tempfile
+import threading
+from datetime import date, datetime
 from pathlib import Path
 import sys
-from typing import Dict, Tuple, List, Optional
+from typing import Any, Callable, Dict, Tuple, List, Optional, Mapping, Union
 import logging
 
 sys.path.append(str(Path(__file__).resolve().parent.parent))
-from config.config import STUDENTS_DB, TUTORS_DB, DATA_DIR
+from config.config import (
+    STUDENTS_DB, TUTORS_DB, DATA_DIR, BACKUP_DIR, STUDENTS_COLUMNS, TUTORS_COLUMNS, BULK_IMPORT_CHUNK_SIZE, PAGE_SIZE,
+    EVENT_TAIL_ENABLED, TOMBSTONE_RETENTION_SECONDS, VACUUM_INTERVAL_SECONDS
+)
+from utils.storage import (
+    StorageBackend, ExcelBackend, TABLE_KEYS, TABLE_WORKBOOKS, VERSION_COLUMN, DELETED_COLUMN, create_backend,
+    to_python_value, apply_query, apply_seek, filter_frame, is_multi_value, live_rows, deleted_mask, tombstone_cutoff
+)
+from utils.cache import TableCache, CacheEntry
+from utils.indexes import HashIndex, MembershipIndex, HASH_INDEXES, MEMBERSHIP_INDEXES
+from utils.search import TrigramIndex, SEARCH_COLUMNS, scan
+from utils.snapshot import read_snapshot
+from utils.locking import lock_stats
+from utils.bulk_import import IMPORT_FIELDS, read_chunks, validate_students, write_report
+from utils.sequences import SequenceStore, SEQUENCES_FILE, format_id, max_id_number
+from utils.backup import BackupStore
+from utils.changelog import ChangeLog, CHANGELOG_DIR
+from utils.events import (
+    Event, EventBus, EventTail, EVENTS_FILE, ADDED_EVENTS, DELETED_EVENTS, TABLE_REPLACED, update_events
+)
+from utils.statistics import Statistics, STATISTICS_FILE
+from utils.analytics import RegistrationRollups, ANALYTICS_FILE, DATE_COLUMN, query_rollups
+from utils.migrations import SchemaMetadata, METADATA_FILE, migrate
+from utils.records import Student, Tutor, RECORD_TYPES
+from utils.schema import apply_schema, align_categories, is_categorical, memory_usage, format_bytes
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Student columns supporting keyset (cursor) paging
+KEYSET_COLUMNS = ("Registration_ID", "Registration_Date")
+
+
 class DatabaseManager:
     """
-    Comprehensive database manager for Excel-based storage
+    Comprehensive database manager on top of a StorageBackend
     Handles students and tutors data with full CRUD operations
     """
     
-    def __init__(self):
-        """Initialize database manager and create databases if needed"""
+    # Loaded tables shared by every DatabaseManager in the server process
+    _cache = TableCache()
+    
+    # Memory used by each cached table before and after typing, by cache key
+    _memory_reports: Dict[Any, Dict] = {}
+    
+    # Change events, materialized statistics and registration rollups of each
+    # data location, shared by every DatabaseManager in the server process using it
+    _buses: Dict[Tuple, EventBus] = {}
+    _statistics: Dict[Tuple, Statistics] = {}
+    _rollups: Dict[Tuple, RegistrationRollups] = {}
+    _shared_lock = threading.Lock()
+    
+    def __init__(self, backend: Optional[StorageBackend] = None):
+        """
+        Initialize database manager and create databases if needed
+        
+        Args:
+            backend: Storage backend to use (default: DATABASE_BACKEND from config)
+        """
         # Ensure data directory exists
         DATA_DIR.mkdir(parents=True, exist_ok=True)
+        self.backend = backend if backend is not None else create_backend()
+        self.sequences = SequenceStore(self.backend.data_path(SEQUENCES_FILE))
+        self.metadata = SchemaMetadata(self.backend.data_path(METADATA_FILE))
+        self.changelog = ChangeLog(self.backend.data_path(CHANGELOG_DIR))
+        self.event_tail = EventTail(self.backend.data_path(EVENTS_FILE)) if EVENT_TAIL_ENABLED else None
+        self._events, self.statistics, self.rollups = self._shared_services()
         self._initialize_databases()
-        logger.info("DatabaseManager initialized successfully")
+        logger.info(f"DatabaseManager initialized successfully ({self.backend.name} backend)")
+    
+    def _shared_services(self) -> Tuple[EventBus, Statistics, RegistrationRollups]:
+        """
+        Get the event bus, statistics and registration rollups of this
+        manager's data location (built by the first manager using it)
+        """
+        location = (self.backend.name, str(self.backend.data_path(EVENTS_FILE).resolve()))
+        with self._shared_lock:
+            if location not in self._buses:
+                self._buses[location] = EventBus()
+                self._statistics[location] = Statistics(
+                    self.backend.data_path(f"{self.backend.name}.{STATISTICS_FILE}")
+                )
+                self._rollups[location] = RegistrationRollups(
+                    self.backend.data_path(f"{self.backend.name}.{ANALYTICS_FILE}")
+                )
+            return self._buses[location], self._statistics[location], self._rollups[location]
     
     def _initialize_databases(self):
-        """Initialize Excel databases if they don't exist"""
+        """
+        Initialize databases if they don't exist and bring them to the current schema version
+        Once set up, this only reads the small metadata file: one-time and
+        periodic maintenance is recorded there and skipped until due
+        """
         self._initialize_students_db()
         self._initialize_tutors_db()
+        
+        metadata = self.metadata.read()
+        try:
+            migrate(self.backend, self.metadata, int(metadata.get("schema_version", 0)))
+        except Exception as e:
+            logger.warning(f"Could not migrate databases: {str(e)}")
+        
+        # Start the change history of tables created before it existed (once per table)
+        started = metadata.get("history_started", [])
+        if any(table not in started for table in TABLE_KEYS):
+            for table in TABLE_KEYS:
+                if not self.changelog.checkpoints(table):
+                    with self.backend.lock(table):
+                        self._checkpoint(table)
+            self.metadata.update(history_started=list(TABLE_KEYS))
+        
+        vacuumed_at = metadata.get("vacuumed_at")
+        if (vacuumed_at is None or
+                (datetime.now() - datetime.fromisoformat(vacuumed_at)).total_seconds() >= VACUUM_INTERVAL_SECONDS):
+            self.vacuum()
+    
+    def get_schema_version(self) -> int:
+        """Get the schema version of the stored tables (see utils.migrations)"""
+        return self.metadata.version()
+    
+    def _import_workbook(self, table: str, workbook: Path) -> bool:
+        """
+        Import an existing workbook into a freshly created non-Excel table
+        
+        Args:
+            table: Table name
+            workbook: Workbook holding the legacy data
+            
+        Returns:
+            True if rows were imported
+        """
+        if self.backend.name == ExcelBackend.name or not workbook.exists():
+            return False
+        
+        try:
+            count = self.backend.import_excel(table, workbook)
+            logger.info(f"Imported {count} {table} from {workbook}")
+            return True
+        except Exception as e:
+            logger.error(f"Error importing {table} from {workbook}: {str(e)}")
+            return False
     
     def _initialize_students_db(self):
         """Initialize Students Database"""
-        if not STUDENTS_DB.exists():
+        if not self.backend.table_exists("students"):
             logger.info("Creating new students database...")
-            students_df = pd.DataFrame(columns=[
-                "Registration_ID",
-                "Name",
-                "Email",
-                "Age",
-                "Language",
-                "Preferred_Tutor",
-                "Scheduled_Time",
-                "Session_Interval",
-                "Payment_Option",
-                "Registration_Date",
-                "Status",
-                "Assigned_Tutor",
-                "Google_Meet_Link",
-                "Payment_Status",
-                "Payment_Date",
-                "Notes"
-            ])
-            students_df.to_excel(STUDENTS_DB, index=False, engine='openpyxl')
-            logger.info(f"Students database created at {STUDENTS_DB}")
+            self.backend.create_table("students", STUDENTS_COLUMNS)
+            self._import_workbook("students", STUDENTS_DB)
+            logger.info(f"Students database created ({self.backend.name} backend)")
         else:
-            # Check if Preferred_Tutor column exists, add if not
-            try:
-                df = pd.read_excel(STUDENTS_DB, engine='openpyxl')
-                if "Preferred_Tutor" not in df.columns:
-                    df["Preferred_Tutor"] = ""
-                    df.to_excel(STUDENTS_DB, index=False, engine='openpyxl')
-                    logger.info("Added Preferred_Tutor column to students database")
-            except:
-                pass
-            logger.info(f"Students database found at {STUDENTS_DB}")
+            logger.info(f"Students database found ({self.backend.name} backend)")
     
     def _initialize_tutors_db(self):
         """Initialize Tutors Database with sample data"""
-        if not TUTORS_DB.exists():
+        if not self.backend.table_exists("tutors"):
             logger.info("Creating new tutors database...")
-            tutors_df = pd.DataFrame(columns=[
-                "Tutor_ID",
-                "Name",
-                "Email",
-                "Languages_Teaching",
-                "Available_Times",
-                "Contact_Number",
-                "Date_Added",
-                "Status",
-                "Specialization",
-                "Experience_Years",
-                "Rating"
-            ])
+            self.backend.create_table("tutors", TUTORS_COLUMNS)
+            
+            if self._import_workbook("tutors", TUTORS_DB):
+                return
             
             # Add sample tutors
             sample_tutors = [
@@ -162,14 +251,987 @@ class DatabaseManager:
 
             ]
             
-            tutors_df = pd.DataFrame(sample_tutors)
-            tutors_df.to_excel(TUTORS_DB, index=False, engine='openpyxl')
-            logger.info(f"Tutors database created with {len(sample_tutors)} sample tutors at {TUTORS_DB}")
+            self.backend.insert("tutors", sample_tutors)
+            logger.info(f"Tutors database created with {len(sample_tutors)} sample tutors ({self.backend.name} backend)")
         else:
-            logger.info(f"Tutors database found at {TUTORS_DB}")
+            logger.info(f"Tutors database found ({self.backend.name} backend)")
+    
+    # ==================== TABLE CACHE ====================
+    
+    def _entry(self, table: str) -> CacheEntry:
+        """
+        Get the cache entry of a table
+        The table is reloaded only when its storage signature changes
+        
+        Args:
+            table: Table name ("students" or "tutors")
+            
+        Returns:
+            CacheEntry with the current table and its indexes
+        """
+        return self._cache.get_entry(
+            self.backend.cache_key(table),
+            self.backend.signature(table),
+            lambda: self._load_typed(table)
+        )
+    
+    def _load_typed(self, table: str) -> pd.DataFrame:
+        """
+        Load the live rows of a table from storage and convert them to their
+        compact dtypes (see utils.schema); tombstones never enter the cache
+        The table's statistics (and registration rollups) are recounted from the loaded rows
+        The memory used before and after the conversion is logged and kept for get_memory_stats
+        
+        Args:
+            table: Table name
+            
+        Returns:
+            Typed DataFrame
+        """
+        signature = self.backend.signature(table)
+        loaded = live_rows(self.backend.load(table))
+        typed = apply_schema(loaded, table)
+        self.statistics.rebuild(table, typed, signature)
+        if table == "students":
+            self.rollups.rebuild(typed, signature)
+        
+        before, after = memory_usage(loaded), memory_usage(typed)
+        self._memory_reports[self.backend.cache_key(table)] = {
+            "rows": len(typed),
+            "untyped_bytes": before,
+            "typed_bytes": after,
+            "saved_bytes": before - after,
+        }
+        logger.info(f"Loaded {table}: {len(typed)} rows, {format_bytes(before)} -> {format_bytes(after)}")
+        return typed
+    
+    def _table(self, table: str) -> pd.DataFrame:
+        """
+        Get a table from the process-wide cache
+        
+        Args:
+            table: Table name ("students" or "tutors")
+            
+        Returns:
+            Cached DataFrame (shared, must not be modified in place)
+        """
+        return self._entry(table).frame
+    
+    def _invalidate(self, table: str) -> None:
+        """Drop a table from the cache so the next read reloads it"""
+        self._cache.invalidate(self.backend.cache_key(table))
+    
+    def _projected(self, table: str, columns: Optional[List[str]]) -> pd.DataFrame:
+        """
+        Get a copy of the live rows of a table restricted to some columns
+        Uses the cached table when it is current, otherwise loads only the
+        requested columns from storage without filling the cache
+        
+        Args:
+            table: Table name
+            columns: Columns to return (default: all columns)
+            
+        Returns:
+            DataFrame with the requested columns
+        """
+        if columns is None:
+            return self._table(table).copy()
+        
+        entry = self._cache.peek(self.backend.cache_key(table))
+        if entry is not None and entry.signature == self.backend.signature(table):
+            return entry.frame[columns].copy()
+        return live_rows(self.backend.load(table, list(dict.fromkeys([*columns, DELETED_COLUMN]))))[columns]
+    
+    def get_cache_stats(self) -> Dict:
+        """
+        Get table cache counters
+        
+        Returns:
+            Dictionary with hits, misses, invalidations, hit ratio and cached tables
+        """
+        return self._cache.stats()
+    
+    def get_memory_stats(self) -> Dict[str, Dict]:
+        """
+        Get the memory used by the cached tables
+        
+        Returns:
+            Table name -> rows, bytes before and after typing, and bytes saved
+            (negative if typing cost memory), as of the table's last load
+        """
+        reports = {}
+        for table in TABLE_KEYS:
+            report = self._memory_reports.get(self.backend.cache_key(table))
+            if report is not None:
+                reports[table] = dict(report)
+        return reports
+    
+    def get_lock_stats(self) -> Dict[str, Dict]:
+        """
+        Get write lock wait times
+        
+        Returns:
+            Lock file name -> acquisitions, contended count, timeouts and wait times (ms)
+        """
+        return lock_stats()
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop every cached table (they are reloaded on next access)"""
+        cls._cache.invalidate()
+    
+    # ==================== INDEXES ====================
+    
+    @staticmethod
+    def _index(entry: CacheEntry, table: str, column: str) -> HashIndex:
+        """
+        Get the hash index of a column, building it on first use
+        
+        Args:
+            entry: Cache entry of the table
+            table: Table name
+            column: Indexed column (see HASH_INDEXES and MEMBERSHIP_INDEXES)
+            
+        Returns:
+            HashIndex (or MembershipIndex for list columns) kept up to date with the cached table
+        """
+        with entry.lock:
+            index = entry.indexes.get(column)
+            if index is None:
+                if column in MEMBERSHIP_INDEXES.get(table, {}):
+                    index = MembershipIndex(column, MEMBERSHIP_INDEXES[table][column])
+                else:
+                    index = HashIndex(column, HASH_INDEXES[table][column])
+                entry.indexes[column] = index.build(entry.frame)
+            return index
+    
+    @staticmethod
+    def _build_search_index(entry: CacheEntry, table: str) -> None:
+        """
+        Build the text search index of a cached table in the background
+        The rows are copied under the entry lock and indexed outside it; the
+        index is installed only if no write changed the table meanwhile,
+        otherwise it is built again from the new rows
+        """
+        columns = SEARCH_COLUMNS[table]
+        try:
+            while True:
+                with entry.lock:
+                    signature = entry.signature
+                    rows = entry.frame[[column for column in columns if column in entry.frame.columns]].copy()
+                
+                index = TrigramIndex(columns).build(rows)
+                
+                with entry.lock:
+                    if entry.signature == signature:
+                        entry.indexes["search"] = index
+                        return
+        except Exception as e:
+            logger.error(f"Could not build the search index of {table}: {str(e)}")
+        finally:
+            with entry.lock:
+                entry.builders.pop("search", None)
+    
+    @classmethod
+    def _search_index(cls, entry: CacheEntry, table: str, wait: bool = False) -> Optional[TrigramIndex]:
+        """
+        Get the text search index of a table
+        The first call starts building it in the background (see
+        _build_search_index), so it never holds up a search
+        
+        Args:
+            entry: Cache entry of the table
+            table: Table name
+            wait: Wait for a build in progress instead of returning None
+            
+        Returns:
+            TrigramIndex over the table's SEARCH_COLUMNS, kept up to date with
+            the cached table, or None while it is being built
+        """
+        with entry.lock:
+            index = entry.indexes.get("search")
+            if index is not None:
+                return index
+            builder = entry.builders.get("search")
+            if builder is None:
+                builder = threading.Thread(target=cls._build_search_index, args=(entry, table),
+                                           name=f"search-index-{table}", daemon=True)
+                entry.builders["search"] = builder
+                builder.start()
+        
+        if not wait:
+            return None
+        builder.join()
+        with entry.lock:
+            return entry.indexes.get("search")
+    
+    def _search(self, table: str, search_term: str, limit: Optional[int], fuzzy: bool) -> pd.DataFrame:
+        """
+        Run a substring or fuzzy search over a table's search index
+        Substring searches scan the table while the index is being built, or
+        when the index can't narrow the term down; fuzzy searches wait for it
+        
+        Returns:
+            Matching rows, best first (with a Match_Score column when fuzzy)
+        """
+        entry = self._entry(table)
+        if not fuzzy:
+            with entry.lock:
+                index = self._search_index(entry, table)
+                if index is None:
+                    labels = scan(entry.frame, SEARCH_COLUMNS[table], search_term, limit)
+                else:
+                    labels = index.search(search_term, limit, entry.frame)
+                return entry.frame.loc[labels]
+        
+        index = self._search_index(entry, table, wait=True)
+        with entry.lock:
+            if index is None:
+                # The background build failed: build it here
+                index = entry.indexes["search"] = TrigramIndex(SEARCH_COLUMNS[table]).build(entry.frame)
+            matches = index.fuzzy_search(search_term, limit if limit is not None else 10)
+            found = entry.frame.loc[[label for label, _ in matches]].copy()
+        found["Match_Score"] = [round(score, 2) for _, score in matches]
+        return found
+    
+    def _lookup(self, table: str, column: str, value) -> pd.DataFrame:
+        """
+        Get the rows where an indexed column equals a value
+        
+        Args:
+            table: Table name
+            column: Indexed column
+            value: Value to look up
+            
+        Returns:
+            DataFrame with the matching rows
+        """
+        entry = self._entry(table)
+        with entry.lock:
+            labels = self._index(entry, table, column).lookup(value)
+            return entry.frame.loc[labels]
+    
+    def _record(self, table: str, column: str, value):
+        """
+        Get the first row where an indexed column equals a value as a record
+        Built straight from the cached columns, without creating a Series
+        
+        Args:
+            table: Table name
+            column: Indexed column
+            value: Value to look up
+            
+        Returns:
+            Student or Tutor record, or None if no row matches
+        """
+        entry = self._entry(table)
+        with entry.lock:
+            labels = self._index(entry, table, column).lookup(value)
+            if not labels:
+                return None
+            return RECORD_TYPES[table].from_frame(entry.frame, labels[0])
+    
+    def _current_entry(self, table: str) -> Optional[CacheEntry]:
+        """Get the cache entry of a table if it is loaded and up to date, without loading it"""
+        entry = self._cache.peek(self.backend.cache_key(table))
+        if entry is None or entry.signature != self.backend.signature(table):
+            return None
+        return entry
+    
+    def _candidates(self, entry: CacheEntry, table: str, filters: Dict[str, Any]) -> Tuple[pd.DataFrame, Dict[str, Any]]:
+        """
+        Narrow a cached table down with the hash indexes of the filtered columns
+        Must be called while holding the entry lock
+        
+        Returns:
+            Tuple of (candidate rows in table order, filters not answered by an index)
+        """
+        indexed = [column for column in filters if column in HASH_INDEXES[table]]
+        if not indexed:
+            return entry.frame, filters
+        
+        labels = None
+        for column in indexed:
+            index = self._index(entry, table, column)
+            values = filters[column] if is_multi_value(filters[column]) else [filters[column]]
+            matches = {label for value in values for label in index.lookup(value)}
+            labels = matches if labels is None else labels & matches
+        
+        remaining = {column: value for column, value in filters.items() if column not in indexed}
+        return entry.frame.loc[sorted(labels)], remaining
+    
+    @staticmethod
+    def _live(filters: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the condition excluding tombstones to filters pushed down to storage"""
+        return {**filters, DELETED_COLUMN: ""}
+    
+    def _query(self, table: str, filters: Dict[str, Any], columns: Optional[List[str]] = None,
+               order_by: Optional[str] = None, descending: bool = False,
+               limit: Optional[int] = None, offset: int = 0) -> pd.DataFrame:
+        """
+        Get the rows of a table matching equality filters
+        Served from the cached table through its hash indexes when it is
+        current, otherwise pushed down to the storage backend so only the
+        matching rows and requested columns are loaded
+        
+        Args:
+            table: Table name
+            filters: Column -> required value or collection of allowed values
+                     (None values are ignored)
+            columns: Columns to return (default: all columns)
+            order_by: Column to sort by (default: storage order)
+            descending: Sort in descending order
+            limit: Maximum number of rows to return
+            offset: Number of matching rows to skip
+            
+        Returns:
+            DataFrame with the matching rows
+        """
+        filters = {column: value for column, value in filters.items() if value is not None}
+        
+        entry = self._current_entry(table)
+        if entry is None:
+            return self.backend.query(table, self._live(filters), columns, order_by, descending, limit, offset)
+        
+        with entry.lock:
+            frame, remaining = self._candidates(entry, table, filters)
+            return apply_query(frame, remaining, columns, order_by, descending, limit, offset).copy()
+    
+    def _count(self, table: str, filters: Dict[str, Any]) -> int:
+        """Count the rows of a table matching equality filters (None values are ignored)"""
+        filters = {column: value for column, value in filters.items() if value is not None}
+        
+        entry = self._current_entry(table)
+        if entry is None:
+            return self.backend.count(table, self._live(filters))
+        
+        with entry.lock:
+            frame, remaining = self._candidates(entry, table, filters)
+            return len(filter_frame(frame, remaining))
+    
+    def _seek(self, table: str, filters: Dict[str, Any], order_by: str, after: Optional[Tuple],
+              limit: int, descending: bool = False,
+              columns: Optional[List[str]] = None) -> Tuple[pd.DataFrame, Optional[Tuple]]:
+        """
+        Get one keyset page of a table, from the cache when current, otherwise from storage
+        
+        Returns:
+            Tuple of (page rows, cursor of the next page or None after the last page)
+        """
+        filters = {column: value for column, value in filters.items() if value is not None}
+        
+        entry = self._current_entry(table)
+        if entry is None:
+            return self.backend.seek(table, order_by, after, limit, descending, self._live(filters), columns)
+        
+        with entry.lock:
+            frame, remaining = self._candidates(entry, table, filters)
+            page, cursor = apply_seek(frame, TABLE_KEYS[table], order_by, after, limit, descending, remaining, columns)
+            return page.copy(), cursor
+    
+    @staticmethod
+    def _set_cells(frame: pd.DataFrame, labels: List, column: str, values: List) -> None:
+        """
+        Set cells of one column
+        New values of a categorical column are added as categories first; other
+        columns are widened to object if their dtype can't hold the values
+        """
+        if is_categorical(frame[column]):
+            missing = sorted({"" if value is None else str(value) for value in values}
+                             - set(frame[column].cat.categories))
+            if missing:
+                frame[column] = frame[column].cat.add_categories(missing)
+            values = ["" if value is None else str(value) for value in values]
+        try:
+            frame.loc[labels, column] = values
+        except (TypeError, ValueError):
+            frame[column] = frame[column].astype(object)
+            frame.loc[labels, column] = values
+    
+    def _apply_insert(self, table: str, records: List[Dict], previous: Tuple) -> None:
+        """
+        Add rows written through this manager to the cached table and its indexes
+        The cached table is only patched if it was current right before the
+        write (at signature `previous`), otherwise it is dropped
+        Must be called while holding the table's write lock
+        """
+        entry = self._cache.peek(self.backend.cache_key(table))
+        if entry is None:
+            return
+        
+        with entry.lock:
+            # Written by another process since it was cached: reload on the next read
+            if entry.signature != previous:
+                self._invalidate(table)
+                return
+            
+            columns = list(entry.frame.columns)
+            rows = [{col: to_python_value(col, record.get(col)) for col in columns} for record in records]
+            labels = list(range(entry.next_label, entry.next_label + len(rows)))
+            # New rows take the cached table's representation of enumerated columns
+            categorical = any(is_categorical(entry.frame[column]) for column in columns) if len(entry.frame) else None
+            new_rows = apply_schema(pd.DataFrame(rows, index=labels, columns=columns), table, categorical)
+            
+            if len(entry.frame) == 0:
+                entry.frame = new_rows
+            else:
+                frame = align_categories(entry.frame, new_rows)
+                entry.frame = pd.concat([frame, align_categories(new_rows, frame)])
+            entry.next_label += len(rows)
+            
+            for index in entry.indexes.values():
+                for label, row in zip(labels, rows):
+                    index.add(label, row)
+            
+            entry.signature = self.backend.signature(table)
+    
+    def _apply_updates(self, table: str, changes: Dict[str, Dict], previous: Tuple) -> None:
+        """
+        Apply row updates written through this manager to the cached table and its indexes
+        Each changed column is assigned once for all rows touching it
+        Must be called while holding the table's write lock
+        
+        Args:
+            table: Table name
+            changes: Primary key -> {column: new value}
+            previous: Storage signature right before the write; a cached
+                      table at another signature is dropped instead of patched
+        """
+        entry = self._cache.peek(self.backend.cache_key(table))
+        if entry is None:
+            return
+        
+        with entry.lock:
+            # Written by another process since it was cached: reload on the next read
+            if entry.signature != previous:
+                self._invalidate(table)
+                return
+            
+            frame = entry.frame
+            key_index = self._index(entry, table, TABLE_KEYS[table])
+            
+            # Column -> (labels, new values), aligned on the cached frame's index
+            columns: Dict[str, Tuple[List, List]] = {}
+            for key, row_changes in changes.items():
+                for label in key_index.lookup(key):
+                    for column, value in row_changes.items():
+                        if column in frame.columns:
+                            labels, values = columns.setdefault(column, ([], []))
+                            labels.append(label)
+                            values.append(to_python_value(column, value))
+            
+            # Rows to re-index in each index covering a changed column
+            reindexed = {}
+            for index in entry.indexes.values():
+                touched = {label for column in index.columns if column in columns for label in columns[column][0]}
+                if touched:
+                    reindexed[id(index)] = (index, sorted(touched))
+            
+            before = {
+                key: frame.loc[labels, list(index.columns)].to_dict("index")
+                for key, (index, labels) in reindexed.items()
+            }
+            
+            for column, (labels, values) in columns.items():
+                self._set_cells(frame, labels, column, values)
+            
+            for key, (index, labels) in reindexed.items():
+                after = frame.loc[labels, list(index.columns)].to_dict("index")
+                for label in labels:
+                    index.remove(label, before[key][label])
+                    index.add(label, after[label])
+            
+            entry.signature = self.backend.signature(table)
+    
+    def _apply_delete(self, table: str, key: str, previous: Tuple) -> None:
+        """
+        Remove a row deleted through this manager from the cached table and its indexes
+        The cached table is only patched if it was current right before the
+        write (at signature `previous`), otherwise it is dropped
+        Must be called while holding the table's write lock
+        """
+        entry = self._cache.peek(self.backend.cache_key(table))
+        if entry is None:
+            return
+        
+        with entry.lock:
+            # Written by another process since it was cached: reload on the next read
+            if entry.signature != previous:
+                self._invalidate(table)
+                return
+            
+            labels = self._index(entry, table, TABLE_KEYS[table]).lookup(key)
+            for index in entry.indexes.values():
+                rows = entry.frame.loc[labels, list(index.columns)].to_dict("index")
+                for label in labels:
+                    index.remove(label, rows[label])
+            entry.frame = entry.frame.drop(index=labels)
+            
+            entry.signature = self.backend.signature(table)
+    
+    # ==================== COMMITTED WRITES ====================
+    
+    def _log_change(self, table: str, entries: List[Dict]) -> None:
+        """
+        Record committed writes in the change log, checkpointing the table when due
+        A failure is logged but doesn't fail the write, which is already committed
+        """
+        try:
+            self.changelog.record(table, entries)
+            if self.changelog.checkpoint_due(table):
+                self._checkpoint(table)
+        except Exception as e:
+            logger.error(f"Could not record {table} changes in the change log: {str(e)}")
+    
+    def _checkpoint(self, table: str) -> None:
+        """Save the current content of a table in the change log (write lock must be held)"""
+        self.changelog.checkpoint(table, self._table(table))
+    
+    def _cached_rows(self, table: str, keys: List[str], columns: Optional[Dict[str, List[str]]] = None,
+                     signature: Optional[Tuple] = None) -> Optional[Dict[str, Dict]]:
+        """
+        Read rows from the cached table as it is before a write is applied to it
+        
+        Args:
+            table: Table name
+            keys: Primary keys of the rows
+            columns: Primary key -> columns to read (default: all columns)
+            signature: Storage signature the cached table must be at (default: any)
+            
+        Returns:
+            Primary key -> {column: value} for the cached rows, or None if the
+            table isn't cached (at that signature)
+        """
+        entry = self._cache.peek(self.backend.cache_key(table))
+        if entry is None:
+            return None
+        
+        with entry.lock:
+            if signature is not None and entry.signature != signature:
+                return None
+            frame = entry.frame
+            key_index = self._index(entry, table, TABLE_KEYS[table])
+            rows = {}
+            for key in keys:
+                labels = key_index.lookup(key)
+                if not labels:
+                    continue
+                position = frame.index.get_loc(labels[0])
+                wanted = columns[key] if columns is not None else frame.columns
+                rows[key] = {
+                    column: to_python_value(column, frame[column].array[position])
+                    for column in wanted if column in frame.columns
+                }
+            return rows
+    
+    def _committed_signature(self, table: str) -> Tuple:
+        """
+        Get the storage signature of a table right after a write through this manager
+        The cache entry already holds it when the table is cached
+        """
+        entry = self._cache.peek(self.backend.cache_key(table))
+        return entry.signature if entry is not None else self.backend.signature(table)
+    
+    def _publish(self, events: List[Event], previous: Dict[str, Tuple]) -> None:
+        """
+        Publish change events of a committed write to the statistics, the
+        registration rollups, the subscribers and the durable tail
+        Must be called while holding the written table's lock, after the write
+        A failure is logged but doesn't fail the write, which is already committed
+        
+        Args:
+            events: Change events of the write
+            previous: Table name -> storage signature taken under the lock before the write
+        """
+        if not events:
+            return
+        try:
+            signatures = {table: self._committed_signature(table) for table in {event.table for event in events}}
+            self.statistics.apply(events, previous, signatures)
+            if "students" in signatures:
+                self.rollups.apply(events, previous.get("students"), signatures["students"], self._registration_date)
+        except Exception as e:
+            logger.error(f"Could not update statistics: {str(e)}")
+        if self.event_tail is not None:
+            try:
+                self.event_tail.append(events)
+            except Exception as e:
+                logger.error(f"Could not append events to the event tail: {str(e)}")
+        self._events.publish(events)
+    
+    def _registration_date(self, key: str) -> Optional[str]:
+        """Get the registration date of a cached student row"""
+        rows = self._cached_rows("students", [key], {key: [DATE_COLUMN]})
+        return (rows or {}).get(key, {}).get(DATE_COLUMN)
+    
+    def _commit_insert(self, table: str, records: List[Dict], previous: Tuple) -> None:
+        """
+        Propagate rows inserted through this manager to the cache, the change log
+        and the event subscribers
+        Must be called while holding the table's write lock, after the write
+        `previous` is the storage signature taken under that lock before the write
+        """
+        self._apply_insert(table, records, previous)
+        key = TABLE_KEYS[table]
+        rows = [{column: to_python_value(column, value) for column, value in record.items()} for record in records]
+        self._log_change(table, [{"op": "insert", "key": row.get(key), "row": row} for row in rows])
+        self._publish([Event(ADDED_EVENTS[table], table, row.get(key), after=row) for row in rows], {table: previous})
+    
+    def _commit_updates(self, table: str, changes: Dict[str, Dict], previous: Tuple) -> None:
+        """
+        Propagate rows updated through this manager to the cache, the change log
+        and the event subscribers
+        Must be called while holding the table's write lock, after the write
+        `previous` is the storage signature taken under that lock before the write
+        """
+        changes = {
+            key: {column: to_python_value(column, value) for column, value in row_changes.items()}
+            for key, row_changes in changes.items()
+        }
+        # Values before the write, while the cache still holds them
+        before = self._cached_rows(table, list(changes), {key: list(row) for key, row in changes.items()}, previous)
+        
+        self._apply_updates(table, changes, previous)
+        self._log_change(table, [
+            {"op": "update", "key": key, "changes": row_changes}
+            for key, row_changes in changes.items()
+        ])
+        self._publish([
+            event
+            for key, row_changes in changes.items()
+            for event in update_events(table, key, before.get(key) if before is not None else None, row_changes)
+        ], {table: previous})
+    
+    def _commit_delete(self, table: str, key: str, tombstone: Dict, previous: Tuple) -> None:
+        """
+        Propagate a row soft-deleted through this manager to the cache, the
+        change log and the event subscribers
+        Must be called while holding the table's write lock, after the write
+        
+        Args:
+            table: Table name
+            key: Primary key of the row
+            tombstone: Columns written to mark the row deleted
+            previous: Storage signature taken under that lock before the write
+        """
+        before = self._cached_rows(table, [key], signature=previous)
+        
+        self._apply_delete(table, key, previous)
+        self._log_change(table, [{"op": "update", "key": key, "changes": tombstone}])
+        self._publish([Event(DELETED_EVENTS[table], table, key, before=(before or {}).get(key))], {table: previous})
+    
+    def _commit_undelete(self, table: str, row: Dict, changes: Dict, previous: Tuple) -> None:
+        """
+        Propagate a tombstone restored through this manager to the cache, the
+        change log and the event subscribers (as a row added back)
+        Must be called while holding the table's write lock, after the write
+        
+        Args:
+            table: Table name
+            row: Restored row
+            changes: Columns written to restore it
+            previous: Storage signature taken under that lock before the write
+        """
+        key = row[TABLE_KEYS[table]]
+        self._apply_insert(table, [row], previous)
+        self._log_change(table, [{"op": "update", "key": key, "changes": changes}])
+        self._publish([Event(ADDED_EVENTS[table], table, key, after=row)], {table: previous})
+    
+    def _commit_replace(self, table: str) -> None:
+        """
+        Propagate a whole-table replacement (import, restore) to the cache, the
+        change log and the event subscribers
+        Must be called while holding the table's write lock, after the write
+        """
+        self._invalidate(table)
+        self._checkpoint(table)
+        self._publish([Event(TABLE_REPLACED, table, None)], {})
+    
+    # ==================== CHANGE EVENTS ====================
+    
+    def subscribe(self, callback: Callable[[Event], None], types: Optional[List[str]] = None) -> int:
+        """
+        Subscribe to the change events of writes committed in this server process
+        Callbacks run synchronously while the written table is locked, so they
+        should only update in-memory state or hand the event off
+        
+        Args:
+            callback: Called with each Event (see utils.events for the types)
+            types: Event types to receive (default: all)
+            
+        Returns:
+            Token to pass to unsubscribe()
+        """
+        return self._events.subscribe(callback, types)
+    
+    def unsubscribe(self, token: int) -> None:
+        """Remove a subscription made with subscribe()"""
+        self._events.unsubscribe(token)
+    
+    def read_events(self, start: int = 0) -> Tuple[List[Event], int]:
+        """
+        Read the durable event tail, e.g. from another process
+        
+        Args:
+            start: Offset returned by the previous call (0 to read from the beginning)
+            
+        Returns:
+            Tuple of (events, offset for the next call); empty when
+            EVENT_TAIL_ENABLED is off
+        """
+        if self.event_tail is None:
+            return [], start
+        return self.event_tail.read(start)
+    
+    # ==================== ROW VERSIONS ====================
+    
+    def _versioned(self, table: str, changes: Dict[str, Dict],
+                   expected: Optional[Mapping[str, Optional[int]]] = None) -> Tuple[Dict[str, Dict], Dict[str, int]]:
+        """
+        Compare-and-swap on row versions: check that each row is still at the
+        version the caller's changes are based on, and add the next version to
+        its changes
+        Must be called while holding the table's write lock, after _entry(), so
+        the cached versions are the stored ones
+        
+        Args:
+            table: Table name
+            changes: Primary key -> {column: new value}
+            expected: Primary key -> version the caller read (missing or empty: not checked)
+            
+        Returns:
+            Tuple of (changes to write, primary key -> current version of the
+            rows changed by someone else since); rows that don't exist or are
+            deleted are in neither
+        """
+        expected = expected or {}
+        current = self._cached_rows(table, list(changes), {key: [VERSION_COLUMN] for key in changes})
+        if current is None:
+            return dict(changes), {}
+        
+        writable, conflicts = {}, {}
+        for key, row_changes in changes.items():
+            row = current.get(key)
+            if row is None:
+                continue
+            if VERSION_COLUMN not in row:
+                writable[key] = row_changes
+                continue
+            
+            version = row[VERSION_COLUMN] or 0
+            wanted = expected.get(key)
+            if wanted is not None and not pd.isna(wanted) and int(wanted) != version:
+                conflicts[key] = version
+            else:
+                writable[key] = {**row_changes, VERSION_COLUMN: version + 1}
+        
+        return writable, conflicts
+    
+    @staticmethod
+    def _conflict_message(label: str, key: str, current: int, expected: int) -> str:
+        """Describe a version conflict for the user"""
+        return (f"Conflict: {label.lower()} {key} was changed by someone else since it was loaded "
+                f"(version {current}, loaded version {expected}). Reload and try again")
+    
+    # ==================== SOFT DELETES ====================
+    
+    def _delete(self, table: str, key: str) -> bool:
+        """
+        Soft-delete a row: stamp Deleted_At instead of removing it (a single
+        row update), so it disappears from every read at once and can still be
+        restored until vacuum() removes it from storage
+        Must be called while holding the table's write lock
+        
+        Returns:
+            True if a live row was deleted
+        """
+        previous = self._entry(table).signature
+        tombstone = {DELETED_COLUMN: datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+        writable, _ = self._versioned(table, {key: tombstone})
+        if key not in writable or not self.backend.update(table, key, writable[key]):
+            return False
+        self._commit_delete(table, key, writable[key], previous)
+        return True
+    
+    def _undelete(self, table: str, key: str) -> bool:
+        """
+        Restore a soft-deleted row
+        Must be called while holding the table's write lock
+        
+        Returns:
+            True if a tombstone was restored
+        """
+        previous = self._entry(table).signature
+        rows = self.backend.find(table, TABLE_KEYS[table], key)
+        rows = rows[deleted_mask(rows)]
+        if rows.empty:
+            return False
+        
+        row = {column: to_python_value(column, value) for column, value in rows.iloc[0].items()}
+        changes = {DELETED_COLUMN: "", VERSION_COLUMN: (row.get(VERSION_COLUMN) or 0) + 1}
+        if not self.backend.update(table, key, changes):
+            return False
+        row.update(changes)
+        self._commit_undelete(table, row, changes, previous)
+        return True
+    
+    def get_deleted(self, table: str) -> pd.DataFrame:
+        """
+        Get the soft-deleted rows of a table that can still be restored
+        
+        Args:
+            table: Table name ("students" or "tutors")
+            
+        Returns:
+            DataFrame with the tombstones, most recently deleted first
+        """
+        try:
+            df = self.backend.load(table)
+            return df[deleted_mask(df)].sort_values(DELETED_COLUMN, ascending=False)
+        except Exception as e:
+            logger.error(f"Error reading deleted {table}: {str(e)}")
+            return pd.DataFrame()
+    
+    def vacuum(self, retention_seconds: float = TOMBSTONE_RETENTION_SECONDS) -> Dict[str, int]:
+        """
+        Physically remove tombstones past their retention, one write per table
+        Runs when a manager is created at most once per VACUUM_INTERVAL_SECONDS
+        (recorded in the metadata file); the Excel backend also drops them
+        whenever it compacts its journal
+        
+        Args:
+            retention_seconds: How long deleted rows stay restorable
+            
+        Returns:
+            Table name -> number of removed rows
+        """
+        before = tombstone_cutoff(retention_seconds)
+        removed = {}
+        for table in TABLE_KEYS:
+            try:
+                with self.backend.lock(table):
+                    removed[table] = self.backend.purge_deleted(table, before)
+            except Exception as e:
+                logger.warning(f"Could not vacuum {table}: {str(e)}")
+                removed[table] = 0
+        
+        self.metadata.update(vacuumed_at=datetime.now().isoformat(timespec="seconds"))
+        if any(removed.values()):
+            logger.info(f"Vacuumed {removed['students']} students and {removed['tutors']} tutors")
+        return removed
+    
+    # ==================== ID SEQUENCES ====================
+    
+    def _allocate_ids(self, table: str, count: int = 1) -> List[str]:
+        """
+        Allocate new primary keys from the table's sequence
+        A sequence not stored yet starts after the highest existing ID
+        
+        Args:
+            table: Table name
+            count: Number of IDs to reserve
+            
+        Returns:
+            New IDs in ascending order
+        """
+        key = TABLE_KEYS[table]
+        # Tombstones keep their IDs until vacuumed, so they count too
+        seed = lambda: max_id_number(table, self.backend.load(table, [key])[key])
+        return [format_id(table, number) for number in self.sequences.reserve(table, count, seed)]
+    
+    def reserve_ids(self, table: str, count: int) -> List[str]:
+        """
+        Reserve a block of IDs, e.g. for a bulk import
+        Reserved IDs are never handed out again, even if left unused
+        
+        Args:
+            table: Table name ("students" or "tutors")
+            count: Number of IDs to reserve
+            
+        Returns:
+            Reserved IDs in ascending order
+        """
+        return self._allocate_ids(table, count)
+    
+    # ==================== BULK UPDATES ====================
+    
+    def _update_bulk(self, table: str, changes: Mapping[str, Dict], label: str,
+                     expected_versions: Optional[Mapping[str, int]] = None) -> Dict[str, Tuple[bool, str]]:
+        """
+        Update many rows of a table with a single storage write
+        
+        Args:
+            table: Table name
+            changes: Primary key -> {column: new value}
+            label: Record name used in result messages ("Student", "Tutor")
+            expected_versions: Primary key -> Row_Version the changes are based on;
+                               rows that moved on since are left unchanged
+            
+        Returns:
+            Primary key -> (success: bool, message: str)
+        """
+        changes = dict(changes)
+        if not changes:
+            return {}
+        
+        try:
+            with self.backend.lock(table):
+                previous = self._entry(table).signature
+                writable, conflicts = self._versioned(table, changes, expected_versions)
+                found = self.backend.update_many(table, writable) if writable else {}
+                updated = {key: row_changes for key, row_changes in writable.items() if found.get(key)}
+                if updated:
+                    self._commit_updates(table, updated, previous)
+            
+        except Exception as e:
+            logger.error(f"Error bulk updating {table}: {str(e)}")
+            return {key: (False, str(e)) for key in changes}
+        
+        results = {}
+        for key in changes:
+            if key in conflicts:
+                results[key] = (False, self._conflict_message(label, key, conflicts[key], expected_versions[key]))
+            elif key in updated:
+                results[key] = (True, f"{label} updated successfully")
+            else:
+                results[key] = (False, f"{label} not found")
+        logger.info(f"Bulk updated {len(updated)} of {len(changes)} {table}")
+        return results
     
     # ==================== STUDENT OPERATIONS ====================
     
+    @staticmethod
+    def _student_record(registration_id: str, student_data: Dict) -> Dict:
+        """
+        Build a new student row from registration form data
+        
+        Args:
+            registration_id: Allocated registration ID
+            student_data: Dictionary containing student information
+            
+        Returns:
+            Row with every student column, status Pending
+        """
+        return {
+            "Registration_ID": registration_id,
+            "Name": student_data.get("name", ""),
+            "Email": student_data.get("email", "").lower(),
+            "Age": student_data.get("age", 0),
+            "Language": student_data.get("language", ""),
+            "Preferred_Tutor": student_data.get("preferred_tutor", ""),
+            "Scheduled_Time": student_data.get("scheduled_time", ""),
+            "Session_Interval": student_data.get("session_interval", ""),
+            "Payment_Option": student_data.get("payment_option", ""),
+            "Registration_Date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "Status": "Pending",
+            "Assigned_Tutor": student_data.get("preferred_tutor", ""),
+            "Google_Meet_Link": "",
+            "Payment_Status": "Pending",
+            "Payment_Date": "",
+            "Notes": "",
+            "Row_Version": 1
+        }
+    
     def add_student(self, student_data: Dict) -> Tuple[bool, str]:
         """
         Add new student to database
@@ -181,66 +1243,108 @@ class DatabaseManager:
             Tuple of (success: bool, message/registration_id: str)
         """
         try:
-            df = pd.read_excel(STUDENTS_DB, engine='openpyxl')
+            with self.backend.lock("students"):
+                # Generate Registration ID
+                new_id = self._allocate_ids("students")[0]
+                
+                # Prepare student record
+                new_student = self._student_record(new_id, student_data)
+                
+                previous = self.backend.signature("students")
+                self.backend.insert("students", [new_student])
+                self._commit_insert("students", [new_student], previous)
+                
+            logger.info(f"Student added successfully: {new_id}")
+            return True, new_id
+            
+        except Exception as e:
+            logger.error(f"Error adding student: {str(e)}")
+            return False, str(e)
+    
+    def import_students(self, source: Path, chunk_size: int = BULK_IMPORT_CHUNK_SIZE,
+                        report_path: Optional[Path] = None) -> Tuple[bool, Dict]:
+        """
+        Bulk import student registrations from a CSV or XLSX file
+        
+        The file is streamed in chunks and validated against VALIDATION_RULES
+        (emails already registered are rejected as duplicates); valid rows get a block of registration IDs and are added in a single
+        write, rejected rows are written to a CSV report with the reasons
+        
+        Args:
+            source: CSV or XLSX file with one registration per row
+            chunk_size: Rows read per chunk
+            report_path: Rejected-rows report (default: <source>_rejected.csv)
+            
+        Returns:
+            Tuple of (success: bool, summary with total, imported, rejected,
+            first_id, last_id and report, or error on failure)
+        """
+        source = Path(source)
+        
+        try:
+            accepted, rejected = [], []
+            # Emails of existing students count as already seen
+            emails = self._projected("students", ["Email"])["Email"]
+            seen_emails = set(emails.dropna().astype(str).str.strip().str.lower())
+            total = 0
             
-            # Generate Registration ID
-            if len(df) > 0 and 'Registration_ID' in df.columns:
-                last_id = df["Registration_ID"].max()
-                if pd.notna(last_id):
-                    new_id_num = int(last_id.replace('REG', '')) + 1
-                    new_id = f"REG{new_id_num:04d}"
-                else:
-                    new_id = "REG0001"
-            else:
-                new_id = "REG0001"
-            
-            # Prepare student record
-            new_student = {
-                "Registration_ID": new_id,
-                "Name": student_data.get("name", ""),
-                "Email": student_data.get("email", "").lower(),
-                "Age": student_data.get("age", 0),
-                "Language": student_data.get("language", ""),
-                "Preferred_Tutor": student_data.get("preferred_tutor", ""),
-                "Scheduled_Time": student_data.get("scheduled_time", ""),
-                "Session_Interval": student_data.get("session_interval", ""),
-                "Payment_Option": student_data.get("payment_option", ""),
-                "Registration_Date": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "Status": "Pending",
-                "Assigned_Tutor": student_data.get("preferred_tutor", ""),
-                "Google_Meet_Link": "",
-                "Payment_Status": "Pending",
-                "Payment_Date": "",
-                "Notes": ""
-            }
+            for chunk in read_chunks(source, chunk_size):
+                total += len(chunk)
+                valid, invalid = validate_students(chunk, seen_emails)
+                accepted.append(valid)
+                if len(invalid) > 0:
+                    rejected.append(invalid)
             
-            # Append to dataframe
-            df = pd.concat([df, pd.DataFrame([new_student])], ignore_index=True)
-            df.to_excel(STUDENTS_DB, index=False, engine='openpyxl')
+            rows = pd.concat(accepted).rename(columns=IMPORT_FIELDS).to_dict("records") if accepted else []
             
-            logger.info(f"Student added successfully: {new_id}")
-            return True, new_id
+            new_ids = []
+            if rows:
+                with self.backend.lock("students"):
+                    new_ids = self._allocate_ids("students", len(rows))
+                    records = [self._student_record(new_id, row) for new_id, row in zip(new_ids, rows)]
+                    previous = self.backend.signature("students")
+                    self.backend.insert("students", records)
+                    self._commit_insert("students", records, previous)
+            
+            report = None
+            if rejected:
+                report = Path(report_path) if report_path else source.with_name(f"{source.stem}_rejected.csv")
+                write_report(pd.concat(rejected), report)
+            
+            summary = {
+                "total": total,
+                "imported": len(new_ids),
+                "rejected": total - len(new_ids),
+                "first_id": new_ids[0] if new_ids else None,
+                "last_id": new_ids[-1] if new_ids else None,
+                "report": str(report) if report else None,
+            }
+            logger.info(f"Imported {len(new_ids)} of {total} students from {source}")
+            return True, summary
             
         except Exception as e:
-            logger.error(f"Error adding student: {str(e)}")
-            return False, str(e)
+            logger.error(f"Error importing students from {source}: {str(e)}")
+            return False, {"error": str(e)}
     
-    def get_all_students(self) -> pd.DataFrame:
+    def get_all_students(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Get all students from database
         
+        Args:
+            columns: Optional subset of columns to load
+            
         Returns:
             DataFrame containing all students
         """
         try:
-            df = pd.read_excel(STUDENTS_DB, engine='openpyxl')
+            df = self._projected("students", columns)
             logger.info(f"Retrieved {len(df)} students from database")
             return df
         except Exception as e:
             logger.error(f"Error reading students database: {str(e)}")
             return pd.DataFrame()
     
-    def get_student_by_id(self, registration_id: str) -> Optional[pd.Series]:
+    def get_student_by_id(self, registration_id: str) -> Optional[Student]:
         """
         Get student by registration ID
         
@@ -248,20 +1352,121 @@ class DatabaseManager:
             registration_id: Student's registration ID
             
         Returns:
-            Series containing student data or None
+            Student record or None
         """
         try:
-            df = pd.read_excel(STUDENTS_DB, engine='openpyxl')
-            student = df[df["Registration_ID"] == registration_id]
-            
-            if len(student) > 0:
-                return student.iloc[0]
-            return None
+            return self._record("students", "Registration_ID", registration_id)
             
         except Exception as e:
             logger.error(f"Error getting student {registration_id}: {str(e)}")
             return None
     
+    def query_students(self, status: Optional[Union[str, List[str]]] = None,
+                       language: Optional[Union[str, List[str]]] = None,
+                       tutor: Optional[Union[str, List[str]]] = None,
+                       columns: Optional[List[str]] = None, order_by: Optional[str] = None,
+                       descending: bool = False, limit: Optional[int] = None,
+                       offset: int = 0) -> pd.DataFrame:
+        """
+        Query students with filtering, sorting and column selection done in storage
+        
+        Each filter takes a single value or a list of allowed values and is
+        skipped when None
+        
+        Args:
+            status: Status to filter by (Pending, Approved, Rejected)
+            language: Language to filter by
+            tutor: Assigned tutor name to filter by
+            columns: Columns to return (default: all columns)
+            order_by: Column to sort by (default: registration order)
+            descending: Sort in descending order
+            limit: Maximum number of students to return
+            offset: Number of matching students to skip (offset paging)
+            
+        Returns:
+            DataFrame containing matching students
+        """
+        filters = {"Status": status, "Language": language, "Assigned_Tutor": tutor}
+        return self._query("students", filters, columns, order_by, descending, limit, offset)
+    
+    def count_students(self, status: Optional[Union[str, List[str]]] = None,
+                       language: Optional[Union[str, List[str]]] = None,
+                       tutor: Optional[Union[str, List[str]]] = None) -> int:
+        """
+        Count students matching the same filters as query_students
+        
+        Returns:
+            Number of matching students
+        """
+        try:
+            return self._count("students", {"Status": status, "Language": language, "Assigned_Tutor": tutor})
+        except Exception as e:
+            logger.error(f"Error counting students: {str(e)}")
+            return 0
+    
+    def get_students_page(self, page: int = 1, page_size: int = PAGE_SIZE,
+                          status: Optional[Union[str, List[str]]] = None,
+                          language: Optional[Union[str, List[str]]] = None,
+                          tutor: Optional[Union[str, List[str]]] = None,
+                          columns: Optional[List[str]] = None, order_by: Optional[str] = None,
+                          descending: bool = False) -> Tuple[pd.DataFrame, int]:
+        """
+        Get one page of students by page number (offset/limit)
+        
+        Args:
+            page: Page number, starting at 1
+            page_size: Students per page
+            status, language, tutor: Filters as in query_students
+            columns: Columns to return (default: all columns)
+            order_by: Column to sort by (default: registration order)
+            descending: Sort in descending order
+            
+        Returns:
+            Tuple of (students on the page, total matching students)
+        """
+        try:
+            total = self.count_students(status, language, tutor)
+            students = self.query_students(
+                status, language, tutor, columns, order_by, descending,
+                limit=page_size, offset=(max(page, 1) - 1) * page_size
+            )
+            return students, total
+        except Exception as e:
+            logger.error(f"Error reading students page {page}: {str(e)}")
+            return pd.DataFrame(), 0
+    
+    def get_students_after(self, cursor: Optional[Tuple] = None, page_size: int = PAGE_SIZE,
+                           order_by: str = "Registration_ID", descending: bool = False,
+                           status: Optional[Union[str, List[str]]] = None,
+                           language: Optional[Union[str, List[str]]] = None,
+                           tutor: Optional[Union[str, List[str]]] = None,
+                           columns: Optional[List[str]] = None) -> Tuple[pd.DataFrame, Optional[Tuple]]:
+        """
+        Get the next page of students after a keyset cursor
+        Each page costs the same however deep it is, and students added
+        meanwhile don't shift the following pages
+        
+        Args:
+            cursor: Cursor returned with the previous page (None for the first page)
+            page_size: Students per page
+            order_by: "Registration_ID" or "Registration_Date"
+            descending: Page from newest to oldest
+            status, language, tutor: Filters as in query_students
+            columns: Columns to return (default: all columns)
+            
+        Returns:
+            Tuple of (students on the page, cursor of the next page or None after the last page)
+        """
+        if order_by not in KEYSET_COLUMNS:
+            raise ValueError(f"Keyset paging is only supported on {', '.join(KEYSET_COLUMNS)}")
+        
+        try:
+            filters = {"Status": status, "Language": language, "Assigned_Tutor": tutor}
+            return self._seek("students", filters, order_by, cursor, page_size, descending, columns)
+        except Exception as e:
+            logger.error(f"Error reading students after {cursor}: {str(e)}")
+            return pd.DataFrame(), None
+    
     def get_students_by_status(self, status: str) -> pd.DataFrame:
         """
         Get students filtered by status
@@ -273,8 +1478,7 @@ class DatabaseManager:
             DataFrame containing filtered students
         """
         try:
-            df = pd.read_excel(STUDENTS_DB, engine='openpyxl')
-            filtered = df[df["Status"] == status]
+            filtered = self.query_students(status=status)
             logger.info(f"Retrieved {len(filtered)} students with status '{status}'")
             return filtered
         except Exception as e:
@@ -292,8 +1496,7 @@ class DatabaseManager:
             DataFrame containing filtered students
         """
         try:
-            df = pd.read_excel(STUDENTS_DB, engine='openpyxl')
-            filtered = df[df["Language"] == language]
+            filtered = self.query_students(language=language)
             logger.info(f"Retrieved {len(filtered)} students learning '{language}'")
             return filtered
         except Exception as e:
@@ -311,35 +1514,49 @@ class DatabaseManager:
             DataFrame containing students assigned to this tutor
         """
         try:
-            df = pd.read_excel(STUDENTS_DB, engine='openpyxl')
-            filtered = df[df["Assigned_Tutor"] == tutor_name]
+            filtered = self.query_students(tutor=tutor_name)
             logger.info(f"Retrieved {len(filtered)} students for tutor '{tutor_name}'")
             return filtered
         except Exception as e:
             logger.error(f"Error filtering students by tutor: {str(e)}")
             return pd.DataFrame()
     
-    def update_student(self, registration_id: str, update_data: Dict) -> Tuple[bool, str]:
+    def update_student(self, registration_id: str, update_data: Dict,
+                       expected_version: Optional[int] = None) -> Tuple[bool, str]:
         """
         Update student record
         
+        With expected_version the update only goes through if the row is still
+        at that version (compare-and-swap), so changes made from a stale copy
+        never overwrite newer ones
+        
         Args:
             registration_id: Student's registration ID
             update_data: Dictionary with fields to update
+            expected_version: Row_Version of the copy the changes are based on
             
         Returns:
-            Tuple of (success: bool, message: str)
+            Tuple of (success: bool, message: str); the message starts with
+            "Conflict:" when the row was changed since that version
         """
         try:
-            df = pd.read_excel(STUDENTS_DB, engine='openpyxl')
-            idx = df[df["Registration_ID"] == registration_id].index
+            with self.backend.lock("students"):
+                previous = self._entry("students").signature
+                writable, conflicts = self._versioned(
+                    "students", {registration_id: update_data}, {registration_id: expected_version}
+                )
+                found = False
+                if registration_id in writable:
+                    found = self.backend.update("students", registration_id, writable[registration_id])
+                    if found:
+                        self._commit_updates("students", writable, previous)
             
-            if len(idx) > 0:
-                for key, value in update_data.items():
-                    if key in df.columns:
-                        df.loc[idx[0], key] = value
-                
-                df.to_excel(STUDENTS_DB, index=False, engine='openpyxl')
+            if conflicts:
+                logger.warning(f"Student {registration_id} update rejected: version {conflicts[registration_id]}, "
+                               f"expected {expected_version}")
+                return False, self._conflict_message("Student", registration_id,
+                                                     conflicts[registration_id], expected_version)
+            elif found:
                 logger.info(f"Student {registration_id} updated successfully")
                 return True, "Student updated successfully"
             else:
@@ -350,9 +1567,25 @@ class DatabaseManager:
             logger.error(f"Error updating student {registration_id}: {str(e)}")
             return False, str(e)
     
+    def update_students_bulk(self, changes: Mapping[str, Dict],
+                             expected_versions: Optional[Mapping[str, int]] = None) -> Dict[str, Tuple[bool, str]]:
+        """
+        Update many student records at once (e.g. approving a batch)
+        All changes are applied in a single read/write cycle
+        
+        Args:
+            changes: Registration ID -> dictionary with fields to update
+            expected_versions: Registration ID -> Row_Version the changes are based on
+            
+        Returns:
+            Registration ID -> (success: bool, message: str)
+        """
+        return self._update_bulk("students", changes, "Student", expected_versions)
+    
     def delete_student(self, registration_id: str) -> Tuple[bool, str]:
         """
         Delete student record
+        The row is kept as a tombstone until vacuumed (see undelete_student)
         
         Args:
             registration_id: Student's registration ID
@@ -361,13 +1594,10 @@ class DatabaseManager:
             Tuple of (success: bool, message: str)
         """
         try:
-            df = pd.read_excel(STUDENTS_DB, engine='openpyxl')
-            initial_len = len(df)
+            with self.backend.lock("students"):
+                found = self._delete("students", registration_id)
             
-            df = df[df["Registration_ID"] != registration_id]
-            
-            if len(df) < initial_len:
-                df.to_excel(STUDENTS_DB, index=False, engine='openpyxl')
+            if found:
                 logger.info(f"Student {registration_id} deleted successfully")
                 return True, "Student deleted successfully"
             else:
@@ -378,27 +1608,47 @@ class DatabaseManager:
             logger.error(f"Error deleting student {registration_id}: {str(e)}")
             return False, str(e)
     
-    def search_students(self, search_term: str) -> pd.DataFrame:
+    def undelete_student(self, registration_id: str) -> Tuple[bool, str]:
         """
-        Search students by name or email
+        Restore a deleted student record (until it is vacuumed)
         
         Args:
-            search_term: Term to search for
+            registration_id: Student's registration ID
             
         Returns:
-            DataFrame containing matching students
+            Tuple of (success: bool, message: str)
         """
         try:
-            df = pd.read_excel(STUDENTS_DB, engine='openpyxl')
-            search_term = search_term.lower()
+            with self.backend.lock("students"):
+                found = self._undelete("students", registration_id)
             
-            mask = (
-                df["Name"].str.lower().str.contains(search_term, na=False) |
-                df["Email"].str.lower().str.contains(search_term, na=False) |
-                df["Registration_ID"].str.lower().str.contains(search_term, na=False)
-            )
+            if found:
+                logger.info(f"Student {registration_id} restored successfully")
+                return True, "Student restored successfully"
+            else:
+                logger.warning(f"Deleted student {registration_id} not found")
+                return False, "Deleted student not found"
+                
+        except Exception as e:
+            logger.error(f"Error restoring student {registration_id}: {str(e)}")
+            return False, str(e)
+    
+    def search_students(self, search_term: str, limit: Optional[int] = None,
+                        fuzzy: bool = False) -> pd.DataFrame:
+        """
+        Search students by name, email or registration ID
+        
+        Args:
+            search_term: Term to search for (case-insensitive substring)
+            limit: Maximum number of students to return (default: all, or 10 when fuzzy)
+            fuzzy: Tolerate typos: return the most similar students with a
+                   Match_Score column instead of exact substring matches
             
-            filtered = df[mask]
+        Returns:
+            DataFrame containing matching students, best matches first
+        """
+        try:
+            filtered = self._search("students", search_term, limit, fuzzy)
             logger.info(f"Search for '{search_term}' returned {len(filtered)} results")
             return filtered
             
@@ -419,36 +1669,29 @@ class DatabaseManager:
             Tuple of (success: bool, message/tutor_id: str)
         """
         try:
-            df = pd.read_excel(TUTORS_DB, engine='openpyxl')
-            
-            # Generate Tutor ID
-            if len(df) > 0 and 'Tutor_ID' in df.columns:
-                last_id = df["Tutor_ID"].max()
-                if pd.notna(last_id):
-                    new_id_num = int(last_id.replace('TUT', '')) + 1
-                    new_id = f"TUT{new_id_num:03d}"
-                else:
-                    new_id = "TUT001"
-            else:
-                new_id = "TUT001"
-            
-            new_tutor = {
-                "Tutor_ID": new_id,
-                "Name": tutor_data.get("name", ""),
-                "Email": tutor_data.get("email", "").lower(),
-                "Languages_Teaching": tutor_data.get("languages", ""),
-                "Available_Times": tutor_data.get("available_times", ""),
-                "Contact_Number": tutor_data.get("contact", ""),
-                "Date_Added": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                "Status": tutor_data.get("status", "Active"),
-                "Specialization": tutor_data.get("specialization", ""),
-                "Experience_Years": tutor_data.get("experience", 0),
-                "Rating": tutor_data.get("rating", 0.0)
-            }
-            
-            df = pd.concat([df, pd.DataFrame([new_tutor])], ignore_index=True)
-            df.to_excel(TUTORS_DB, index=False, engine='openpyxl')
-            
+            with self.backend.lock("tutors"):
+                # Generate Tutor ID
+                new_id = self._allocate_ids("tutors")[0]
+                
+                new_tutor = {
+                    "Tutor_ID": new_id,
+                    "Name": tutor_data.get("name", ""),
+                    "Email": tutor_data.get("email", "").lower(),
+                    "Languages_Teaching": tutor_data.get("languages", ""),
+                    "Available_Times": tutor_data.get("available_times", ""),
+                    "Contact_Number": tutor_data.get("contact", ""),
+                    "Date_Added": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    "Status": tutor_data.get("status", "Active"),
+                    "Specialization": tutor_data.get("specialization", ""),
+                    "Experience_Years": tutor_data.get("experience", 0),
+                    "Rating": tutor_data.get("rating", 0.0),
+                    "Row_Version": 1
+                }
+                
+                previous = self.backend.signature("tutors")
+                self.backend.insert("tutors", [new_tutor])
+                self._commit_insert("tutors", [new_tutor], previous)
+                
             logger.info(f"Tutor added successfully: {new_id}")
             return True, new_id
             
@@ -456,22 +1699,44 @@ class DatabaseManager:
             logger.error(f"Error adding tutor: {str(e)}")
             return False, str(e)
     
-    def get_all_tutors(self) -> pd.DataFrame:
+    def get_all_tutors(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         Get all tutors from database
         
+        Args:
+            columns: Optional subset of columns to load
+            
         Returns:
             DataFrame containing all tutors
         """
         try:
-            df = pd.read_excel(TUTORS_DB, engine='openpyxl')
+            df = self._projected("tutors", columns)
             logger.info(f"Retrieved {len(df)} tutors from database")
             return df
         except Exception as e:
             logger.error(f"Error reading tutors database: {str(e)}")
             return pd.DataFrame()
     
-    def get_tutor_by_id(self, tutor_id: str) -> Optional[pd.Series]:
+    def query_tutors(self, status: Optional[Union[str, List[str]]] = None,
+                     columns: Optional[List[str]] = None, order_by: Optional[str] = None,
+                     descending: bool = False,
+                     limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        Query tutors with filtering, sorting and column selection done in storage
+        
+        Args:
+            status: Status (or list of statuses) to filter by, None for all
+            columns: Columns to return (default: all columns)
+            order_by: Column to sort by (default: storage order)
+            descending: Sort in descending order
+            limit: Maximum number of tutors to return
+            
+        Returns:
+            DataFrame containing matching tutors
+        """
+        return self._query("tutors", {"Status": status}, columns, order_by, descending, limit)
+    
+    def get_tutor_by_id(self, tutor_id: str) -> Optional[Tutor]:
         """
         Get tutor by ID
         
@@ -479,21 +1744,16 @@ class DatabaseManager:
             tutor_id: Tutor's ID
             
         Returns:
-            Series containing tutor data or None
+            Tutor record or None
         """
         try:
-            df = pd.read_excel(TUTORS_DB, engine='openpyxl')
-            tutor = df[df["Tutor_ID"] == tutor_id]
-            
-            if len(tutor) > 0:
-                return tutor.iloc[0]
-            return None
+            return self._record("tutors", "Tutor_ID", tutor_id)
             
         except Exception as e:
             logger.error(f"Error getting tutor {tutor_id}: {str(e)}")
             return None
     
-    def get_tutor_by_email(self, email: str) -> Optional[pd.Series]:
+    def get_tutor_by_email(self, email: str) -> Optional[Tutor]:
         """
         Get tutor by email address
         
@@ -501,21 +1761,16 @@ class DatabaseManager:
             email: Tutor's email address
             
         Returns:
-            Series containing tutor data or None
+            Tutor record or None
         """
         try:
-            df = pd.read_excel(TUTORS_DB, engine='openpyxl')
-            tutor = df[df["Email"].str.lower() == email.lower()]
-            
-            if len(tutor) > 0:
-                return tutor.iloc[0]
-            return None
+            return self._record("tutors", "Email", email)
             
         except Exception as e:
             logger.error(f"Error getting tutor by email {email}: {str(e)}")
             return None
     
-    def get_tutor_by_name(self, name: str) -> Optional[pd.Series]:
+    def get_tutor_by_name(self, name: str) -> Optional[Tutor]:
         """
         Get tutor by name
         
@@ -523,23 +1778,43 @@ class DatabaseManager:
             name: Tutor's name
             
         Returns:
-            Series containing tutor data or None
+            Tutor record or None
         """
         try:
-            df = pd.read_excel(TUTORS_DB, engine='openpyxl')
-            tutor = df[df["Name"] == name]
-            
-            if len(tutor) > 0:
-                return tutor.iloc[0]
-            return None
+            return self._record("tutors", "Name", name)
             
         except Exception as e:
             logger.error(f"Error getting tutor by name {name}: {str(e)}")
             return None
     
+    def search_tutors(self, search_term: str, limit: Optional[int] = None,
+                      fuzzy: bool = False) -> pd.DataFrame:
+        """
+        Search tutors by name, email or tutor ID
+        
+        Args:
+            search_term: Term to search for (case-insensitive substring)
+            limit: Maximum number of tutors to return (default: all, or 10 when fuzzy)
+            fuzzy: Tolerate typos: return the most similar tutors with a
+                   Match_Score column instead of exact substring matches
+            
+        Returns:
+            DataFrame containing matching tutors, best matches first
+        """
+        try:
+            filtered = self._search("tutors", search_term, limit, fuzzy)
+            logger.info(f"Tutor search for '{search_term}' returned {len(filtered)} results")
+            return filtered
+            
+        except Exception as e:
+            logger.error(f"Error searching tutors: {str(e)}")
+            return pd.DataFrame()
+    
     def get_tutors_by_language(self, language: str) -> pd.DataFrame:
         """
         Get tutors who teach a specific language
+        Looked up in the language -> tutor index, matching whole language
+        names (case-insensitive) rather than substrings
         
         Args:
             language: Language to filter by
@@ -548,8 +1823,7 @@ class DatabaseManager:
             DataFrame containing matching tutors
         """
         try:
-            df = pd.read_excel(TUTORS_DB, engine='openpyxl')
-            filtered = df[df["Languages_Teaching"].str.contains(language, na=False, case=False)]
+            filtered = self._lookup("tutors", "Languages_Teaching", language)
             logger.info(f"Retrieved {len(filtered)} tutors teaching '{language}'")
             return filtered
         except Exception as e:
@@ -564,35 +1838,44 @@ class DatabaseManager:
             DataFrame containing active tutors
         """
         try:
-            df = pd.read_excel(TUTORS_DB, engine='openpyxl')
-            filtered = df[df["Status"] == "Active"]
+            filtered = self.query_tutors(status="Active")
             logger.info(f"Retrieved {len(filtered)} active tutors")
             return filtered
         except Exception as e:
             logger.error(f"Error getting active tutors: {str(e)}")
             return pd.DataFrame()
     
-    def update_tutor(self, tutor_id: str, update_data: Dict) -> Tuple[bool, str]:
+    def update_tutor(self, tutor_id: str, update_data: Dict,
+                     expected_version: Optional[int] = None) -> Tuple[bool, str]:
         """
         Update tutor record
         
+        With expected_version the update only goes through if the row is still
+        at that version (see update_student)
+        
         Args:
             tutor_id: Tutor's ID
             update_data: Dictionary with fields to update
+            expected_version: Row_Version of the copy the changes are based on
             
         Returns:
             Tuple of (success: bool, message: str)
         """
         try:
-            df = pd.read_excel(TUTORS_DB, engine='openpyxl')
-            idx = df[df["Tutor_ID"] == tutor_id].index
+            with self.backend.lock("tutors"):
+                previous = self._entry("tutors").signature
+                writable, conflicts = self._versioned("tutors", {tutor_id: update_data}, {tutor_id: expected_version})
+                found = False
+                if tutor_id in writable:
+                    found = self.backend.update("tutors", tutor_id, writable[tutor_id])
+                    if found:
+                        self._commit_updates("tutors", writable, previous)
             
-            if len(idx) > 0:
-                for key, value in update_data.items():
-                    if key in df.columns:
-                        df.loc[idx[0], key] = value
-                
-                df.to_excel(TUTORS_DB, index=False, engine='openpyxl')
+            if conflicts:
+                logger.warning(f"Tutor {tutor_id} update rejected: version {conflicts[tutor_id]}, "
+                               f"expected {expected_version}")
+                return False, self._conflict_message("Tutor", tutor_id, conflicts[tutor_id], expected_version)
+            elif found:
                 logger.info(f"Tutor {tutor_id} updated successfully")
                 return True, "Tutor updated successfully"
             else:
@@ -603,9 +1886,25 @@ class DatabaseManager:
             logger.error(f"Error updating tutor {tutor_id}: {str(e)}")
             return False, str(e)
     
+    def update_tutors_bulk(self, changes: Mapping[str, Dict],
+                           expected_versions: Optional[Mapping[str, int]] = None) -> Dict[str, Tuple[bool, str]]:
+        """
+        Update many tutor records at once
+        All changes are applied in a single read/write cycle
+        
+        Args:
+            changes: Tutor ID -> dictionary with fields to update
+            expected_versions: Tutor ID -> Row_Version the changes are based on
+            
+        Returns:
+            Tutor ID -> (success: bool, message: str)
+        """
+        return self._update_bulk("tutors", changes, "Tutor", expected_versions)
+    
     def delete_tutor(self, tutor_id: str) -> Tuple[bool, str]:
         """
         Delete tutor record
+        The row is kept as a tombstone until vacuumed (see undelete_tutor)
         
         Args:
             tutor_id: Tutor's ID
@@ -614,13 +1913,10 @@ class DatabaseManager:
             Tuple of (success: bool, message: str)
         """
         try:
-            df = pd.read_excel(TUTORS_DB, engine='openpyxl')
-            initial_len = len(df)
-            
-            df = df[df["Tutor_ID"] != tutor_id]
+            with self.backend.lock("tutors"):
+                found = self._delete("tutors", tutor_id)
             
-            if len(df) < initial_len:
-                df.to_excel(TUTORS_DB, index=False, engine='openpyxl')
+            if found:
                 logger.info(f"Tutor {tutor_id} deleted successfully")
                 return True, "Tutor deleted successfully"
             else:
@@ -631,28 +1927,81 @@ class DatabaseManager:
             logger.error(f"Error deleting tutor {tutor_id}: {str(e)}")
             return False, str(e)
     
+    def undelete_tutor(self, tutor_id: str) -> Tuple[bool, str]:
+        """
+        Restore a deleted tutor record (until it is vacuumed)
+        
+        Args:
+            tutor_id: Tutor's ID
+            
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        try:
+            with self.backend.lock("tutors"):
+                found = self._undelete("tutors", tutor_id)
+            
+            if found:
+                logger.info(f"Tutor {tutor_id} restored successfully")
+                return True, "Tutor restored successfully"
+            else:
+                logger.warning(f"Deleted tutor {tutor_id} not found")
+                return False, "Deleted tutor not found"
+                
+        except Exception as e:
+            logger.error(f"Error restoring tutor {tutor_id}: {str(e)}")
+            return False, str(e)
+    
     # ==================== STATISTICS & ANALYTICS ====================
     
+    def _table_statistics(self, table: str) -> Dict:
+        """
+        Get the materialized counts of a table (see utils.statistics)
+        Only when they don't match the stored table (written by another process,
+        replaced) is the table loaded, which recounts them
+        
+        Args:
+            table: Table name
+            
+        Returns:
+            Dictionary with total and counts (column -> value -> rows)
+        """
+        state = self.statistics.get(table, self.backend.signature(table))
+        if state is None:
+            entry = self._entry(table)
+            state = (self.statistics.get(table, entry.signature)
+                     or self.statistics.rebuild(table, entry.frame, entry.signature))
+        self.statistics.save()
+        return state
+    
+    @staticmethod
+    def _by_count(counts: Dict[str, int]) -> Dict[str, int]:
+        """Order value counts from the most to the least frequent value"""
+        return dict(sorted(counts.items(), key=lambda item: item[1], reverse=True))
+    
     def get_statistics(self) -> Dict:
         """
         Get comprehensive statistics
+        Read from counts maintained on every write, without loading row data
         
         Returns:
             Dictionary containing various statistics
         """
         try:
-            students_df = self.get_all_students()
-            tutors_df = self.get_all_tutors()
+            students = self._table_statistics("students")
+            tutors = self._table_statistics("tutors")
+            student_status = students["counts"]["Status"]
             
             stats = {
-                "total_students": len(students_df),
-                "pending_students": len(students_df[students_df["Status"] == "Pending"]),
-                "approved_students": len(students_df[students_df["Status"] == "Approved"]),
-                "rejected_students": len(students_df[students_df["Status"] == "Rejected"]),
-                "total_tutors": len(tutors_df),
-                "active_tutors": len(tutors_df[tutors_df["Status"] == "Active"]),
-                "languages_distribution": students_df["Language"].value_counts().to_dict() if len(students_df) > 0 else {},
-                "payment_methods": students_df["Payment_Option"].value_counts().to_dict() if len(students_df) > 0 else {},
+                "total_students": students["total"],
+                "pending_students": student_status.get("Pending", 0),
+                "approved_students": student_status.get("Approved", 0),
+                "rejected_students": student_status.get("Rejected", 0),
+                "total_tutors": tutors["total"],
+                "active_tutors": tutors["counts"]["Status"].get("Active", 0),
+                "status_distribution": self._by_count(student_status),
+                "languages_distribution": self._by_count(students["counts"]["Language"]),
+                "payment_methods": self._by_count(students["counts"]["Payment_Option"]),
             }
             
             logger.info("Statistics generated successfully")
@@ -662,9 +2011,52 @@ class DatabaseManager:
             logger.error(f"Error generating statistics: {str(e)}")
             return {}
     
+    def _registration_rollups(self) -> Dict:
+        """
+        Get the registration rollups (see utils.analytics)
+        Only when they don't match the stored students table is it loaded,
+        which rebuilds them
+        """
+        state = self.rollups.get(self.backend.signature("students"))
+        if state is None:
+            entry = self._entry("students")
+            state = self.rollups.get(entry.signature) or self.rollups.rebuild(entry.frame, entry.signature)
+        self.rollups.save()
+        return state
+    
+    def get_registration_counts(self, start: Union[str, date, datetime], end: Union[str, date, datetime],
+                                period: str = "day", by: Optional[str] = None) -> pd.DataFrame:
+        """
+        Count student registrations per period, from the maintained rollups
+        
+        Args:
+            start: First moment counted (datetime, date or "YYYY-MM-DD[ HH:MM:SS]")
+            end: Last moment counted (inclusive); a date without a time
+                 ("YYYY-MM-DD" or a date) counts that whole day
+            period: "hour", "day", "week" or "month"
+            by: "Language", "Payment_Option" or "Status" to break counts down by,
+                or None for totals
+            
+        Returns:
+            DataFrame indexed by period start, with a Registrations column or
+            one column per value of `by` (empty on error)
+        """
+        try:
+            return query_rollups(self._registration_rollups(), start, end, period, by)
+        except Exception as e:
+            logger.error(f"Error counting registrations: {str(e)}")
+            return pd.DataFrame()
+    
+    def _sidecar_files(self) -> List[Path]:
+        """Get the data files kept beside the tables (ID sequences, schema metadata)"""
+        return [self.sequences.path, self.metadata.path]
+    
     def backup_database(self, backup_dir: Optional[Path] = None) -> Tuple[bool, str]:
         """
-        Create backup of databases
+        Create an incremental backup of the databases
+        Copies the stored files (not a re-export) into the backup store, which
+        keeps only chunks not stored by earlier backups, then prunes backups
+        outside BACKUP_RETENTION
         
         Args:
             backup_dir: Directory to store backups (default: data/backups)
@@ -673,28 +2065,222 @@ class DatabaseManager:
             Tuple of (success: bool, message: str)
         """
         try:
-            if backup_dir is None:
-                backup_dir = DATA_DIR / "backups"
+            store = BackupStore(backup_dir if backup_dir is not None else BACKUP_DIR)
+            
+            with tempfile.TemporaryDirectory() as staging:
+                files = self.backend.backup_files(Path(staging))
+                for path in self._sidecar_files():
+                    if path.exists():
+                        files.append(Path(shutil.copy2(path, Path(staging) / path.name)))
+                manifest = store.create(files)
+            
+            pruned = store.prune()
+            
+            message = (f"Backup {manifest['id']} created at {store.root} "
+                       f"({manifest['new_chunks']} new chunks, {manifest['new_bytes']:,} bytes written)")
+            if pruned:
+                message += f", {len(pruned)} old backups pruned"
+            logger.info(message)
+            return True, message
+            
+        except Exception as e:
+            logger.error(f"Error creating backup: {str(e)}")
+            return False, str(e)
+    
+    def list_backups(self, backup_dir: Optional[Path] = None) -> List[Dict]:
+        """
+        List the stored backups
+        
+        Returns:
+            Backup manifests, newest first
+        """
+        return BackupStore(backup_dir if backup_dir is not None else BACKUP_DIR).list()
+    
+    def verify_backups(self, backup_id: Optional[str] = None,
+                       backup_dir: Optional[Path] = None) -> Dict[str, List[str]]:
+        """
+        Check the integrity of stored backups
+        
+        Args:
+            backup_id: Backup to check (default: all backups)
+            backup_dir: Backup directory (default: data/backups)
             
-            backup_dir.mkdir(parents=True, exist_ok=True)
+        Returns:
+            Backup ID -> problems found (empty lists for intact backups)
+        """
+        return BackupStore(backup_dir if backup_dir is not None else BACKUP_DIR).verify(backup_id)
+    
+    def restore_backup(self, backup_id: str, backup_dir: Optional[Path] = None) -> Tuple[bool, str]:
+        """
+        Restore the databases from a backup
+        The backup is rebuilt and verified in a staging directory before any
+        stored file is replaced. ID sequences never move backwards, so IDs
+        handed out after the backup are not reused.
+        
+        Args:
+            backup_id: Backup to restore
+            backup_dir: Backup directory (default: data/backups)
             
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        try:
+            store = BackupStore(backup_dir if backup_dir is not None else BACKUP_DIR)
             
-            # Backup students
-            students_backup = backup_dir / f"students_backup_{timestamp}.xlsx"
-            students_df = pd.read_excel(STUDENTS_DB, engine='openpyxl')
-            students_df.to_excel(students_backup, index=False, engine='openpyxl')
+            with tempfile.TemporaryDirectory() as staging:
+                store.restore(backup_id, Path(staging))
+                self.backend.restore_files(Path(staging))
+                
+                restored_metadata = Path(staging) / self.metadata.path.name
+                if restored_metadata.exists():
+                    with self.metadata.lock:
+                        self.metadata.write(json.loads(restored_metadata.read_text(encoding="utf-8")))
+                
+                restored_sequences = Path(staging) / self.sequences.path.name
+                if restored_sequences.exists():
+                    for name, value in json.loads(restored_sequences.read_text(encoding="utf-8")).items():
+                        self.sequences.advance(name, int(value))
             
-            # Backup tutors
-            tutors_backup = backup_dir / f"tutors_backup_{timestamp}.xlsx"
-            tutors_df = pd.read_excel(TUTORS_DB, engine='openpyxl')
-            tutors_df.to_excel(tutors_backup, index=False, engine='openpyxl')
+            migrate(self.backend, self.metadata)
+            for table in TABLE_KEYS:
+                with self.backend.lock(table):
+                    self._commit_replace(table)
             
-            logger.info(f"Backup created successfully at {backup_dir}")
-            return True, f"Backup created at {backup_dir}"
+            logger.info(f"Restored backup {backup_id}")
+            return True, f"Backup {backup_id} restored"
             
         except Exception as e:
-            logger.error(f"Error creating backup: {str(e)}")
+            logger.error(f"Error restoring backup {backup_id}: {str(e)}")
+            return False, str(e)
+    
+    # ==================== HISTORY ====================
+    
+    def get_history_start(self, table: str) -> Optional[datetime]:
+        """Get the earliest moment a table can be read or restored as of"""
+        return self.changelog.earliest(table)
+    
+    def get_table_as_of(self, table: str, timestamp: Union[str, datetime]) -> pd.DataFrame:
+        """
+        Get a table as it was at a past moment (read-only)
+        Rebuilt from the nearest earlier checkpoint and the change log
+        
+        Args:
+            table: Table name ("students" or "tutors")
+            timestamp: Moment to read (datetime or "YYYY-MM-DD HH:MM:SS")
+            
+        Returns:
+            DataFrame with the table content at that moment (empty on error)
+        """
+        try:
+            df = apply_schema(live_rows(self.changelog.as_of(table, timestamp, TABLE_KEYS[table])), table)
+            logger.info(f"Rebuilt {table} as of {timestamp}: {len(df)} rows")
+            return df
+        except Exception as e:
+            logger.error(f"Error reading {table} as of {timestamp}: {str(e)}")
+            return pd.DataFrame()
+    
+    def restore_table_as_of(self, table: str, timestamp: Union[str, datetime]) -> Tuple[bool, str]:
+        """
+        Point-in-time restore: put a table back to its content at a past moment
+        The restore itself is logged, so it can be undone the same way
+        
+        Args:
+            table: Table name ("students" or "tutors")
+            timestamp: Moment to restore (datetime or "YYYY-MM-DD HH:MM:SS")
+            
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        try:
+            df = self.changelog.as_of(table, timestamp, TABLE_KEYS[table])
+            with self.backend.lock(table):
+                self.backend.replace(table, df)
+                self._commit_replace(table)
+            
+            logger.info(f"Restored {table} as of {timestamp} ({len(df)} rows)")
+            return True, f"Restored {len(df)} {table} as of {timestamp}"
+            
+        except Exception as e:
+            logger.error(f"Error restoring {table} as of {timestamp}: {str(e)}")
+            return False, str(e)
+    
+    # ==================== EXCEL IMPORT & EXPORT ====================
+    
+    def export_csv(self, table: str) -> str:
+        """
+        Export a table as CSV text
+        Reads the columnar snapshot when the table is not already cached
+        
+        Args:
+            table: Table to export ("students" or "tutors")
+            
+        Returns:
+            CSV content (empty string on error)
+        """
+        try:
+            entry = self._cache.peek(self.backend.cache_key(table))
+            if entry is not None and entry.signature == self.backend.signature(table):
+                df = entry.frame
+            else:
+                snapshot = self.backend.snapshot(table)
+                df = read_snapshot(snapshot) if snapshot is not None else None
+                if df is not None:
+                    df = live_rows(df)
+                else:
+                    df = self._table(table)
+            return df.to_csv(index=False)
+            
+        except Exception as e:
+            logger.error(f"Error exporting {table} to CSV: {str(e)}")
+            return ""
+    
+    def export_to_excel(self, output_dir: Optional[Path] = None) -> Tuple[bool, str]:
+        """
+        Export students and tutors to Excel workbooks
+        
+        Args:
+            output_dir: Directory for the workbooks (default: students.xlsx/tutors.xlsx in data/)
+            
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        try:
+            exported = []
+            for table, workbook in TABLE_WORKBOOKS.items():
+                path = workbook if output_dir is None else Path(output_dir) / workbook.name
+                path.parent.mkdir(parents=True, exist_ok=True)
+                count = self.backend.export_excel(table, path)
+                exported.append(f"{count} {table} to {path}")
+            
+            logger.info(f"Exported {', '.join(exported)}")
+            return True, f"Exported {', '.join(exported)}"
+            
+        except Exception as e:
+            logger.error(f"Error exporting to Excel: {str(e)}")
+            return False, str(e)
+    
+    def import_from_excel(self, table: str, workbook: Path) -> Tuple[bool, str]:
+        """
+        Replace a table with the content of an Excel workbook
+        
+        Args:
+            table: Table to import into ("students" or "tutors")
+            workbook: Source workbook
+            
+        Returns:
+            Tuple of (success: bool, message: str)
+        """
+        try:
+            with self.backend.lock(table):
+                count = self.backend.import_excel(table, Path(workbook))
+                self._commit_replace(table)
+                key = TABLE_KEYS[table]
+                self.sequences.advance(table, max_id_number(table, self.backend.load(table, [key])[key]))
+            logger.info(f"Imported {count} {table} from {workbook}")
+            return True, f"Imported {count} {table} from {workbook}"
+            
+        except Exception as e:
+            logger.error(f"Error importing {table} from {workbook}: {str(e)}")
             return False, str(e)
 
 
@@ -11,12 +11,13 @@ from email.mime.base import MIMEBase
 from email import encoders
 import sys
 from pathlib import Path
-from typing import Dict, Tuple, Optional, List
+from typing import Tuple, Optional, List, Mapping, Union
 import logging
 from datetime import datetime
 
 sys.path.append(str(Path(__file__).resolve().parent.parent))
 from config.config import EMAIL_CONFIG, CONTACT_INFO, MODULE_PDF
+from utils.records import Student
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -128,20 +129,21 @@ class EmailService:
     
     # HOTFIX: Replace the send_registration_confirmation method in utils/email_service.py
 
-    def send_registration_confirmation(self, student_data: Dict) -> Tuple[bool, str]:
+    def send_registration_confirmation(self, student_data: Union[Student, Mapping]) -> Tuple[bool, str]:
         """
         Send initial registration confirmation email with payment instructions
         
         Args:
-            student_data: Dictionary containing student information
+            student_data: Student record, or registration form data keyed
+                          by field (email) or column name (Email)
             
         Returns:
             Tuple of (success: bool, message: str)
         """
         try:
-            # FIXED: Properly handle email field
-            student_email = student_data.get("email", student_data.get("Email", ""))
-            student_name = student_data.get("name", student_data.get("Name", ""))
+            student = Student.from_mapping(student_data)
+            student_email = student.email or ""
+            student_name = student.name or ""
             
             if not student_email:
                 return False, "Student email not found in data"
@@ -151,11 +153,10 @@ class EmailService:
                 "Vocabolarium - Registration Received"
             )
             
-            # FIXED: Use .get() with fallback for all fields
-            language = student_data.get("language", student_data.get("Language", ""))
-            scheduled_time = student_data.get("scheduled_time", student_data.get("Scheduled_Time", ""))
-            session_interval = student_data.get("session_interval", student_data.get("Session_Interval", ""))
-            payment_option = student_data.get("payment_option", student_data.get("Payment_Option", ""))
+            language = student.language or ""
+            scheduled_time = student.scheduled_time or ""
+            session_interval = student.session_interval or ""
+            payment_option = student.payment_option or ""
             
             body = f"""
     Dear {student_name},
@@ -288,12 +289,13 @@ class EmailService:
             logger.error(error_msg)
             return False, error_msg
     
-    def send_approval_email(self, student_data: Dict, tutor_name: str, google_meet_link: str) -> Tuple[bool, str]:
+    def send_approval_email(self, student_data: Union[Student, Mapping], tutor_name: str,
+                            google_meet_link: str) -> Tuple[bool, str]:
         """
         Send approval email with tutor assignment and course materials
         
         Args:
-            student_data: Dictionary containing student information (from DataFrame row)
+            student_data: Student record (e.g. from DatabaseManager.get_student_by_id) or dictionary
             tutor_name: Assigned tutor's name
             google_meet_link: Google Meet link for classes
             
@@ -301,19 +303,17 @@ class EmailService:
             Tuple of (success: bool, message: str)
         """
         try:
-            # Handle both dictionary and DataFrame row formats
-            if hasattr(student_data, 'to_dict'):
-                student_data = student_data.to_dict()
+            student = Student.from_mapping(student_data)
             
             msg = self._create_email_base(
-                student_data.get("Email", student_data.get("email")),
+                student.email,
                 "🎉 Welcome to Vocabolarium - Registration Approved!"
             )
             
-            student_name = student_data.get("Name", student_data.get("name", "Student"))
-            language = student_data.get("Language", student_data.get("language", ""))
-            scheduled_time = student_data.get("Scheduled_Time", student_data.get("scheduled_time", ""))
-            session_interval = student_data.get("Session_Interval", student_data.get("session_interval", ""))
+            student_name = student.name or "Student"
+            language = student.language or ""
+            scheduled_time = student.scheduled_time or ""
+            session_interval = student.session_interval or ""
             
             body = f"""
 Dear {student_name},
@@ -506,27 +506,27 @@ For support: {CONTACT_INFO["gmail"]} | {CONTACT_INFO["phone"]}
             logger.error(error_msg)
             return False, error_msg
     
-    def send_rejection_email(self, student_data: Dict, reason: Optional[str] = None) -> Tuple[bool, str]:
+    def send_rejection_email(self, student_data: Union[Student, Mapping],
+                             reason: Optional[str] = None) -> Tuple[bool, str]:
         """
         Send rejection email to student
         
         Args:
-            student_data: Dictionary containing student information
+            student_data: Student record or dictionary containing student information
             reason: Optional rejection reason
             
         Returns:
             Tuple of (success: bool, message: str)
         """
         try:
-            if hasattr(student_data, 'to_dict'):
-                student_data = student_data.to_dict()
+            student = Student.from_mapping(student_data)
             
             msg = self._create_email_base(
-                student_data.get("Email", student_data.get("email")),
+                student.email,
                 "Vocabolarium - Registration Update"
             )
             
-            student_name = student_data.get("Name", student_data.get("name", "Student"))
+            student_name = student.name or "Student"
             
             body = f"""
 Dear {student_name},
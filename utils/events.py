@@ -0,0 +1,211 @@
+"""
+Change events for Vocabolarium
+Every write committed through DatabaseManager is published as typed events
+(student_added, status_changed, tutor_assigned, ...) carrying the before and
+after values of the changed columns. Subscribers in the same process (caches,
+statistics, email workers) react to them instead of rescanning the tables;
+other processes can follow the optional durable tail file.
+"""
+
+import threading
+from datetime import datetime
+from pathlib import Path
+import sys
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import logging
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from utils.journal import WriteJournal
+from utils.storage import VERSION_COLUMN
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Event types
+STUDENT_ADDED = "student_added"
+STUDENT_UPDATED = "student_updated"
+STUDENT_DELETED = "student_deleted"
+STATUS_CHANGED = "status_changed"
+TUTOR_ASSIGNED = "tutor_assigned"
+NOTES_UPDATED = "notes_updated"
+TUTOR_ADDED = "tutor_added"
+TUTOR_UPDATED = "tutor_updated"
+TUTOR_DELETED = "tutor_deleted"
+
+# A whole table was replaced (import, restore): subscribers should resync it
+TABLE_REPLACED = "table_replaced"
+
+# Insert and delete event of each table
+ADDED_EVENTS: Dict[str, str] = {"students": STUDENT_ADDED, "tutors": TUTOR_ADDED}
+DELETED_EVENTS: Dict[str, str] = {"students": STUDENT_DELETED, "tutors": TUTOR_DELETED}
+
+# Update events of each table: column -> dedicated event type, and the event
+# covering every other changed column
+COLUMN_EVENTS: Dict[str, Dict[str, str]] = {
+    "students": {"Status": STATUS_CHANGED, "Assigned_Tutor": TUTOR_ASSIGNED, "Notes": NOTES_UPDATED},
+    "tutors": {},
+}
+UPDATED_EVENTS: Dict[str, str] = {"students": STUDENT_UPDATED, "tutors": TUTOR_UPDATED}
+
+# Columns maintained by DatabaseManager itself: they change along with other
+# columns and never make an event on their own
+BOOKKEEPING_COLUMNS = (VERSION_COLUMN,)
+
+# Durable tail file kept beside the stored tables
+EVENTS_FILE = "events.jsonl"
+
+
+class Event:
+    """
+    One committed change to one row (key is None for table_replaced)
+    before/after hold the changed columns only: before is None for inserts
+    (and for updates of rows that weren't cached), after is None for deletes
+    """
+
+    __slots__ = ("type", "table", "key", "before", "after", "ts")
+
+    def __init__(self, type: str, table: str, key: str, before: Optional[Dict[str, Any]] = None,
+                 after: Optional[Dict[str, Any]] = None, ts: Optional[str] = None):
+        self.type = type
+        self.table = table
+        self.key = key
+        self.before = before
+        self.after = after
+        self.ts = ts or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the event as a JSON-serializable dictionary"""
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Event":
+        """Build an event from a dictionary made by to_dict()"""
+        return cls(**{slot: data.get(slot) for slot in cls.__slots__})
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Event):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"Event({self.type}, {self.key}, {self.before!r} -> {self.after!r})"
+
+
+def update_events(table: str, key: str, before: Optional[Dict[str, Any]], after: Dict[str, Any]) -> List[Event]:
+    """
+    Describe an update of one row as events
+    Columns with a dedicated event type get their own event, the other changed
+    columns share one; columns whose value didn't change are left out
+
+    Args:
+        table: Table name
+        key: Primary key of the row
+        before: Previous values of the updated columns (None if unknown)
+        after: New values of the updated columns
+
+    Returns:
+        Events for the update (empty if nothing changed)
+    """
+    if before is not None:
+        after = {column: value for column, value in after.items() if before.get(column) != value}
+
+    groups: Dict[str, List[str]] = {}
+    for column in after:
+        if column in BOOKKEEPING_COLUMNS:
+            continue
+        event_type = COLUMN_EVENTS[table].get(column, UPDATED_EVENTS[table])
+        groups.setdefault(event_type, []).append(column)
+
+    return [
+        Event(
+            event_type, table, key,
+            before={column: before.get(column) for column in columns} if before is not None else None,
+            after={column: after[column] for column in columns},
+        )
+        for event_type, columns in groups.items()
+    ]
+
+
+class EventBus:
+    """
+    In-process publish/subscribe of change events
+    Subscribers are called synchronously, in subscription order, right after
+    the write commits; a failing subscriber is logged and doesn't affect the
+    write or the other subscribers
+    """
+
+    def __init__(self):
+        self._subscribers: List[Tuple[int, Callable[[Event], None], Optional[frozenset]]] = []
+        self._next_token = 0
+        self._lock = threading.Lock()
+
+    def subscribe(self, callback: Callable[[Event], None], types: Optional[Iterable[str]] = None) -> int:
+        """
+        Register a subscriber
+
+        Args:
+            callback: Called with each published event
+            types: Event types to receive (default: all)
+
+        Returns:
+            Token to pass to unsubscribe()
+        """
+        with self._lock:
+            self._next_token += 1
+            self._subscribers.append((self._next_token, callback, frozenset(types) if types is not None else None))
+            return self._next_token
+
+    def unsubscribe(self, token: int) -> None:
+        """Remove a subscriber"""
+        with self._lock:
+            self._subscribers = [subscriber for subscriber in self._subscribers if subscriber[0] != token]
+
+    def publish(self, events: List[Event]) -> None:
+        """Deliver events to their subscribers"""
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        for event in events:
+            for _, callback, types in subscribers:
+                if types is not None and event.type not in types:
+                    continue
+                try:
+                    callback(event)
+                except Exception as e:
+                    logger.error(f"Event subscriber failed on {event.type} {event.key}: {str(e)}")
+
+
+class EventTail:
+    """
+    Durable, append-only copy of published events (one JSON line per event)
+    Readers in other processes follow it by passing back the offset returned
+    by their previous read
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize event tail
+
+        Args:
+            path: JSONL file (created on first append)
+        """
+        self.journal = WriteJournal(path)
+
+    def append(self, events: List[Event]) -> None:
+        """Append events in a single write"""
+        self.journal.append([event.to_dict() for event in events])
+
+    def read(self, start: int = 0) -> Tuple[List[Event], int]:
+        """
+        Read the events appended after an offset
+
+        Args:
+            start: Offset returned by an earlier read (0 to read everything)
+
+        Returns:
+            Tuple of (events, offset to pass to the next read)
+        """
+        entries, end = self.journal.read(start)
+        return [Event.from_dict(entry) for entry in entries], max(end, start)
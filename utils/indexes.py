@@ -0,0 +1,165 @@
+"""
+In-memory indexes for Vocabolarium
+Hash indexes mapping column values to row labels of a cached table,
+maintained incrementally as rows are inserted, updated and deleted
+"""
+
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Mapping, Optional
+
+import pandas as pd
+
+
+def normalize_text(value: Any) -> str:
+    """Normalize a value for case-insensitive lookups"""
+    return str(value).strip().lower()
+
+
+def split_list(value: Any) -> List[str]:
+    """Split a comma-separated list cell into its items (e.g. 'Korean, Japanese')"""
+    if value is None or (isinstance(value, float) and pd.isna(value)):
+        return []
+    return [item.strip() for item in str(value).split(",") if item.strip()]
+
+
+# Hash-indexed columns of each table, with an optional key normalizer
+HASH_INDEXES: Dict[str, Dict[str, Optional[Callable[[Any], Hashable]]]] = {
+    "students": {
+        "Registration_ID": None,
+        "Email": normalize_text,
+        "Assigned_Tutor": None,
+        "Status": None,
+        "Language": None,
+    },
+    "tutors": {
+        "Tutor_ID": None,
+        "Email": normalize_text,
+        "Name": None,
+        "Status": None,
+    },
+}
+
+
+# Comma-separated list columns indexed by item, with an optional item normalizer
+# (the tutor <-> language many-to-many relation)
+MEMBERSHIP_INDEXES: Dict[str, Dict[str, Optional[Callable[[Any], Hashable]]]] = {
+    "tutors": {
+        "Languages_Teaching": normalize_text,
+    },
+}
+
+
+class HashIndex:
+    """
+    Hash index on one column
+    Maps each value to the labels of the rows holding it, in insertion order
+
+    Like every index kept on a cache entry it exposes the columns it covers
+    and is maintained with add/remove calls taking the row's column values
+    """
+
+    def __init__(self, column: str, normalize: Optional[Callable[[Any], Hashable]] = None):
+        """
+        Initialize an empty index
+
+        Args:
+            column: Indexed column
+            normalize: Optional function applied to values before hashing
+        """
+        self.column = column
+        self.columns = (column,)
+        self.normalize = normalize
+        self._buckets: Dict[Hashable, Dict[Hashable, None]] = {}
+
+    def _key(self, value: Any) -> Hashable:
+        """Get the hash key of a value"""
+        if self.normalize is not None:
+            return self.normalize(value)
+        return value
+
+    def build(self, frame: pd.DataFrame) -> "HashIndex":
+        """
+        Index every row of a table
+
+        Args:
+            frame: Table to index
+
+        Returns:
+            This index
+        """
+        self._buckets = {}
+        if self.column in frame.columns:
+            for label, value in zip(frame.index, frame[self.column].tolist()):
+                self._buckets.setdefault(self._key(value), {})[label] = None
+        return self
+
+    def add(self, label: Hashable, row: Mapping) -> None:
+        """Add a row under its value"""
+        self._buckets.setdefault(self._key(row.get(self.column)), {})[label] = None
+
+    def remove(self, label: Hashable, row: Mapping) -> None:
+        """Remove a row from under its value"""
+        key = self._key(row.get(self.column))
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            bucket.pop(label, None)
+            if not bucket:
+                del self._buckets[key]
+
+    def lookup(self, value: Any) -> List[Hashable]:
+        """
+        Find the rows holding a value
+
+        Args:
+            value: Value to look up
+
+        Returns:
+            Row labels in insertion order
+        """
+        return list(self._buckets.get(self._key(value), ()))
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class MembershipIndex(HashIndex):
+    """
+    Hash index on a comma-separated list column
+    Maps each item to the labels of the rows listing it, so a row appears
+    once under every item of its list and lookups match whole items only
+    (e.g. 'Korean' never matches a row listing only 'Korean Sign Language')
+    """
+
+    def _keys(self, value: Any) -> Iterable[Hashable]:
+        """Get the distinct hash keys of a list cell"""
+        return dict.fromkeys(self._key(item) for item in split_list(value))
+
+    def build(self, frame: pd.DataFrame) -> "MembershipIndex":
+        """
+        Index every row of a table under each item of its list
+
+        Args:
+            frame: Table to index
+
+        Returns:
+            This index
+        """
+        self._buckets = {}
+        if self.column in frame.columns:
+            for label, value in zip(frame.index, frame[self.column].tolist()):
+                for key in self._keys(value):
+                    self._buckets.setdefault(key, {})[label] = None
+        return self
+
+    def add(self, label: Hashable, row: Mapping) -> None:
+        """Add a row under every item of its list"""
+        for key in self._keys(row.get(self.column)):
+            self._buckets.setdefault(key, {})[label] = None
+
+    def remove(self, label: Hashable, row: Mapping) -> None:
+        """Remove a row from under every item of its list"""
+        for key in self._keys(row.get(self.column)):
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket.pop(label, None)
+                if not bucket:
+                    del self._buckets[key]
@@ -0,0 +1,181 @@
+"""
+Write journal for Vocabolarium
+Append-only JSONL log of row inserts, updates and deletes kept next to a
+workbook, so single-row writes cost O(1) instead of rewriting the workbook
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Any
+
+import pandas as pd
+
+
+class WriteJournal:
+    """
+    Append-only journal file
+    Each line is a JSON object {"ts", "op", "key", "row" | "changes"} where op
+    is "insert", "update" or "delete"
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize journal
+
+        Args:
+            path: Journal file (created on first append)
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def append(self, entries: List[Dict]) -> None:
+        """
+        Append entries in a single write
+
+        Args:
+            entries: Journal entries without timestamp
+        """
+        if not entries:
+            return
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        lines = "".join(
+            json.dumps({"ts": timestamp, **entry}, ensure_ascii=False, default=str) + "\n"
+            for entry in entries
+        )
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def read(self, start: int = 0) -> Tuple[List[Dict], int]:
+        """
+        Read all complete entries
+
+        Args:
+            start: Byte offset to read from (an offset returned by an earlier read)
+
+        Returns:
+            Tuple of (entries, byte offset just after the last complete entry)
+        """
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(start)
+                data = f.read()
+        except FileNotFoundError:
+            return [], 0
+
+        # Ignore a trailing partial line left by an interrupted write
+        end = data.rfind(b"\n") + 1
+        entries = [json.loads(line) for line in data[:end].decode("utf-8").splitlines() if line.strip()]
+        return entries, start + end
+
+    def size(self) -> int:
+        """Get journal size in bytes"""
+        try:
+            return self.path.stat().st_size
+        except FileNotFoundError:
+            return 0
+
+    def oldest_timestamp(self) -> Optional[datetime]:
+        """Get the timestamp of the oldest entry, if any"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                first = f.readline()
+        except FileNotFoundError:
+            return None
+        if not first.strip():
+            return None
+        try:
+            return datetime.strptime(json.loads(first)["ts"], "%Y-%m-%d %H:%M:%S")
+        except (ValueError, KeyError):
+            return None
+
+    def truncate(self, offset: int) -> None:
+        """
+        Drop entries before a byte offset, keeping anything appended later
+
+        Args:
+            offset: Offset returned by read() when the entries were folded in
+        """
+        with self._lock:
+            try:
+                with open(self.path, "rb") as f:
+                    f.seek(offset)
+                    remainder = f.read()
+            except FileNotFoundError:
+                return
+
+            if remainder:
+                tmp_path = self.path.with_name(self.path.name + ".tmp")
+                with open(tmp_path, "wb") as f:
+                    f.write(remainder)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            else:
+                self.path.unlink(missing_ok=True)
+
+
+def replay(base: pd.DataFrame, entries: List[Dict], key_column: str) -> pd.DataFrame:
+    """
+    Merge journal entries into a table
+
+    Replay is idempotent: inserting an existing key overwrites the row, so
+    entries already folded into the base table can be replayed safely
+
+    Args:
+        base: Table as stored in the workbook
+        entries: Journal entries in append order
+        key_column: Primary key column
+
+    Returns:
+        New DataFrame with the entries applied
+    """
+    if not entries:
+        return base
+
+    positions = {key: pos for pos, key in enumerate(base[key_column].tolist())}
+    touched: Dict[Any, Optional[Dict]] = {}
+
+    for entry in entries:
+        key = entry["key"]
+        if entry["op"] == "insert":
+            touched[key] = dict(entry["row"])
+        elif entry["op"] == "update":
+            if key in touched:
+                row = touched[key]
+            elif key in positions:
+                row = base.iloc[positions[key]].to_dict()
+            else:
+                row = None
+            if row is not None:
+                row.update(entry["changes"])
+                touched[key] = row
+        elif entry["op"] == "delete":
+            touched[key] = None
+
+    df = base.copy()
+
+    replaced = {key: row for key, row in touched.items() if key in positions and row is not None}
+    if replaced:
+        labels = [df.index[positions[key]] for key in replaced]
+        patch = pd.DataFrame(list(replaced.values()), index=labels)
+        for column in patch.columns:
+            if column in df.columns:
+                if df[column].dtype != patch[column].dtype:
+                    df[column] = df[column].astype(object)
+                df.loc[labels, column] = patch[column]
+
+    deleted = [df.index[positions[key]] for key, row in touched.items() if key in positions and row is None]
+    if deleted:
+        df = df.drop(index=deleted)
+
+    inserted = [row for key, row in touched.items() if key not in positions and row is not None]
+    if inserted:
+        df = pd.concat([df, pd.DataFrame(inserted)], ignore_index=True)
+
+    return df.reset_index(drop=True)
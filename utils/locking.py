@@ -0,0 +1,222 @@
+"""
+File locking for Vocabolarium
+Cross-process advisory locks and atomic file replacement used by every
+writer, with lock wait times measured to expose contention
+"""
+
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+import sys
+from typing import Callable, Dict
+import logging
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from config.config import LOCK_TIMEOUT_SECONDS, LOCK_WARN_SECONDS
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class LockTimeout(TimeoutError):
+    """Raised when a file lock cannot be acquired in time"""
+
+
+class LockStats:
+    """Wait time counters for one lock file"""
+
+    __slots__ = ("acquisitions", "contended", "timeouts", "total_wait", "max_wait")
+
+    def __init__(self):
+        self.acquisitions = 0
+        self.contended = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record(self, wait: float, contended: bool) -> None:
+        """Record one successful acquisition"""
+        self.acquisitions += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        if contended:
+            self.contended += 1
+
+    def to_dict(self) -> Dict:
+        """Get counters as a dictionary (times in milliseconds)"""
+        return {
+            "acquisitions": self.acquisitions,
+            "contended": self.contended,
+            "timeouts": self.timeouts,
+            "total_wait_ms": round(self.total_wait * 1000, 2),
+            "avg_wait_ms": round(self.total_wait * 1000 / self.acquisitions, 2) if self.acquisitions else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 2),
+        }
+
+
+class _ProcessLock:
+    """
+    Lock state for one lock file inside this process
+    Threads serialize on the RLock; the OS lock is held while depth > 0
+    """
+
+    def __init__(self):
+        self.rlock = threading.RLock()
+        self.depth = 0
+        self.fd = None
+
+
+_registry_lock = threading.Lock()
+_process_locks: Dict[str, _ProcessLock] = {}
+_stats: Dict[str, LockStats] = {}
+
+
+def _try_os_lock(fd: int) -> bool:
+    """Try to take an exclusive OS lock without blocking"""
+    try:
+        if os.name == "nt":
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        return False
+
+
+def _os_unlock(fd: int) -> None:
+    """Release an OS lock"""
+    if os.name == "nt":
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+class FileLock:
+    """
+    Exclusive advisory lock on a lock file, shared by threads and processes
+    Re-entrant within a thread, so nested writers can take the same lock
+    """
+
+    def __init__(self, path: Path, timeout: float = LOCK_TIMEOUT_SECONDS):
+        """
+        Initialize lock
+
+        Args:
+            path: Lock file (created on first use)
+            timeout: Seconds to wait before raising LockTimeout
+        """
+        self.path = Path(path)
+        self.timeout = timeout
+        self._key = str(self.path.resolve())
+        with _registry_lock:
+            self._state = _process_locks.setdefault(self._key, _ProcessLock())
+            self._stats = _stats.setdefault(self._key, LockStats())
+
+    def acquire(self) -> None:
+        """Acquire the lock, waiting up to the timeout"""
+        state = self._state
+        start = time.perf_counter()
+        deadline = start + self.timeout
+
+        if not state.rlock.acquire(timeout=self.timeout):
+            self._stats.timeouts += 1
+            raise LockTimeout(f"Timed out waiting for {self.path}")
+
+        if state.depth > 0:
+            state.depth += 1
+            return
+
+        contended = time.perf_counter() - start > 0.001
+        try:
+            fd = os.open(self._key, os.O_RDWR | os.O_CREAT, 0o644)
+            while not _try_os_lock(fd):
+                contended = True
+                if time.perf_counter() >= deadline:
+                    os.close(fd)
+                    self._stats.timeouts += 1
+                    raise LockTimeout(f"Timed out waiting for {self.path}")
+                time.sleep(0.01)
+        except BaseException:
+            state.rlock.release()
+            raise
+
+        state.fd = fd
+        state.depth = 1
+
+        wait = time.perf_counter() - start
+        self._stats.record(wait, contended)
+        if wait >= LOCK_WARN_SECONDS:
+            logger.warning(f"Waited {wait * 1000:.0f} ms for lock {self.path.name}")
+
+    def release(self) -> None:
+        """Release the lock"""
+        state = self._state
+        state.depth -= 1
+        if state.depth == 0:
+            try:
+                _os_unlock(state.fd)
+            finally:
+                os.close(state.fd)
+                state.fd = None
+        state.rlock.release()
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.release()
+
+
+def lock_stats() -> Dict[str, Dict]:
+    """
+    Get wait time counters for every lock used in this process
+
+    Returns:
+        Lock file name -> counters
+    """
+    with _registry_lock:
+        return {Path(key).name: stats.to_dict() for key, stats in _stats.items()}
+
+
+def atomic_write(path: Path, writer: Callable[[Path], None]) -> None:
+    """
+    Write a file atomically
+
+    The content is written to a temporary file in the same directory,
+    flushed to disk and moved over the target with os.replace, so readers
+    see either the old or the new file and never a partial one
+
+    Args:
+        path: Target file
+        writer: Function writing the content to the path it is given
+    """
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}-", suffix=path.suffix)
+    os.close(fd)
+    tmp_path = Path(tmp_name)
+
+    try:
+        writer(tmp_path)
+        with open(tmp_path, "rb+") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    if os.name != "nt":
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
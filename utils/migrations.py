@@ -0,0 +1,178 @@
+"""
+Schema migrations for Vocabolarium
+Numbered, run-once changes to the stored tables. The schema version reached
+is kept in a small metadata file beside the tables, so startup only reads
+that file and pending migrations are applied once, in order, under a lock
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from utils.locking import FileLock, atomic_write
+from utils.storage import StorageBackend, VERSION_COLUMN, DELETED_COLUMN
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Metadata file kept beside the stored tables
+METADATA_FILE = "metadata.json"
+
+# Registered migrations as (version, description, function), in version order
+MIGRATIONS: List[Tuple[int, str, Callable[[StorageBackend], None]]] = []
+
+
+def migration(version: int, description: str) -> Callable:
+    """
+    Register a migration
+
+    Args:
+        version: Schema version the migration brings the tables to; must be
+                 one more than the previous migration's
+        description: Short description kept in the metadata file
+
+    Returns:
+        Decorator registering a function taking the storage backend
+    """
+    def register(function: Callable[[StorageBackend], None]) -> Callable[[StorageBackend], None]:
+        expected = MIGRATIONS[-1][0] + 1 if MIGRATIONS else 1
+        if version != expected:
+            raise ValueError(f"Migration {version} registered out of order (expected {expected})")
+        MIGRATIONS.append((version, description, function))
+        return function
+
+    return register
+
+
+def latest_version() -> int:
+    """Get the schema version reached by running every migration"""
+    return MIGRATIONS[-1][0] if MIGRATIONS else 0
+
+
+def add_missing_columns(backend: StorageBackend, table: str, columns: Dict[str, Any]) -> List[str]:
+    """
+    Add the columns a table doesn't have yet in one write
+    Tables created from the current column lists already have them
+
+    Args:
+        backend: Storage backend
+        table: Table name
+        columns: Column -> default value for existing rows
+
+    Returns:
+        Columns that were added
+    """
+    existing = set(backend.columns(table))
+    missing = {column: default for column, default in columns.items() if column not in existing}
+    if missing:
+        backend.add_columns(table, missing)
+    return list(missing)
+
+
+class SchemaMetadata:
+    """
+    Schema version and migration history stored as JSON
+    Written atomically under a file lock shared by every process
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize metadata store
+
+        Args:
+            path: JSON metadata file
+        """
+        self.path = Path(path)
+        self.lock = FileLock(self.path.with_suffix(".lock"))
+
+    def read(self) -> Dict:
+        """Read the metadata (empty if the file doesn't exist yet)"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def write(self, metadata: Dict) -> None:
+        """Atomically write the metadata"""
+        def writer(path: Path) -> None:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(metadata, f, indent=2)
+
+        atomic_write(self.path, writer)
+
+    def version(self) -> int:
+        """Get the stored schema version (0 before the first migration)"""
+        return int(self.read().get("schema_version", 0))
+
+    def update(self, **values: Any) -> None:
+        """Set metadata entries, keeping the others"""
+        with self.lock:
+            data = self.read()
+            data.update(values)
+            self.write(data)
+
+
+def migrate(backend: StorageBackend, metadata: SchemaMetadata, version: Optional[int] = None) -> int:
+    """
+    Apply the migrations not applied yet
+    Costs a single metadata read when the tables are up to date
+
+    Args:
+        backend: Storage backend holding the tables
+        metadata: Metadata store of the backend's data files
+        version: Stored schema version if the caller already read it
+
+    Returns:
+        Schema version after migrating
+    """
+    if version is None:
+        version = metadata.version()
+    if version >= latest_version():
+        return version
+
+    with metadata.lock:
+        # Another process may have migrated while we waited for the lock
+        data = metadata.read()
+        version = int(data.get("schema_version", 0))
+
+        for number, description, function in MIGRATIONS:
+            if number <= version:
+                continue
+            function(backend)
+            version = number
+            data["schema_version"] = version
+            data.setdefault("migrations", []).append({
+                "version": number,
+                "description": description,
+                "applied_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            })
+            metadata.write(data)
+            logger.info(f"Applied migration {number}: {description}")
+
+    return version
+
+
+# ==================== MIGRATIONS ====================
+
+@migration(1, "Add Preferred_Tutor to students")
+def _add_preferred_tutor(backend: StorageBackend) -> None:
+    add_missing_columns(backend, "students", {"Preferred_Tutor": ""})
+
+
+@migration(2, "Add Row_Version to students and tutors")
+def _add_row_version(backend: StorageBackend) -> None:
+    for table in ("students", "tutors"):
+        add_missing_columns(backend, table, {VERSION_COLUMN: 1})
+
+
+@migration(3, "Add Deleted_At (soft deletes) to students and tutors")
+def _add_deleted_at(backend: StorageBackend) -> None:
+    for table in ("students", "tutors"):
+        add_missing_columns(backend, table, {DELETED_COLUMN: ""})
@@ -0,0 +1,145 @@
+"""
+Record types for Vocabolarium
+Lightweight single-row Student and Tutor objects built straight from the
+cached tables, used instead of pandas Series for row lookups
+"""
+
+from pathlib import Path
+import sys
+from typing import Any, Dict, Hashable, Iterator, Mapping, Tuple
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from config.config import STUDENTS_COLUMNS, TUTORS_COLUMNS
+
+
+def _plain(value: Any) -> Any:
+    """Convert a cell value to a plain Python value (None for empty cells)"""
+    if value is None or value is pd.NA:
+        return None
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, float) and value != value:
+        return None
+    return value
+
+
+class Record:
+    """
+    Base of single-row records
+    Every table column is a slotted attribute named after the column in lower
+    case (Registration_ID -> registration_id). Item access and get() by column
+    name are kept so code written against Series rows works unchanged.
+    Columns outside COLUMNS (e.g. added by a migration) are kept in extra.
+    """
+
+    COLUMNS: Tuple[str, ...] = ()
+    __slots__ = ("extra",)
+
+    def __init__(self, **values: Any):
+        """
+        Initialize a record
+
+        Args:
+            **values: Attribute values by attribute name; missing ones are None
+        """
+        for column in self.COLUMNS:
+            setattr(self, column.lower(), values.pop(column.lower(), None))
+        self.extra: Dict[str, Any] = values
+
+    @classmethod
+    def from_mapping(cls, data: Mapping[str, Any]) -> "Record":
+        """
+        Build a record from a mapping keyed by column names (Registration_ID)
+        or attribute names (registration_id), e.g. a registration form
+        """
+        if isinstance(data, cls):
+            return data
+        if hasattr(data, "to_dict"):
+            data = data.to_dict()
+
+        values: Dict[str, Any] = {}
+        for key, value in data.items():
+            name = str(key).lower() if str(key).lower() in cls.__slots__ else str(key)
+            value = _plain(value)
+            # When both spellings are given, the non-empty one wins
+            if name not in values or value not in (None, ""):
+                values[name] = value
+        return cls(**values)
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame, label: Hashable) -> "Record":
+        """
+        Build a record from one row of a table without creating a Series
+
+        Args:
+            frame: Table holding the row
+            label: Row label
+
+        Returns:
+            Record with the row's values
+        """
+        position = frame.index.get_loc(label)
+        return cls(**{
+            column.lower() if column in cls.COLUMNS else column: _plain(frame[column].array[position])
+            for column in frame.columns
+        })
+
+    def __getitem__(self, column: str) -> Any:
+        attribute = column.lower()
+        if attribute in self.__slots__:
+            return getattr(self, attribute)
+        if column in self.extra:
+            return self.extra[column]
+        raise KeyError(column)
+
+    def __contains__(self, column: str) -> bool:
+        return column.lower() in self.__slots__ or column in self.extra
+
+    def get(self, column: str, default: Any = None) -> Any:
+        """Get a value by column name, or the default if the column is unknown"""
+        try:
+            return self[column]
+        except KeyError:
+            return default
+
+    def keys(self) -> Iterator[str]:
+        """Iterate over the column names"""
+        yield from self.COLUMNS
+        yield from self.extra
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the record as a column name -> value dictionary"""
+        return {column: self[column] for column in self.keys()}
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Record):
+            return NotImplemented
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        key = self.COLUMNS[0] if self.COLUMNS else None
+        return f"{type(self).__name__}({key}={self.get(key)!r})"
+
+
+class Student(Record):
+    """Single student registration"""
+
+    COLUMNS = tuple(STUDENTS_COLUMNS)
+    __slots__ = tuple(column.lower() for column in STUDENTS_COLUMNS)
+
+
+class Tutor(Record):
+    """Single tutor"""
+
+    COLUMNS = tuple(TUTORS_COLUMNS)
+    __slots__ = tuple(column.lower() for column in TUTORS_COLUMNS)
+
+
+# Record type of each table
+RECORD_TYPES: Dict[str, type] = {
+    "students": Student,
+    "tutors": Tutor,
+}
+
@@ -0,0 +1,58 @@
+"""
+Shared services for Vocabolarium pages
+One DatabaseManager and one EmailService per server process, built on first
+use and shared by every session and rerun (with their table cache, indexes
+and sequences), plus a controlled reset
+"""
+
+from pathlib import Path
+import sys
+import logging
+
+import streamlit as st
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from utils.database import DatabaseManager
+from utils.email_service import EmailService
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@st.cache_resource(show_spinner=False)
+def get_database() -> DatabaseManager:
+    """
+    Get the process-wide database manager
+    Created (and the databases initialized and migrated) on the first call only
+
+    Returns:
+        Shared DatabaseManager
+    """
+    return DatabaseManager()
+
+
+@st.cache_resource(show_spinner=False)
+def get_email_service() -> EmailService:
+    """
+    Get the process-wide email service
+
+    Returns:
+        Shared EmailService
+    """
+    return EmailService()
+
+
+def reset_resources(clear_tables: bool = True) -> None:
+    """
+    Drop the shared services so the next call builds them again
+    Used after changing configuration or replacing data files on disk
+
+    Args:
+        clear_tables: Also drop the cached tables and their indexes
+    """
+    get_database.clear()
+    get_email_service.clear()
+    if clear_tables:
+        DatabaseManager.clear_cache()
+    logger.info("Shared services reset")
@@ -0,0 +1,141 @@
+"""
+Typed table schema for Vocabolarium
+Compact dtypes for cached tables: categoricals for enumerated columns,
+Arrow-backed strings for free text and nullable integers for whole numbers
+"""
+
+from pathlib import Path
+import sys
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from config.config import (
+    LANGUAGES, STUDENT_STATUSES, TUTOR_STATUSES,
+    SESSION_INTERVALS, TIME_SLOTS, PAYMENT_OPTIONS
+)
+
+# Arrow-backed strings are optional: without pyarrow free text stays object
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = pd.StringDtype("pyarrow")
+except ImportError:
+    STRING_DTYPE = object
+
+
+# Categorical columns of each table with their known values; values found in
+# the data but not listed here are added as extra categories
+CATEGORY_COLUMNS: Dict[str, Dict[str, List[str]]] = {
+    "students": {
+        "Status": STUDENT_STATUSES,
+        "Language": list(LANGUAGES),
+        "Payment_Option": PAYMENT_OPTIONS,
+        "Session_Interval": SESSION_INTERVALS,
+        "Scheduled_Time": TIME_SLOTS,
+        "Payment_Status": [],
+    },
+    "tutors": {
+        "Status": TUTOR_STATUSES,
+    },
+}
+
+# Tables with fewer rows keep enumerated columns as plain strings: below this
+# the category lists take more memory than the values they replace
+CATEGORY_MIN_ROWS = 20
+
+# Whole-number columns, stored as nullable integers
+INTEGER_COLUMNS: Dict[str, List[str]] = {
+    "students": ["Age", "Row_Version"],
+    "tutors": ["Experience_Years", "Row_Version"],
+}
+
+# Fractional columns, stored as floats
+FLOAT_COLUMNS: Dict[str, List[str]] = {
+    "students": [],
+    "tutors": ["Rating"],
+}
+
+
+def is_categorical(series: pd.Series) -> bool:
+    """Check whether a column is categorical"""
+    return isinstance(series.dtype, pd.CategoricalDtype)
+
+
+def _categorical(series: pd.Series, known: List[str]) -> pd.Series:
+    """Convert a text column to a categorical of its known values plus any others found"""
+    values = series.where(series.notna(), "").astype(str)
+    extra = sorted(set(values.unique()) - set(known))
+    return values.astype(pd.CategoricalDtype(list(known) + extra))
+
+
+def apply_schema(df: pd.DataFrame, table: str, categorical: Optional[bool] = None) -> pd.DataFrame:
+    """
+    Convert a loaded table to its compact dtypes
+
+    Args:
+        df: Table as loaded from storage
+        table: Table name ("students" or "tutors")
+        categorical: Whether enumerated columns become categoricals (default:
+            only for tables of at least CATEGORY_MIN_ROWS rows)
+
+    Returns:
+        New DataFrame with typed columns (columns unknown to the schema are
+        treated as free text)
+    """
+    if categorical is None:
+        categorical = len(df) >= CATEGORY_MIN_ROWS
+    categories = CATEGORY_COLUMNS.get(table, {}) if categorical else {}
+    integers = INTEGER_COLUMNS.get(table, [])
+    floats = FLOAT_COLUMNS.get(table, [])
+
+    columns = {}
+    for column in df.columns:
+        series = df[column]
+        if column in categories:
+            columns[column] = _categorical(series, categories[column])
+        elif column in integers:
+            numbers = pd.to_numeric(series, errors="coerce")
+            whole = numbers.isna() | (numbers % 1 == 0)
+            columns[column] = numbers.astype("Int64") if whole.all() else numbers
+        elif column in floats:
+            columns[column] = pd.to_numeric(series, errors="coerce").astype("float64")
+        else:
+            columns[column] = series.where(series.notna(), "").astype(str).astype(STRING_DTYPE)
+
+    return pd.DataFrame(columns, index=df.index)
+
+
+def align_categories(frame: pd.DataFrame, other: pd.DataFrame) -> pd.DataFrame:
+    """
+    Give the categorical columns of a frame every category used by another
+    so the two can be concatenated without falling back to object columns
+
+    Args:
+        frame: Typed frame to align
+        other: Typed frame it will be combined with
+
+    Returns:
+        Frame with widened categories (the frame itself if nothing changed)
+    """
+    widened = {}
+    for column in frame.columns:
+        if column in other.columns and is_categorical(frame[column]) and is_categorical(other[column]):
+            missing = other[column].cat.categories.difference(frame[column].cat.categories, sort=False)
+            if len(missing):
+                widened[column] = frame[column].cat.add_categories(missing)
+    return frame.assign(**widened) if widened else frame
+
+
+def memory_usage(df: pd.DataFrame) -> int:
+    """Get the memory used by a table in bytes, including string contents"""
+    return int(df.memory_usage(deep=True).sum())
+
+
+def format_bytes(size: int) -> str:
+    """Format a byte count for display (e.g. 1536 -> '1.5 KB')"""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} B"
+        size /= 1024
+    return f"{size:.1f} GB"
@@ -0,0 +1,587 @@
+"""
+Text search for Vocabolarium
+Trigram inverted index over the searchable text columns of a cached table,
+maintained incrementally, answering substring queries by intersecting
+posting lists instead of scanning every row, and typo-tolerant queries by
+trigram similarity. Terms whose posting lists would cover a large part of
+the table (estimated from the postings read, for short terms those of every
+trigram containing them) use a vectorized scan instead.
+
+Run this module to benchmark it against a full-table scan:
+    python utils/search.py [rows]
+"""
+
+import heapq
+import re
+import time
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+# Columns covered by the search index of each table
+SEARCH_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "students": ("Registration_ID", "Name", "Email"),
+    "tutors": ("Tutor_ID", "Name", "Email"),
+}
+
+# Characters after which a match counts as the start of a word
+WORD_BOUNDARIES = " .-_@'"
+
+# Share of the table above which checking index candidates one by one is
+# slower than scanning every row with vectorized string operations
+SCAN_FRACTION = 0.1
+
+# Lowest trigram similarity (Jaccard) returned by fuzzy searches
+FUZZY_MIN_SCORE = 0.3
+
+# Rows sharing the most trigrams with a fuzzy query that are scored exactly, per result
+FUZZY_CANDIDATES_PER_RESULT = 10
+
+# Words up to this length are also indexed by their deletion neighbourhood:
+# a swapped letter leaves a short word with no trigram in common with the
+# original (jaun/juan), but the two still share a one-letter deletion (jun)
+SHORT_WORD_LENGTH = 6
+
+
+def normalize(value: object) -> str:
+    """Normalize a cell for searching (lowercase, missing values as '')"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ""
+    return str(value).lower()
+
+
+def trigrams(text: str) -> Set[str]:
+    """Get the distinct 3-character substrings of a text"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def padded_trigrams(text: str) -> Set[str]:
+    """
+    Get the trigrams of a text marked at both ends
+    The end markers let short words share trigrams with their misspellings
+    (jon/john share "\\x00jo")
+    """
+    return trigrams(f"\x00{text}\x00")
+
+
+def short_words(texts: Iterable[str], longest: int = SHORT_WORD_LENGTH) -> Set[str]:
+    """Get the distinct words of 3 to `longest` letters or digits in some texts"""
+    return {
+        word
+        for text in texts
+        for word in re.findall(r"[^\W_]+", text)
+        if 3 <= len(word) <= longest
+    }
+
+
+def deletions(word: str) -> Set[str]:
+    """Get a word and every variant of it with one character removed"""
+    return {word, *(word[:i] + word[i + 1:] for i in range(len(word)))}
+
+
+def _row_trigrams(texts: Tuple[str, ...]) -> Set[str]:
+    """
+    Get the trigrams of a row's texts
+    Texts are joined and surrounded with a separator no search term contains,
+    so trigrams spanning two columns are never looked up by substring
+    searches, while fuzzy searches see every column's padded trigrams
+    """
+    return padded_trigrams("\x00".join(texts))
+
+
+def edit_distance(a: str, b: str, max_distance: int = 2) -> int:
+    """
+    Get the edit distance between two texts, counting an adjacent swap as one edit
+    Computation stops as soon as the distance exceeds max_distance
+
+    Returns:
+        Distance, or max_distance + 1 if it is larger than max_distance
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+
+    previous2 = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if previous2 is not None and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return min(previous[-1], max_distance + 1)
+
+
+def similarity(term: str, grams: Set[str], text: str) -> float:
+    """
+    Get the similarity between a query and a text
+    Trigram Jaccard, or one minus the relative edit distance when that is
+    higher (trigrams miss swapped letters in short words). Each word of the
+    text is also compared on its own, so a misspelled first or last name
+    still matches a full name
+
+    Args:
+        term: Normalized query
+        grams: Padded trigrams of the query
+        text: Normalized text
+
+    Returns:
+        Best similarity from 0 to 1
+    """
+    best = 0.0
+    for part in {text, *text.split()}:
+        part_grams = padded_trigrams(part)
+        shared = len(grams & part_grams)
+        if shared:
+            best = max(best, shared / (len(grams) + len(part_grams) - shared))
+        distance = edit_distance(term, part)
+        if distance <= 2:
+            best = max(best, 1 - distance / max(len(term), len(part)))
+    return best
+
+
+def match_quality(text: str, term: str) -> int:
+    """
+    Rate how well a term matches a text
+
+    Returns:
+        4 for an exact match, 3 for a prefix, 2 for the start of a word,
+        1 for any other substring, 0 if the term does not occur
+    """
+    if text == term:
+        return 4
+    position = text.find(term)
+    if position < 0:
+        return 0
+    if position == 0:
+        return 3
+    while position > 0:
+        if text[position - 1] in WORD_BOUNDARIES:
+            return 2
+        position = text.find(term, position + 1)
+    return 1
+
+
+def scan(frame: pd.DataFrame, columns: Iterable[str], term: str, limit: Optional[int] = None) -> List[Hashable]:
+    """
+    Find the rows containing a term by scanning whole columns at once
+    Ranks rows exactly like TrigramIndex.search
+
+    Args:
+        frame: Table to search
+        columns: Text columns to search
+        term: Text to look for (case-insensitive)
+        limit: Maximum number of rows to return
+
+    Returns:
+        Row labels, best matches first
+    """
+    term = normalize(term)
+    word_start = f"[{re.escape(WORD_BOUNDARIES)}]{re.escape(term)}"
+
+    # Per column: positions of the matching rows, their lowercased texts,
+    # text lengths and whether the text starts with the term
+    matches = []
+    for column in columns:
+        if column not in frame.columns:
+            continue
+        texts = frame[column].astype("string").fillna("").str.lower()
+        rows = np.flatnonzero(texts.str.contains(term, regex=False).to_numpy(dtype=bool))
+        if not len(rows):
+            continue
+        matched = texts.iloc[rows]
+        lengths = matched.str.len().to_numpy(dtype=np.int64)
+        prefix = matched.str.startswith(term).to_numpy(dtype=bool)
+        matches.append((matched, rows, lengths, prefix))
+
+    # Matches at the start of a text outrank all others: when they fill the
+    # limit, the slower word start check can be skipped
+    leading = np.zeros(len(frame), dtype=bool)
+    for _, rows, _, prefix in matches:
+        leading[rows[prefix]] = True
+    check_words = limit is None or leading.sum() < limit
+
+    # Per row: sort key of its best match, (4 - quality) * 2^14 + length of
+    # the matching text, small enough for numpy's radix sort (-1 if no match)
+    lengths_cap = (1 << 14) - 1
+    best = np.full(len(frame), -1, dtype=np.int32)
+    for matched, rows, lengths, prefix in matches:
+        quality = np.where(prefix, np.where(lengths == len(term), 4, 3), 1)
+        inside = np.flatnonzero(~prefix)
+        if check_words and len(inside):
+            starts = matched.iloc[inside].str.contains(word_start, regex=True).to_numpy(dtype=bool)
+            quality[inside] = np.where(starts, 2, 1)
+        key = (4 - quality) * (lengths_cap + 1) + np.minimum(lengths, lengths_cap)
+        current = best[rows]
+        best[rows] = np.where((current < 0) | (key < current), key, current)
+
+    positions = np.flatnonzero(best >= 0)
+    order = positions[np.argsort(best[positions].astype(np.uint16), kind="stable")]
+    if limit is not None:
+        order = order[:limit]
+    return frame.index[order].tolist()
+
+
+class TrigramIndex:
+    """
+    Inverted index from trigrams to the rows whose text contains them
+    Every row holding a substring of 3+ characters holds all of its trigrams,
+    so intersecting their posting lists yields a small candidate set that is
+    then verified and ranked
+    """
+
+    def __init__(self, columns: Iterable[str]):
+        """
+        Initialize an empty index
+
+        Args:
+            columns: Text columns to index
+        """
+        self.columns = tuple(columns)
+        self._postings: Dict[str, Set[Hashable]] = {}
+        self._texts: Dict[Hashable, Tuple[str, ...]] = {}
+        # Short word -> rows, and deletion variant -> short words (see SHORT_WORD_LENGTH)
+        self._words: Dict[str, Set[Hashable]] = {}
+        self._neighbours: Dict[str, Set[str]] = {}
+
+    def build(self, frame: pd.DataFrame) -> "TrigramIndex":
+        """
+        Index every row of a table
+
+        Args:
+            frame: Table to index
+
+        Returns:
+            This index
+        """
+        values = [
+            frame[column].tolist() if column in frame.columns else [""] * len(frame)
+            for column in self.columns
+        ]
+        self._texts = {
+            label: tuple(normalize(value) for value in row)
+            for label, *row in zip(frame.index, *values)
+        }
+
+        # Collect postings as lists first, converting to sets once is much faster
+        postings: Dict[str, List[Hashable]] = {}
+        for label, texts in self._texts.items():
+            for gram in _row_trigrams(texts):
+                found = postings.get(gram)
+                if found is None:
+                    postings[gram] = [label]
+                else:
+                    found.append(label)
+        self._postings = {gram: set(labels) for gram, labels in postings.items()}
+
+        self._words, self._neighbours = {}, {}
+        for label, texts in self._texts.items():
+            self._add_words(label, texts)
+        return self
+
+    def _add_words(self, label: Hashable, texts: Tuple[str, ...]) -> None:
+        """Index the short words of one row"""
+        for word in short_words(texts):
+            found = self._words.get(word)
+            if found is None:
+                self._words[word] = {label}
+                for variant in deletions(word):
+                    self._neighbours.setdefault(variant, set()).add(word)
+            else:
+                found.add(label)
+
+    def _remove_words(self, label: Hashable, texts: Tuple[str, ...]) -> None:
+        """Remove the short words of one row"""
+        for word in short_words(texts):
+            found = self._words.get(word)
+            if found is None:
+                continue
+            found.discard(label)
+            if not found:
+                del self._words[word]
+                for variant in deletions(word):
+                    words = self._neighbours.get(variant)
+                    if words is not None:
+                        words.discard(word)
+                        if not words:
+                            del self._neighbours[variant]
+
+    def _add_texts(self, label: Hashable, texts: Tuple[str, ...]) -> None:
+        """Index the normalized texts of one row"""
+        self._texts[label] = texts
+        for gram in _row_trigrams(texts):
+            found = self._postings.get(gram)
+            if found is None:
+                self._postings[gram] = {label}
+            else:
+                found.add(label)
+        self._add_words(label, texts)
+
+    def add(self, label: Hashable, row: Mapping) -> None:
+        """Add a row"""
+        self.remove(label, row)
+        self._add_texts(label, tuple(normalize(row.get(column)) for column in self.columns))
+
+    def remove(self, label: Hashable, row: Optional[Mapping] = None) -> None:
+        """Remove a row (its indexed texts are remembered, so row may be omitted)"""
+        texts = self._texts.pop(label, None)
+        if texts is None:
+            return
+        for gram in _row_trigrams(texts):
+            found = self._postings.get(gram)
+            if found is not None:
+                found.discard(label)
+                if not found:
+                    del self._postings[gram]
+        self._remove_words(label, texts)
+
+    def candidates(self, term: str) -> Optional[Set[Hashable]]:
+        """
+        Get the rows that may contain a normalized term
+
+        Args:
+            term: Normalized search term
+
+        Returns:
+            Candidate row labels, or None when the estimated number of
+            candidates (size of the posting lists to read) is above
+            SCAN_FRACTION of the rows, where a scan is faster
+        """
+        most = SCAN_FRACTION * len(self._texts)
+
+        # A shorter term lies inside one of the (padded) trigrams holding it
+        if len(term) < 3:
+            postings = []
+            estimate = 0
+            for gram, found in self._postings.items():
+                if term in gram:
+                    estimate += len(found)
+                    if estimate > most:
+                        return None
+                    postings.append(found)
+            return set().union(*postings)
+
+        postings = []
+        for gram in trigrams(term):
+            found = self._postings.get(gram)
+            if not found:
+                return set()
+            postings.append(found)
+
+        postings.sort(key=len)
+        if len(postings[0]) > most:
+            return None
+        result = set(postings[0])
+        for found in postings[1:]:
+            result &= found
+            if not result:
+                break
+        return result
+
+    def search(self, term: str, limit: Optional[int] = None,
+               frame: Optional[pd.DataFrame] = None) -> List[Hashable]:
+        """
+        Find the rows containing a term in any indexed column
+
+        Args:
+            term: Text to look for (case-insensitive)
+            limit: Maximum number of rows to return
+            frame: Indexed table, scanned instead when the index can't narrow
+                   the search down (see candidates)
+
+        Returns:
+            Row labels, best matches first: exact, prefix, word start, then any
+            substring; ties go to the shorter matching text, then table order
+        """
+        term = normalize(term)
+        labels = self.candidates(term)
+        if labels is None:
+            if frame is not None:
+                return scan(frame, self.columns, term, limit)
+            labels = self._texts.keys()
+
+        texts = self._texts
+        ranked = []
+        for label in labels:
+            best = None
+            for text in texts[label]:
+                if term in text:
+                    rank = (-match_quality(text, term), len(text))
+                    if best is None or rank < best:
+                        best = rank
+            if best is not None:
+                ranked.append((best[0], best[1], label))
+
+        if limit is not None:
+            ranked = heapq.nsmallest(limit, ranked)
+        else:
+            ranked.sort()
+        return [label for _, _, label in ranked]
+
+    def fuzzy_search(self, term: str, limit: int = 10,
+                     min_score: float = FUZZY_MIN_SCORE) -> List[Tuple[Hashable, float]]:
+        """
+        Find the rows most similar to a possibly misspelled term
+
+        Rows are counted by how many of the term's trigrams they share using
+        the posting lists, and only the best of them are scored exactly (see
+        similarity), so the cost depends on the term rather than on pairwise
+        comparisons. Rows holding a short word one edit away from a word of
+        the term are scored too, since they may share no trigram with it
+
+        Args:
+            term: Text to look for (case-insensitive)
+            limit: Maximum number of rows to return
+            min_score: Lowest similarity to return
+
+        Returns:
+            (row label, similarity) pairs, most similar first
+        """
+        term = " ".join(normalize(term).split())
+        if not term:
+            return []
+        grams = padded_trigrams(term)
+
+        # Words inside a column are delimited by spaces rather than end markers
+        shared: Dict[Hashable, int] = {}
+        for gram in grams | trigrams(f" {term} "):
+            for label in self._postings.get(gram, ()):
+                shared[label] = shared.get(label, 0) + 1
+
+        count = limit * FUZZY_CANDIDATES_PER_RESULT
+        candidates = set(heapq.nlargest(count, shared, key=shared.get))
+        candidates.update(self._near_words(term, count))
+
+        scored = []
+        for label in candidates:
+            score = max(similarity(term, grams, text) for text in self._texts[label])
+            if score >= min_score:
+                scored.append((-score, label))
+
+        return [(label, -score) for score, label in heapq.nsmallest(limit, scored)]
+
+    def _near_words(self, term: str, count: int) -> List[Hashable]:
+        """
+        Get rows holding a short word at most one edit away from a word of a term
+        Found through the deletion neighbourhood, rarest words first
+
+        Args:
+            term: Normalized query
+            count: Maximum number of rows to return
+
+        Returns:
+            Row labels
+        """
+        words = set()
+        # A word one letter longer than the indexed ones can still be one deletion away
+        for query_word in short_words([term], SHORT_WORD_LENGTH + 1):
+            for variant in deletions(query_word):
+                for word in self._neighbours.get(variant, ()):
+                    if word not in words and edit_distance(query_word, word, 1) <= 1:
+                        words.add(word)
+
+        labels: List[Hashable] = []
+        for word in sorted(words, key=lambda word: len(self._words[word])):
+            labels.extend(self._words[word])
+            if len(labels) >= count:
+                return labels[:count]
+        return labels
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+
+def _benchmark(rows: int = 100_000) -> None:
+    """Compare index searches with the str.contains scan they replace"""
+    import random
+
+    random.seed(7)
+    syllables = ["ma", "ri", "a", "jo", "se", "ki", "m", "ha", "ru", "to", "yu", "na", "lo", "pe", "dela", "cruz"]
+
+    def word() -> str:
+        return "".join(random.choice(syllables) for _ in range(random.randint(2, 4))).capitalize()
+
+    # Regression check: a swapped letter leaves a short name with no trigram in common
+    sample = pd.DataFrame({"Registration_ID": ["REG0001"], "Name": ["Juan Dela Cruz"], "Email": ["juan@example.com"]})
+    matches = TrigramIndex(SEARCH_COLUMNS["students"]).build(sample).fuzzy_search("jaun")
+    assert [label for label, _ in matches] == [0], "transposed short name not found"
+
+    names = [f"{word()} {word()}" for _ in range(rows)]
+    df = pd.DataFrame({
+        "Registration_ID": [f"REG{i:04d}" for i in range(1, rows + 1)],
+        "Name": names,
+        "Email": [f"{name.replace(' ', '.').lower()}{i}@example.com" for i, name in enumerate(names)],
+    })
+
+    start = time.perf_counter()
+    index = TrigramIndex(SEARCH_COLUMNS["students"]).build(df)
+    print(f"Built index over {rows:,} rows in {(time.perf_counter() - start) * 1000:.0f} ms "
+          f"({len(index._postings):,} trigrams)")
+
+    def contains_scan(term: str) -> pd.DataFrame:
+        term = term.lower()
+        mask = (
+            df["Name"].str.lower().str.contains(term, na=False, regex=False) |
+            df["Email"].str.lower().str.contains(term, na=False, regex=False) |
+            df["Registration_ID"].str.lower().str.contains(term, na=False, regex=False)
+        )
+        return df[mask]
+
+    print(f"\n{'query':<22}{'matches':>9}{'scan ms':>10}{'search ms':>10}{'top 20 ms':>10}")
+    for term in ["jo", "zq", "maria", "dela cruz", "kiyu", "REG0420", "REG99999", "example.com", "zzz"]:
+        start = time.perf_counter()
+        expected = contains_scan(term)
+        scan_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        found = index.search(term, frame=df)
+        index_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        top = index.search(term, 20, frame=df)
+        top_ms = (time.perf_counter() - start) * 1000
+
+        assert set(found) == set(expected.index), term
+        assert found == scan(df, index.columns, term), term
+        assert top == found[:20], term
+        print(f"{term:<22}{len(found):>9,}{scan_ms:>10.1f}{index_ms:>10.1f}{top_ms:>10.1f}")
+
+    # Misspellings of names present in the table
+    targets = [names[7], names[420], names[rows // 2]]
+    swapped = targets[0].split()[0]
+    typos = [targets[0][:3] + targets[0][4:], targets[1].lower().replace("a", "e", 1), targets[2].split()[1][:-1] + "h",
+             swapped[0] + swapped[2] + swapped[1] + swapped[3:]]
+    texts = [tuple(normalize(value) for value in row) for row in df[list(index.columns)].itertuples(index=False)]
+
+    print(f"\n{'fuzzy query':<22}{'top match':<24}{'score':>7}{'brute ms':>10}{'index ms':>10}")
+    for typo in typos:
+        term = " ".join(normalize(typo).split())
+        grams = padded_trigrams(term)
+        start = time.perf_counter()
+        for row in texts[:rows // 10]:
+            max(similarity(term, grams, text) for text in row)
+        brute_ms = (time.perf_counter() - start) * 1000 * 10  # extrapolated from a tenth of the rows
+
+        start = time.perf_counter()
+        matches = index.fuzzy_search(typo, limit=5)
+        index_ms = (time.perf_counter() - start) * 1000
+
+        label, score = matches[0] if matches else (None, 0.0)
+        top = df.at[label, "Name"] if label is not None else "-"
+        print(f"{typo:<22}{top:<24}{score:>7.2f}{brute_ms:>10.0f}{index_ms:>10.1f}")
+
+    start = time.perf_counter()
+    for label in range(rows, rows + 1000):
+        index.add(label, {"Registration_ID": f"REG{label + 1}", "Name": "New Student", "Email": "new@example.com"})
+    print(f"\n1,000 incremental inserts: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    import sys
+
+    _benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,134 @@
+"""
+ID sequences for Vocabolarium
+Persistent, lock-protected counters handing out registration and tutor IDs
+in O(1), with block reservation for bulk imports
+"""
+
+import json
+import re
+from pathlib import Path
+import sys
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from utils.locking import FileLock, atomic_write
+
+
+# Sequence file kept beside the stored tables
+SEQUENCES_FILE = "sequences.json"
+
+# ID prefix and minimum number of digits of each table
+ID_FORMATS: Dict[str, Tuple[str, int]] = {
+    "students": ("REG", 4),
+    "tutors": ("TUT", 3),
+}
+
+
+def format_id(table: str, number: int) -> str:
+    """Format a sequence number as an ID (e.g. 12 -> REG0012)"""
+    prefix, width = ID_FORMATS[table]
+    return f"{prefix}{number:0{width}d}"
+
+
+def parse_id(table: str, value: object) -> Optional[int]:
+    """
+    Get the sequence number of an ID
+
+    Args:
+        table: Table the ID belongs to
+        value: ID such as REG0012
+
+    Returns:
+        Number, or None if the value is not an ID of this table
+    """
+    prefix, _ = ID_FORMATS[table]
+    match = re.fullmatch(rf"{prefix}(\d+)", str(value).strip())
+    return int(match.group(1)) if match else None
+
+
+def max_id_number(table: str, ids: Iterable) -> int:
+    """
+    Get the highest sequence number among existing IDs
+    Compares numbers, not strings, so REG10000 sorts after REG9999
+    """
+    numbers = [number for number in (parse_id(table, value) for value in ids) if number is not None]
+    return max(numbers, default=0)
+
+
+class SequenceStore:
+    """
+    Named counters stored in a small JSON file
+    Every allocation reads, increments and rewrites the file under a file lock,
+    so IDs stay unique across threads and processes
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize sequence store
+
+        Args:
+            path: JSON file holding the last allocated number of each sequence
+        """
+        self.path = Path(path)
+        self._lock = FileLock(self.path.with_suffix(".lock"))
+
+    def _read(self) -> Dict[str, int]:
+        """Read all counters"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return {name: int(value) for name, value in json.load(f).items()}
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, counters: Dict[str, int]) -> None:
+        """Atomically write all counters"""
+        def writer(path: Path) -> None:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(counters, f, indent=2, sort_keys=True)
+
+        atomic_write(self.path, writer)
+
+    def current(self, name: str) -> Optional[int]:
+        """Get the last allocated number of a sequence, or None if it was never used"""
+        return self._read().get(name)
+
+    def reserve(self, name: str, count: int = 1, seed: Optional[Callable[[], int]] = None) -> List[int]:
+        """
+        Allocate a block of consecutive numbers
+
+        Args:
+            name: Sequence name
+            count: Number of values to allocate
+            seed: Called once to get the starting point of a sequence not
+                  stored yet (e.g. the highest existing ID), defaults to 0
+
+        Returns:
+            Allocated numbers in ascending order
+        """
+        if count < 1:
+            return []
+
+        with self._lock:
+            counters = self._read()
+            last = counters.get(name)
+            if last is None:
+                last = seed() if seed is not None else 0
+            counters[name] = last + count
+            self._write(counters)
+
+        return list(range(last + 1, last + count + 1))
+
+    def next(self, name: str, seed: Optional[Callable[[], int]] = None) -> int:
+        """Allocate a single number"""
+        return self.reserve(name, 1, seed)[0]
+
+    def advance(self, name: str, value: int) -> None:
+        """
+        Move a sequence forward to at least a value
+        Used after importing rows carrying their own IDs; never moves backwards
+        """
+        with self._lock:
+            counters = self._read()
+            if counters.get(name, 0) < value:
+                counters[name] = value
+                self._write(counters)
@@ -0,0 +1,103 @@
+"""
+Columnar snapshots for Vocabolarium
+Parquet copies of the student and tutor tables used as the fast-load path
+instead of parsing workbooks, with column projection on read
+"""
+
+import os
+from pathlib import Path
+import sys
+from typing import List, Optional
+import logging
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from config.config import SNAPSHOTS_ENABLED
+
+# Parquet support is optional: without pyarrow every read falls back to the source
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def snapshots_enabled() -> bool:
+    """Check whether snapshots are enabled and pyarrow is installed"""
+    return SNAPSHOTS_ENABLED and PARQUET_AVAILABLE
+
+
+def is_fresh(snapshot: Path, source: Path) -> bool:
+    """
+    Check whether a snapshot is at least as new as its source file
+
+    Args:
+        snapshot: Snapshot file
+        source: File the snapshot was taken from
+
+    Returns:
+        True if the snapshot exists and is not older than the source
+    """
+    try:
+        return snapshot.stat().st_mtime_ns >= source.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def write_snapshot(df: pd.DataFrame, path: Path, numeric_columns: List[str]) -> bool:
+    """
+    Write a snapshot atomically
+
+    Args:
+        df: Table to snapshot
+        path: Snapshot file
+        numeric_columns: Columns stored as numbers, all others are stored as text
+
+    Returns:
+        True if the snapshot was written
+    """
+    if not snapshots_enabled():
+        return False
+
+    try:
+        df = df.copy()
+        for column in df.columns:
+            if column in numeric_columns:
+                df[column] = pd.to_numeric(df[column], errors="coerce")
+            else:
+                df[column] = df[column].where(df[column].notna(), "").astype(str)
+
+        tmp_path = path.with_name(path.name + ".tmp")
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+        return True
+
+    except Exception as e:
+        logger.warning(f"Could not write snapshot {path}: {str(e)}")
+        return False
+
+
+def read_snapshot(path: Path, columns: Optional[List[str]] = None) -> Optional[pd.DataFrame]:
+    """
+    Read a snapshot, loading only the requested columns
+
+    Args:
+        path: Snapshot file
+        columns: Optional subset of columns to load
+
+    Returns:
+        DataFrame, or None if the snapshot cannot be read
+    """
+    if not snapshots_enabled():
+        return None
+
+    try:
+        return pd.read_parquet(path, columns=columns)
+    except Exception as e:
+        logger.warning(f"Could not read snapshot {path}: {str(e)}")
+        return None
@@ -0,0 +1,186 @@
+"""
+Materialized statistics for Vocabolarium
+Row counts and value counts (status, language, payment) of the live rows,
+kept up to date from the change events of committed writes in O(1) per
+changed row and saved as JSON beside the tables, so dashboards read them
+without touching row data
+"""
+
+import copy
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+import sys
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from utils.events import Event, ADDED_EVENTS, DELETED_EVENTS, TABLE_REPLACED
+from utils.locking import atomic_write
+
+
+# Statistics file kept beside the stored tables
+STATISTICS_FILE = "statistics.json"
+
+# Columns whose value counts are maintained, per table
+COUNTED_COLUMNS: Dict[str, List[str]] = {
+    "students": ["Status", "Language", "Payment_Option"],
+    "tutors": ["Status"],
+}
+
+
+def add_count(counts: Dict[str, int], value, delta: int) -> None:
+    """Change the count of a value, dropping values no row has any more"""
+    value = "" if value is None else str(value)
+    count = counts.get(value, 0) + delta
+    if count > 0:
+        counts[value] = count
+    else:
+        counts.pop(value, None)
+
+
+class Statistics:
+    """
+    Materialized counts of each table
+    Layout: {table: {"signature", "total", "counts": {column: {value: count}},
+    "updated_at"}}. The counts of a table are valid for the storage signature
+    they record; counts that don't match the stored table (written by another
+    process, replaced, vacuumed) are recounted from the rows once.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Initialize statistics, reading the saved counts
+
+        Args:
+            path: JSON statistics file
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._tables: Dict[str, Dict] = self._read()
+        self._dirty = False
+
+    def _read(self) -> Dict[str, Dict]:
+        """Read the saved counts (empty if missing or unreadable)"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def save(self) -> None:
+        """Write the counts if they changed since the last save"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(self._tables, indent=2, ensure_ascii=False)
+            atomic_write(self.path, lambda tmp: tmp.write_text(data, encoding="utf-8"))
+            self._dirty = False
+
+    def get(self, table: str, signature: Tuple) -> Optional[Dict]:
+        """
+        Get the counts of a table if they match the stored table
+
+        Args:
+            table: Table name
+            signature: Current storage signature of the table
+
+        Returns:
+            Copy of the table's counts, or None if they must be recounted
+        """
+        with self._lock:
+            state = self._tables.get(table)
+            if state is None or state["signature"] != list(signature):
+                return None
+            return copy.deepcopy(state)
+
+    def rebuild(self, table: str, df: pd.DataFrame, signature: Tuple) -> Dict:
+        """
+        Recount a table from its live rows
+
+        Args:
+            table: Table name
+            df: Live rows of the table
+            signature: Storage signature the rows were loaded at
+
+        Returns:
+            Copy of the new counts
+        """
+        state = {
+            "signature": list(signature),
+            "total": len(df),
+            "counts": {
+                column: {
+                    str(value): int(count) for value, count in df[column].value_counts().items() if count > 0
+                }
+                for column in COUNTED_COLUMNS[table] if column in df.columns
+            },
+            "updated_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        with self._lock:
+            self._tables[table] = state
+            self._dirty = True
+            return copy.deepcopy(state)
+
+    def apply(self, events: List[Event], previous: Dict[str, Tuple], signatures: Dict[str, Tuple]) -> None:
+        """
+        Update the counts with the events of a committed write, in O(1) per event
+        Counts that can't be updated from an event (replaced table, unknown
+        previous values) or that weren't taken at the table as stored right
+        before the write (so miss writes of other processes) are dropped and
+        recounted on the next read
+
+        Args:
+            events: Change events of the write
+            previous: Table name -> storage signature right before the write
+            signatures: Table name -> storage signature after the write
+        """
+        with self._lock:
+            for table in {event.table for event in events}:
+                state = self._tables.get(table)
+                if state is not None and state["signature"] != list(previous.get(table, ())):
+                    del self._tables[table]
+                    self._dirty = True
+
+            for event in events:
+                state = self._tables.get(event.table)
+                if state is None:
+                    continue
+                if self._update(state, event):
+                    state["signature"] = list(signatures[event.table])
+                    state["updated_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                else:
+                    del self._tables[event.table]
+                self._dirty = True
+
+    @staticmethod
+    def _update(state: Dict, event: Event) -> bool:
+        """Apply an event to a table's counts; False if it can't be applied"""
+        counts = state["counts"]
+
+        if event.type == TABLE_REPLACED:
+            return False
+
+        if event.type in ADDED_EVENTS.values():
+            state["total"] += 1
+            for column, values in counts.items():
+                add_count(values, event.after.get(column), 1)
+            return True
+
+        if event.type in DELETED_EVENTS.values():
+            if event.before is None:
+                return False
+            state["total"] -= 1
+            for column, values in counts.items():
+                add_count(values, event.before.get(column), -1)
+            return True
+
+        changed = [column for column in counts if column in (event.after or {})]
+        if changed and event.before is None:
+            return False
+        for column in changed:
+            add_count(counts[column], event.before.get(column), -1)
+            add_count(counts[column], event.after[column], 1)
+        return True
@@ -0,0 +1,1214 @@
+"""
+Storage backends for Vocabolarium
+Defines the storage interface used by DatabaseManager together with an
+embedded SQLite engine and the legacy Excel workbook store
+"""
+
+import shutil
+import sqlite3
+import threading
+from contextlib import closing, contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+import sys
+from typing import Dict, List, Optional, Tuple, Any, Iterator
+import logging
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from config.config import (
+    STUDENTS_DB, TUTORS_DB, SQLITE_DB, DATABASE_BACKEND,
+    STUDENTS_COLUMNS, TUTORS_COLUMNS, JOURNAL_COMPACT_BYTES, JOURNAL_COMPACT_SECONDS,
+    TOMBSTONE_RETENTION_SECONDS
+)
+from utils.journal import WriteJournal, replay
+from utils.snapshot import is_fresh, read_snapshot, write_snapshot, snapshots_enabled
+from utils.locking import FileLock, atomic_write
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Primary key column of each table
+TABLE_KEYS: Dict[str, str] = {
+    "students": "Registration_ID",
+    "tutors": "Tutor_ID",
+}
+
+# Column layout of each table when it is first created
+TABLE_COLUMNS: Dict[str, List[str]] = {
+    "students": STUDENTS_COLUMNS,
+    "tutors": TUTORS_COLUMNS,
+}
+
+# Workbook used by each table for Excel storage and import/export
+TABLE_WORKBOOKS: Dict[str, Path] = {
+    "students": STUDENTS_DB,
+    "tutors": TUTORS_DB,
+}
+
+# Non-text columns, every other column is stored as TEXT
+COLUMN_TYPES: Dict[str, str] = {
+    "Age": "INTEGER",
+    "Experience_Years": "INTEGER",
+    "Rating": "REAL",
+    "Row_Version": "INTEGER",
+}
+
+# Per-row version, incremented by every update (optimistic concurrency)
+VERSION_COLUMN = "Row_Version"
+
+# Deletion time of soft-deleted rows (tombstones), empty for live rows
+DELETED_COLUMN = "Deleted_At"
+
+# Secondary indexes created on the SQLite tables
+TABLE_INDEXES: Dict[str, List[str]] = {
+    "students": ["Email", "Status", "Language", "Assigned_Tutor"],
+    "tutors": ["Email COLLATE NOCASE", "Name", "Status"],
+}
+
+
+def _is_missing(value: Any) -> bool:
+    """Check whether a cell value is empty (None, NaN or NA)"""
+    try:
+        return value is None or bool(pd.isna(value))
+    except (TypeError, ValueError):
+        return False
+
+
+def to_python_value(column: str, value: Any) -> Any:
+    """
+    Convert a cell value to a plain Python value for storage
+
+    Args:
+        column: Column the value belongs to
+        value: Raw value (may be a numpy scalar, NaN or Timestamp)
+
+    Returns:
+        int/float/str value, or None for empty numeric cells
+    """
+    if _is_missing(value):
+        return None if column in COLUMN_TYPES else ""
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, pd.Timestamp):
+        value = value.strftime("%Y-%m-%d %H:%M:%S")
+    if column not in COLUMN_TYPES and not isinstance(value, str):
+        value = str(value)
+    return value
+
+
+def clean_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Replace empty text cells with empty strings
+
+    Args:
+        df: DataFrame read from a workbook
+
+    Returns:
+        DataFrame with text columns free of NaN
+    """
+    text_columns = [col for col in df.columns if col not in COLUMN_TYPES]
+    if text_columns:
+        df[text_columns] = df[text_columns].astype(object).where(df[text_columns].notna(), "")
+    return df
+
+
+def deleted_mask(df: pd.DataFrame) -> pd.Series:
+    """Flag the soft-deleted rows (tombstones) of a table"""
+    if DELETED_COLUMN not in df.columns:
+        return pd.Series(False, index=df.index)
+    return df[DELETED_COLUMN].fillna("").astype(str) != ""
+
+
+def live_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """Drop the soft-deleted rows (tombstones) of a table"""
+    deleted = deleted_mask(df)
+    return df[~deleted] if deleted.any() else df
+
+
+def expired_mask(df: pd.DataFrame, before: str) -> pd.Series:
+    """Flag the tombstones deleted at or before a time ("YYYY-MM-DD HH:MM:SS")"""
+    deleted = deleted_mask(df)
+    if not deleted.any():
+        return deleted
+    return deleted & (df[DELETED_COLUMN].fillna("").astype(str) <= before)
+
+
+def tombstone_cutoff(retention_seconds: float = TOMBSTONE_RETENTION_SECONDS) -> str:
+    """Get the deletion time up to which tombstones are past their retention"""
+    return (datetime.now() - timedelta(seconds=retention_seconds)).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def is_multi_value(value: Any) -> bool:
+    """Check whether a filter value is a collection of allowed values"""
+    return isinstance(value, (list, tuple, set, frozenset))
+
+
+def filter_frame(df: pd.DataFrame, filters: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+    """
+    Keep the rows matching equality filters
+
+    Args:
+        df: Table rows
+        filters: Column -> required value, or collection of allowed values
+
+    Returns:
+        DataFrame with the matching rows
+    """
+    for column, value in (filters or {}).items():
+        if is_multi_value(value):
+            df = df[df[column].isin(list(value))]
+        else:
+            df = df[df[column] == value]
+    return df
+
+
+def apply_query(df: pd.DataFrame, filters: Optional[Dict[str, Any]] = None,
+                columns: Optional[List[str]] = None, order_by: Optional[str] = None,
+                descending: bool = False, limit: Optional[int] = None, offset: int = 0) -> pd.DataFrame:
+    """
+    Filter, sort, page and project a loaded table
+
+    Args:
+        df: Table rows
+        filters: Column -> required value, or collection of allowed values
+        columns: Columns to return (default: all columns)
+        order_by: Column to sort by (default: storage order)
+        descending: Sort in descending order
+        limit: Maximum number of rows to return
+        offset: Number of matching rows to skip
+
+    Returns:
+        DataFrame with the matching rows
+    """
+    df = filter_frame(df, filters)
+    if order_by is not None:
+        # Categoricals sort by their values like storage does, not by category order
+        df = df.sort_values(order_by, ascending=not descending, kind="stable",
+                            key=lambda col: col.astype(str) if isinstance(col.dtype, pd.CategoricalDtype) else col)
+    if offset or limit is not None:
+        df = df.iloc[offset:None if limit is None else offset + limit]
+    return df[columns] if columns is not None else df
+
+
+def _keyset_parts(df: pd.DataFrame, order_by: str, key_column: str) -> List[pd.Series]:
+    """
+    Get the sort key of a keyset ordering as separate columns
+    Keys are compared by length first so REG10000 sorts after REG9999, and
+    break ties between rows with the same order_by value
+    """
+    keys = df[key_column].astype(str)
+    parts = [keys.str.len(), keys]
+    if order_by != key_column:
+        parts.insert(0, df[order_by].astype(str))
+    return parts
+
+
+def _keyset_bound(cursor: Tuple[Any, Any], order_by: str, key_column: str) -> List[Any]:
+    """Get the sort key of the row a cursor points at"""
+    value, key = cursor
+    bound = [len(str(key)), str(key)]
+    if order_by != key_column:
+        bound.insert(0, str(value))
+    return bound
+
+
+def apply_seek(df: pd.DataFrame, key_column: str, order_by: str, after: Optional[Tuple[Any, Any]] = None,
+               limit: int = 25, descending: bool = False, filters: Optional[Dict[str, Any]] = None,
+               columns: Optional[List[str]] = None) -> Tuple[pd.DataFrame, Optional[Tuple[Any, Any]]]:
+    """
+    Get one keyset page of a loaded table
+
+    Args:
+        df: Table rows
+        key_column: Primary key column, used to break ties
+        order_by: Column the pages are ordered by
+        after: Cursor returned with the previous page (None for the first page)
+        limit: Rows per page
+        descending: Page in descending order
+        filters: Column -> required value, or collection of allowed values
+        columns: Columns to return (default: all columns)
+
+    Returns:
+        Tuple of (page rows, cursor of the next page or None after the last page)
+    """
+    df = filter_frame(df, filters)
+    parts = _keyset_parts(df, order_by, key_column)
+
+    if after is not None:
+        beyond = pd.Series(False, index=df.index)
+        tied = pd.Series(True, index=df.index)
+        for part, bound in zip(parts, _keyset_bound(after, order_by, key_column)):
+            beyond |= tied & ((part < bound) if descending else (part > bound))
+            tied &= part == bound
+        df = df[beyond]
+        parts = [part[beyond] for part in parts]
+
+    order = pd.DataFrame({i: part for i, part in enumerate(parts)}, index=df.index)
+    order = order.sort_values(list(order.columns), ascending=not descending).index
+
+    # One row past the page tells whether a next page exists
+    page = df.loc[order[:limit]]
+    cursor = None
+    if len(order) > limit:
+        cursor = (page[order_by].iloc[-1], page[key_column].iloc[-1])
+    return (page[columns] if columns is not None else page), cursor
+
+
+def _quote(identifier: str) -> str:
+    """Quote an SQL identifier"""
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+class StorageBackend:
+    """
+    Interface between DatabaseManager and the physical data store
+    Tables are addressed by name ("students", "tutors") and rows by the
+    table's primary key from TABLE_KEYS
+    """
+
+    name = "base"
+
+    def table_exists(self, table: str) -> bool:
+        """Check whether a table has been created"""
+        raise NotImplementedError
+
+    def create_table(self, table: str, columns: List[str]) -> None:
+        """Create an empty table with the given columns"""
+        raise NotImplementedError
+
+    def columns(self, table: str) -> List[str]:
+        """Get the column names of a table"""
+        raise NotImplementedError
+
+    def add_column(self, table: str, column: str, default: Any = "") -> None:
+        """Add a column to an existing table, filling existing rows with default"""
+        self.add_columns(table, {column: default})
+
+    def add_columns(self, table: str, columns: Dict[str, Any]) -> None:
+        """
+        Add several columns to an existing table in one write
+
+        Args:
+            table: Table name
+            columns: New column -> default value filled into existing rows
+        """
+        raise NotImplementedError
+
+    def load(self, table: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Load a table
+
+        Args:
+            table: Table name
+            columns: Optional subset of columns to load
+
+        Returns:
+            DataFrame with the table rows
+        """
+        raise NotImplementedError
+
+    def query(self, table: str, filters: Optional[Dict[str, Any]] = None,
+              columns: Optional[List[str]] = None, order_by: Optional[str] = None,
+              descending: bool = False, limit: Optional[int] = None, offset: int = 0) -> pd.DataFrame:
+        """
+        Load the rows matching equality filters, loading only the needed columns
+
+        Args:
+            table: Table name
+            filters: Column -> required value, or collection of allowed values
+            columns: Columns to return (default: all columns)
+            order_by: Column to sort by (default: storage order)
+            descending: Sort in descending order
+            limit: Maximum number of rows to return
+            offset: Number of matching rows to skip
+
+        Returns:
+            DataFrame with the matching rows
+        """
+        filters = filters or {}
+        df = self.load(table, self._needed_columns(columns, filters, order_by))
+        return apply_query(df, filters, columns, order_by, descending, limit, offset)
+
+    def count(self, table: str, filters: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Count the rows matching equality filters
+
+        Args:
+            table: Table name
+            filters: Column -> required value, or collection of allowed values
+
+        Returns:
+            Number of matching rows
+        """
+        return len(self.query(table, filters, columns=[TABLE_KEYS[table]]))
+
+    def seek(self, table: str, order_by: str, after: Optional[Tuple[Any, Any]] = None, limit: int = 25,
+             descending: bool = False, filters: Optional[Dict[str, Any]] = None,
+             columns: Optional[List[str]] = None) -> Tuple[pd.DataFrame, Optional[Tuple[Any, Any]]]:
+        """
+        Load one keyset page: the rows ordered after a cursor
+
+        Unlike offset paging the cost does not grow with the page number, and
+        rows added or removed meanwhile never shift later pages
+
+        Args:
+            table: Table name
+            order_by: Column the pages are ordered by (ties broken by primary key)
+            after: Cursor returned with the previous page (None for the first page)
+            limit: Rows per page
+            descending: Page in descending order
+            filters: Column -> required value, or collection of allowed values
+            columns: Columns to return (default: all columns)
+
+        Returns:
+            Tuple of (page rows, cursor of the next page or None after the last page)
+        """
+        filters = filters or {}
+        key_column = TABLE_KEYS[table]
+        df = self.load(table, self._needed_columns(columns, filters, order_by, key_column))
+        return apply_seek(df, key_column, order_by, after, limit, descending, filters, columns)
+
+    @staticmethod
+    def _needed_columns(columns: Optional[List[str]], filters: Dict[str, Any], *extra: Optional[str]) -> Optional[List[str]]:
+        """Get the columns to load to answer a query (None for all columns)"""
+        if columns is None:
+            return None
+        return list(dict.fromkeys([*columns, *filters, *(col for col in extra if col)]))
+
+    def find(self, table: str, column: str, value: Any, case_insensitive: bool = False) -> pd.DataFrame:
+        """
+        Find rows where a column equals a value
+
+        Args:
+            table: Table name
+            column: Column to match
+            value: Value to look for
+            case_insensitive: Compare text case-insensitively
+
+        Returns:
+            DataFrame with the matching rows
+        """
+        df = self.load(table)
+        if case_insensitive:
+            return df[df[column].astype(str).str.lower() == str(value).lower()]
+        return df[df[column] == value]
+
+    def insert(self, table: str, records: List[Dict]) -> None:
+        """Append new rows to a table"""
+        raise NotImplementedError
+
+    def update(self, table: str, key: str, changes: Dict) -> bool:
+        """
+        Update a single row
+
+        Args:
+            table: Table name
+            key: Primary key of the row
+            changes: Column -> new value (unknown columns are ignored)
+
+        Returns:
+            True if the row exists and was updated
+        """
+        raise NotImplementedError
+
+    def update_many(self, table: str, changes: Dict[str, Dict]) -> Dict[str, bool]:
+        """
+        Update several rows in one write
+
+        Args:
+            table: Table name
+            changes: Primary key -> {column: new value}
+
+        Returns:
+            Primary key -> True if the row exists and was updated
+        """
+        return {key: self.update(table, key, row_changes) for key, row_changes in changes.items()}
+
+    def delete(self, table: str, key: str) -> bool:
+        """
+        Delete a single row
+
+        Args:
+            table: Table name
+            key: Primary key of the row
+
+        Returns:
+            True if the row existed and was deleted
+        """
+        raise NotImplementedError
+
+    def replace(self, table: str, df: pd.DataFrame) -> None:
+        """Replace the whole content of a table"""
+        raise NotImplementedError
+
+    def purge_deleted(self, table: str, before: str) -> int:
+        """
+        Physically remove tombstones (soft-deleted rows) in one write
+
+        Args:
+            table: Table name
+            before: Remove rows deleted at or before this time ("YYYY-MM-DD HH:MM:SS")
+
+        Returns:
+            Number of removed rows
+        """
+        raise NotImplementedError
+
+    def signature(self, table: str) -> Tuple:
+        """
+        Get a cheap fingerprint of the stored table
+        The fingerprint changes whenever the table is written
+        """
+        raise NotImplementedError
+
+    def cache_key(self, table: str) -> Tuple:
+        """Get a key identifying the stored table across backend instances"""
+        raise NotImplementedError
+
+    def lock(self, table: str) -> FileLock:
+        """
+        Get the cross-process write lock of a table
+        Writers hold it around read-modify-write cycles; readers never take it
+        """
+        raise NotImplementedError
+
+    def data_path(self, name: str) -> Path:
+        """Get the path of an auxiliary data file kept beside the stored tables"""
+        raise NotImplementedError
+
+    def backup_files(self, directory: Path) -> List[Path]:
+        """
+        Copy every stored file into a directory, consistently with concurrent writers
+
+        Args:
+            directory: Existing directory receiving the copies
+
+        Returns:
+            Copied files, named as in storage
+        """
+        raise NotImplementedError
+
+    def restore_files(self, directory: Path) -> None:
+        """
+        Put stored files back in place (e.g. restored from a backup)
+
+        Args:
+            directory: Directory holding files named as returned by backup_files
+        """
+        raise NotImplementedError
+
+    def snapshot(self, table: str) -> Optional[Path]:
+        """
+        Get an up-to-date columnar snapshot of a table
+
+        Args:
+            table: Table name
+
+        Returns:
+            Path to a Parquet snapshot of the current content, or None if
+            snapshots are unavailable
+        """
+        return None
+
+    def export_excel(self, table: str, path: Path) -> int:
+        """
+        Export a table to an Excel workbook
+
+        Args:
+            table: Table name
+            path: Destination workbook
+
+        Returns:
+            Number of exported rows
+        """
+        df = self.load(table)
+        df.to_excel(path, index=False, engine='openpyxl')
+        return len(df)
+
+    def import_excel(self, table: str, path: Path) -> int:
+        """
+        Import rows from an Excel workbook, replacing the table content
+
+        Args:
+            table: Table name
+            path: Source workbook
+
+        Returns:
+            Number of imported rows
+        """
+        df = clean_frame(pd.read_excel(path, engine='openpyxl'))
+        for column in self.columns(table):
+            if column not in df.columns:
+                df[column] = None if column in COLUMN_TYPES else ""
+        self.replace(table, df[self.columns(table)])
+        return len(df)
+
+
+class SQLiteBackend(StorageBackend):
+    """
+    Embedded SQLite storage
+    Each table is an indexed SQLite table mirroring STUDENTS_COLUMNS/TUTORS_COLUMNS
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: Path = SQLITE_DB):
+        """Initialize SQLite backend for the given database file"""
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS table_versions (table_name TEXT PRIMARY KEY, version INTEGER NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection that commits on success and always closes"""
+        with closing(sqlite3.connect(str(self.path), timeout=30)) as conn:
+            with conn:
+                yield conn
+
+    @staticmethod
+    def _bump_version(conn: sqlite3.Connection, table: str) -> None:
+        """Increment the write counter of a table inside the current transaction"""
+        conn.execute(
+            "INSERT INTO table_versions (table_name, version) VALUES (?, 1) "
+            "ON CONFLICT(table_name) DO UPDATE SET version = version + 1",
+            (table,),
+        )
+
+    def table_exists(self, table: str) -> bool:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+            ).fetchone()
+        return row is not None
+
+    def create_table(self, table: str, columns: List[str]) -> None:
+        key = TABLE_KEYS[table]
+        column_defs = []
+        for column in columns:
+            definition = f"{_quote(column)} {COLUMN_TYPES.get(column, 'TEXT')}"
+            if column == key:
+                definition += " PRIMARY KEY"
+            column_defs.append(definition)
+
+        with self._connect() as conn:
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {_quote(table)} ({', '.join(column_defs)})")
+            for index in TABLE_INDEXES.get(table, []):
+                column = index.split()[0]
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS {_quote(f'idx_{table}_{column.lower()}')} "
+                    f"ON {_quote(table)} ({_quote(column)}{index[len(column):]})"
+                )
+            self._bump_version(conn, table)
+
+    def columns(self, table: str) -> List[str]:
+        with self._connect() as conn:
+            rows = conn.execute(f"PRAGMA table_info({_quote(table)})").fetchall()
+        return [row[1] for row in rows]
+
+    def add_columns(self, table: str, columns: Dict[str, Any]) -> None:
+        if not columns:
+            return
+        with self._connect() as conn:
+            for column in columns:
+                conn.execute(
+                    f"ALTER TABLE {_quote(table)} ADD COLUMN {_quote(column)} "
+                    f"{COLUMN_TYPES.get(column, 'TEXT')}"
+                )
+            assignments = ", ".join(f"{_quote(column)} = ?" for column in columns)
+            conn.execute(f"UPDATE {_quote(table)} SET {assignments}",
+                         [to_python_value(column, default) for column, default in columns.items()])
+            self._bump_version(conn, table)
+
+    def _select_list(self, table: str, columns: Optional[List[str]]) -> str:
+        """Build a validated SELECT column list"""
+        if columns is None:
+            return "*"
+        known = set(self.columns(table))
+        unknown = [col for col in columns if col not in known]
+        if unknown:
+            raise KeyError(f"Unknown columns for {table}: {unknown}")
+        return ", ".join(_quote(col) for col in columns)
+
+    def load(self, table: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        select = self._select_list(table, columns)
+        with self._connect() as conn:
+            return pd.read_sql_query(f"SELECT {select} FROM {_quote(table)} ORDER BY rowid", conn)
+
+    def _where(self, table: str, filters: Dict[str, Any], *extra: Optional[str]) -> Tuple[List[str], List[Any]]:
+        """
+        Build the WHERE conditions of equality filters
+
+        Returns:
+            Tuple of (conditions to AND together, parameters)
+        """
+        known = set(self.columns(table))
+        unknown = [col for col in [*filters, *(col for col in extra if col)] if col not in known]
+        if unknown:
+            raise KeyError(f"Unknown columns for {table}: {unknown}")
+
+        conditions, params = [], []
+        for column, value in filters.items():
+            if is_multi_value(value):
+                values = list(value)
+                if not values:
+                    conditions.append("0")
+                    continue
+                conditions.append(f"{_quote(column)} IN ({', '.join('?' * len(values))})")
+                params.extend(to_python_value(column, item) for item in values)
+            else:
+                conditions.append(f"{_quote(column)} = ?")
+                params.append(to_python_value(column, value))
+        return conditions, params
+
+    def query(self, table: str, filters: Optional[Dict[str, Any]] = None,
+              columns: Optional[List[str]] = None, order_by: Optional[str] = None,
+              descending: bool = False, limit: Optional[int] = None, offset: int = 0) -> pd.DataFrame:
+        conditions, params = self._where(table, filters or {}, order_by)
+
+        sql = f"SELECT {self._select_list(table, columns)} FROM {_quote(table)}"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        if order_by is not None:
+            sql += f" ORDER BY {_quote(order_by)} {'DESC' if descending else 'ASC'}, rowid"
+        else:
+            sql += " ORDER BY rowid"
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([-1 if limit is None else int(limit), int(offset)])
+
+        with self._connect() as conn:
+            return pd.read_sql_query(sql, conn, params=params)
+
+    def count(self, table: str, filters: Optional[Dict[str, Any]] = None) -> int:
+        conditions, params = self._where(table, filters or {})
+        sql = f"SELECT COUNT(*) FROM {_quote(table)}"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        with self._connect() as conn:
+            return conn.execute(sql, params).fetchone()[0]
+
+    def seek(self, table: str, order_by: str, after: Optional[Tuple[Any, Any]] = None, limit: int = 25,
+             descending: bool = False, filters: Optional[Dict[str, Any]] = None,
+             columns: Optional[List[str]] = None) -> Tuple[pd.DataFrame, Optional[Tuple[Any, Any]]]:
+        key_column = TABLE_KEYS[table]
+        conditions, params = self._where(table, filters or {}, order_by)
+
+        # Same sort key as apply_seek: (order_by, length(key), key)
+        parts = [f"length({_quote(key_column)})", _quote(key_column)]
+        if order_by != key_column:
+            parts.insert(0, f"CAST({_quote(order_by)} AS TEXT)")
+        direction = "DESC" if descending else "ASC"
+        if after is not None:
+            bound = _keyset_bound(after, order_by, key_column)
+            conditions.append(
+                f"({', '.join(parts)}) {'<' if descending else '>'} ({', '.join('?' * len(bound))})"
+            )
+            params.extend(bound)
+
+        selected = None if columns is None else list(dict.fromkeys([*columns, order_by, key_column]))
+        sql = f"SELECT {self._select_list(table, selected)} FROM {_quote(table)}"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY " + ", ".join(f"{part} {direction}" for part in parts) + " LIMIT ?"
+        # One row past the page tells whether a next page exists
+        params.append(int(limit) + 1)
+
+        with self._connect() as conn:
+            page = pd.read_sql_query(sql, conn, params=params)
+
+        cursor = None
+        if len(page) > limit:
+            page = page.iloc[:limit]
+            cursor = (page[order_by].iloc[-1], page[key_column].iloc[-1])
+        return (page[columns] if columns is not None else page), cursor
+
+    def find(self, table: str, column: str, value: Any, case_insensitive: bool = False) -> pd.DataFrame:
+        if column not in self.columns(table):
+            raise KeyError(f"Unknown column for {table}: {column}")
+        collate = " COLLATE NOCASE" if case_insensitive else ""
+        with self._connect() as conn:
+            return pd.read_sql_query(
+                f"SELECT * FROM {_quote(table)} WHERE {_quote(column)} = ?{collate} ORDER BY rowid",
+                conn,
+                params=(to_python_value(column, value),),
+            )
+
+    def insert(self, table: str, records: List[Dict]) -> None:
+        if not records:
+            return
+        columns = self.columns(table)
+        placeholders = ", ".join("?" for _ in columns)
+        rows = [
+            tuple(to_python_value(col, record.get(col)) for col in columns)
+            for record in records
+        ]
+        with self._connect() as conn:
+            conn.executemany(
+                f"INSERT INTO {_quote(table)} ({', '.join(_quote(c) for c in columns)}) "
+                f"VALUES ({placeholders})",
+                rows,
+            )
+            self._bump_version(conn, table)
+
+    def update(self, table: str, key: str, changes: Dict) -> bool:
+        known = set(self.columns(table))
+        changes = {col: value for col, value in changes.items() if col in known}
+        key_column = TABLE_KEYS[table]
+
+        with self._connect() as conn:
+            if not changes:
+                row = conn.execute(
+                    f"SELECT 1 FROM {_quote(table)} WHERE {_quote(key_column)} = ?", (key,)
+                ).fetchone()
+                return row is not None
+
+            assignments = ", ".join(f"{_quote(col)} = ?" for col in changes)
+            params = [to_python_value(col, value) for col, value in changes.items()]
+            cursor = conn.execute(
+                f"UPDATE {_quote(table)} SET {assignments} WHERE {_quote(key_column)} = ?",
+                (*params, key),
+            )
+            if cursor.rowcount > 0:
+                self._bump_version(conn, table)
+            return cursor.rowcount > 0
+
+    def update_many(self, table: str, changes: Dict[str, Dict]) -> Dict[str, bool]:
+        known = set(self.columns(table))
+        key_column = TABLE_KEYS[table]
+        found: Dict[str, bool] = {}
+
+        with self._connect() as conn:
+            existing = set()
+            keys = list(changes)
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = conn.execute(
+                    f"SELECT {_quote(key_column)} FROM {_quote(table)} "
+                    f"WHERE {_quote(key_column)} IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ).fetchall()
+                existing.update(row[0] for row in rows)
+
+            # Rows changing the same columns share one prepared statement
+            groups: Dict[Tuple[str, ...], List[Tuple]] = {}
+            for key, row_changes in changes.items():
+                found[key] = key in existing
+                row_changes = {col: value for col, value in row_changes.items() if col in known}
+                if found[key] and row_changes:
+                    columns = tuple(row_changes)
+                    params = tuple(to_python_value(col, row_changes[col]) for col in columns)
+                    groups.setdefault(columns, []).append((*params, key))
+
+            for columns, rows in groups.items():
+                assignments = ", ".join(f"{_quote(col)} = ?" for col in columns)
+                conn.executemany(
+                    f"UPDATE {_quote(table)} SET {assignments} WHERE {_quote(key_column)} = ?", rows
+                )
+            if groups:
+                self._bump_version(conn, table)
+
+        return found
+
+    def delete(self, table: str, key: str) -> bool:
+        key_column = TABLE_KEYS[table]
+        with self._connect() as conn:
+            cursor = conn.execute(
+                f"DELETE FROM {_quote(table)} WHERE {_quote(key_column)} = ?", (key,)
+            )
+            if cursor.rowcount > 0:
+                self._bump_version(conn, table)
+            return cursor.rowcount > 0
+
+    def replace(self, table: str, df: pd.DataFrame) -> None:
+        columns = self.columns(table)
+        records = df.reindex(columns=columns).to_dict("records")
+        rows = [tuple(to_python_value(col, record.get(col)) for col in columns) for record in records]
+        with self._connect() as conn:
+            conn.execute(f"DELETE FROM {_quote(table)}")
+            conn.executemany(
+                f"INSERT INTO {_quote(table)} ({', '.join(_quote(c) for c in columns)}) "
+                f"VALUES ({', '.join('?' for _ in columns)})",
+                rows,
+            )
+            self._bump_version(conn, table)
+
+    def purge_deleted(self, table: str, before: str) -> int:
+        if DELETED_COLUMN not in self.columns(table):
+            return 0
+        with self._connect() as conn:
+            cursor = conn.execute(
+                f"DELETE FROM {_quote(table)} WHERE {_quote(DELETED_COLUMN)} != '' "
+                f"AND {_quote(DELETED_COLUMN)} <= ?",
+                (before,),
+            )
+            if cursor.rowcount > 0:
+                self._bump_version(conn, table)
+            return cursor.rowcount
+
+    def signature(self, table: str) -> Tuple:
+        # Per-table write counter, so writing one table keeps the other cached;
+        # the inode catches the database file being replaced (e.g. a restore)
+        try:
+            inode = self.path.stat().st_ino
+        except FileNotFoundError:
+            return (0, 0)
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT version FROM table_versions WHERE table_name = ?", (table,)
+            ).fetchone()
+        return (inode, row[0] if row else 0)
+
+    def cache_key(self, table: str) -> Tuple:
+        return (self.name, str(self.path.resolve()), table)
+
+    def lock(self, table: str) -> FileLock:
+        return FileLock(self.path.with_name(f"{self.path.stem}.{table}.lock"))
+
+    def data_path(self, name: str) -> Path:
+        return self.path.with_name(name)
+
+    def backup_files(self, directory: Path) -> List[Path]:
+        # The online backup API copies a consistent state while writers keep going
+        target = Path(directory) / self.path.name
+        with closing(sqlite3.connect(str(self.path), timeout=30)) as source:
+            with closing(sqlite3.connect(str(target))) as copy:
+                source.backup(copy)
+        return [target]
+
+    def restore_files(self, directory: Path) -> None:
+        source = Path(directory) / self.path.name
+        with self.lock("students"), self.lock("tutors"):
+            atomic_write(self.path, lambda path: shutil.copyfile(source, path))
+
+    def snapshot(self, table: str) -> Optional[Path]:
+        if not snapshots_enabled():
+            return None
+        path = self.path.with_name(f"{table}.parquet")
+        if is_fresh(path, self.path):
+            return path
+        df = self.load(table)
+        return path if write_snapshot(df, path, list(COLUMN_TYPES)) else None
+
+
+class ExcelBackend(StorageBackend):
+    """
+    Legacy Excel workbook storage
+    Each table lives in its own workbook (students.xlsx, tutors.xlsx).
+    Row writes are appended to a journal next to the workbook and folded
+    into it by a background compaction once the journal gets too large or old
+    """
+
+    name = "excel"
+
+    def __init__(self, workbooks: Optional[Dict[str, Path]] = None):
+        """Initialize Excel backend with the workbook used by each table"""
+        self.workbooks = dict(workbooks or TABLE_WORKBOOKS)
+        self.journals = {
+            table: WriteJournal(path.with_name(f"{path.stem}.journal.jsonl"))
+            for table, path in self.workbooks.items()
+        }
+        self._base: Dict[str, Tuple[Tuple, pd.DataFrame]] = {}
+        self._keys: Dict[str, Tuple[Tuple, int, set]] = {}
+        self._compacting = set()
+        self._compact_lock = threading.Lock()
+
+    def _workbook_signature(self, table: str) -> Tuple:
+        """Get mtime/size of the workbook alone"""
+        try:
+            stat = self.workbooks[table].stat()
+            return (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            return (0, 0)
+
+    def _snapshot_path(self, table: str) -> Path:
+        """Get the Parquet snapshot written beside a workbook"""
+        return self.workbooks[table].with_suffix(".parquet")
+
+    def _load_base(self, table: str) -> pd.DataFrame:
+        """
+        Load the workbook content, reusing the last parse while the file is unchanged
+        A fresh Parquet snapshot is read instead of parsing the workbook
+        """
+        signature = self._workbook_signature(table)
+        cached = self._base.get(table)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        df = None
+        if is_fresh(self._snapshot_path(table), self.workbooks[table]):
+            df = read_snapshot(self._snapshot_path(table))
+        if df is None:
+            df = pd.read_excel(self.workbooks[table], engine='openpyxl')
+            write_snapshot(df, self._snapshot_path(table), list(COLUMN_TYPES))
+
+        df = clean_frame(df)
+        self._base[table] = (signature, df)
+        return df
+
+    def _existing_keys(self, table: str) -> set:
+        """
+        Get the primary keys stored in a table (call with the table lock held)
+        The set is kept per workbook version and only reads the journal
+        entries appended since the last call, so a write's existence check
+        doesn't replay the table
+        """
+        workbook = self._workbook_signature(table)
+        cached = self._keys.get(table)
+        if cached is not None and cached[0] == workbook and self.journals[table].size() >= cached[1]:
+            _, start, keys = cached
+        else:
+            start, keys = 0, set(self._load_base(table)[TABLE_KEYS[table]].tolist())
+
+        entries, offset = self.journals[table].read(start)
+        for entry in entries:
+            if entry["op"] == "insert":
+                keys.add(entry["key"])
+            elif entry["op"] == "delete":
+                keys.discard(entry["key"])
+        self._keys[table] = (workbook, offset, keys)
+        return keys
+
+    def _write_workbook(self, table: str, df: pd.DataFrame) -> None:
+        """Atomically write a table to its workbook and refresh its snapshot"""
+        atomic_write(self.workbooks[table], lambda path: df.to_excel(path, index=False, engine='openpyxl'))
+        write_snapshot(df, self._snapshot_path(table), list(COLUMN_TYPES))
+
+    def table_exists(self, table: str) -> bool:
+        return self.workbooks[table].exists()
+
+    def lock(self, table: str) -> FileLock:
+        path = self.workbooks[table]
+        return FileLock(path.with_name(f"{path.stem}.lock"))
+
+    def data_path(self, name: str) -> Path:
+        return self.workbooks["students"].with_name(name)
+
+    def _stored_files(self, table: str) -> List[Path]:
+        """Get the workbook and journal of a table"""
+        return [self.workbooks[table], self.journals[table].path]
+
+    def backup_files(self, directory: Path) -> List[Path]:
+        copied = []
+        for table in self.workbooks:
+            with self.lock(table):
+                for path in self._stored_files(table):
+                    if path.exists():
+                        copied.append(Path(shutil.copy2(path, Path(directory) / path.name)))
+        return copied
+
+    def restore_files(self, directory: Path) -> None:
+        for table in self.workbooks:
+            with self.lock(table):
+                for path in self._stored_files(table):
+                    source = Path(directory) / path.name
+                    if source.exists():
+                        atomic_write(path, lambda tmp, source=source: shutil.copyfile(source, tmp))
+                    else:
+                        path.unlink(missing_ok=True)
+                self._base.pop(table, None)
+                self._keys.pop(table, None)
+
+    def create_table(self, table: str, columns: List[str]) -> None:
+        with self.lock(table):
+            self._write_workbook(table, pd.DataFrame(columns=columns))
+
+    def columns(self, table: str) -> List[str]:
+        return list(self._load_base(table).columns)
+
+    def add_columns(self, table: str, columns: Dict[str, Any]) -> None:
+        if not columns:
+            return
+        with self.lock(table):
+            df = self.load(table)
+            for column, default in columns.items():
+                df[column] = default
+            self.replace(table, df)
+
+    def load(self, table: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        entries, _ = self.journals[table].read()
+
+        # Projected reads with nothing journaled come straight from the snapshot
+        if columns is not None and not entries and table not in self._base:
+            if is_fresh(self._snapshot_path(table), self.workbooks[table]):
+                df = read_snapshot(self._snapshot_path(table), columns)
+                if df is not None:
+                    return clean_frame(df)
+
+        df = replay(self._load_base(table), entries, TABLE_KEYS[table])
+        return df[columns] if columns is not None else df
+
+    def insert(self, table: str, records: List[Dict]) -> None:
+        if not records:
+            return
+        columns = self.columns(table)
+        key_column = TABLE_KEYS[table]
+        with self.lock(table):
+            self.journals[table].append([
+                {
+                    "op": "insert",
+                    "key": record.get(key_column),
+                    "row": {col: to_python_value(col, record.get(col)) for col in columns},
+                }
+                for record in records
+            ])
+        self._maybe_compact(table)
+
+    def update(self, table: str, key: str, changes: Dict) -> bool:
+        with self.lock(table):
+            if key not in self._existing_keys(table):
+                return False
+
+            columns = self.columns(table)
+            changes = {col: to_python_value(col, value) for col, value in changes.items() if col in columns}
+            if changes:
+                self.journals[table].append([{"op": "update", "key": key, "changes": changes}])
+        self._maybe_compact(table)
+        return True
+
+    def update_many(self, table: str, changes: Dict[str, Dict]) -> Dict[str, bool]:
+        with self.lock(table):
+            existing = self._existing_keys(table)
+            columns = set(self.columns(table))
+
+            found: Dict[str, bool] = {}
+            entries = []
+            for key, row_changes in changes.items():
+                found[key] = key in existing
+                row_changes = {
+                    col: to_python_value(col, value) for col, value in row_changes.items() if col in columns
+                }
+                if found[key] and row_changes:
+                    entries.append({"op": "update", "key": key, "changes": row_changes})
+            self.journals[table].append(entries)
+        self._maybe_compact(table)
+        return found
+
+    def delete(self, table: str, key: str) -> bool:
+        with self.lock(table):
+            if key not in self._existing_keys(table):
+                return False
+
+            self.journals[table].append([{"op": "delete", "key": key}])
+        self._maybe_compact(table)
+        return True
+
+    def replace(self, table: str, df: pd.DataFrame) -> None:
+        with self.lock(table):
+            _, offset = self.journals[table].read()
+            self._write_workbook(table, df)
+            self.journals[table].truncate(offset)
+
+    def purge_deleted(self, table: str, before: str) -> int:
+        with self.lock(table):
+            df = self.load(table)
+            expired = expired_mask(df, before)
+            if expired.any():
+                self.replace(table, df[~expired])
+        return int(expired.sum())
+
+    def _maybe_compact(self, table: str) -> None:
+        """Start a background compaction when the journal passes a size or age threshold"""
+        journal = self.journals[table]
+        oldest = journal.oldest_timestamp()
+        too_big = journal.size() >= JOURNAL_COMPACT_BYTES
+        too_old = oldest is not None and (datetime.now() - oldest).total_seconds() >= JOURNAL_COMPACT_SECONDS
+
+        if not (too_big or too_old):
+            return
+
+        with self._compact_lock:
+            if table in self._compacting:
+                return
+            self._compacting.add(table)
+
+        threading.Thread(target=self._compact_in_background, args=(table,), daemon=True).start()
+
+    def _compact_in_background(self, table: str) -> None:
+        """Run compact() and clear the in-progress flag"""
+        try:
+            self.compact(table)
+        except Exception as e:
+            logger.error(f"Error compacting {table} journal: {str(e)}")
+        finally:
+            with self._compact_lock:
+                self._compacting.discard(table)
+
+    def compact(self, table: str) -> int:
+        """
+        Fold journal entries into the workbook
+
+        Entries appended while the workbook is being written stay in the
+        journal for the next compaction. Tombstones past their retention are
+        dropped from the rewritten workbook.
+
+        Args:
+            table: Table name
+
+        Returns:
+            Number of journal entries folded into the workbook
+        """
+        with self.lock(table):
+            entries, offset = self.journals[table].read()
+            if not entries:
+                return 0
+            df = replay(self._load_base(table), entries, TABLE_KEYS[table])
+            df = df[~expired_mask(df, tombstone_cutoff())]
+            self._write_workbook(table, df)
+            self.journals[table].truncate(offset)
+
+        logger.info(f"Compacted {len(entries)} journal entries into {self.workbooks[table]}")
+        return len(entries)
+
+    def signature(self, table: str) -> Tuple:
+        return self._workbook_signature(table) + (self.journals[table].size(),)
+
+    def cache_key(self, table: str) -> Tuple:
+        return (self.name, str(self.workbooks[table].resolve()), table)
+
+    def snapshot(self, table: str) -> Optional[Path]:
+        if not snapshots_enabled():
+            return None
+        self.compact(table)
+        if not is_fresh(self._snapshot_path(table), self.workbooks[table]):
+            self._base.pop(table, None)
+            self._load_base(table)
+        return self._snapshot_path(table) if is_fresh(self._snapshot_path(table), self.workbooks[table]) else None
+
+    def export_excel(self, table: str, path: Path) -> int:
+        if Path(path).resolve() == self.workbooks[table].resolve():
+            self.compact(table)
+            return len(self._load_base(table))
+        df = self.load(table)
+        df.to_excel(path, index=False, engine='openpyxl')
+        return len(df)
+
+
+# Available storage backends by configuration name
+BACKENDS = {
+    SQLiteBackend.name: SQLiteBackend,
+    ExcelBackend.name: ExcelBackend,
+}
+
+
+def create_backend(name: str = DATABASE_BACKEND) -> StorageBackend:
+    """
+    Create the storage backend selected in configuration
+
+    Args:
+        name: Backend name ("sqlite" or "excel")
+
+    Returns:
+        StorageBackend instance
+    """
+    try:
+        backend_class = BACKENDS[name.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown database backend '{name}'. Choose one of: {', '.join(BACKENDS)}")
+    return backend_class()